@@ -0,0 +1,82 @@
+"""Initial schema, as created by Base.metadata.create_all
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('username', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_users_id', 'users', ['id'])
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
+
+    op.create_table(
+        'movies',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('tmdb_id', sa.Integer(), nullable=True),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('overview', sa.Text(), nullable=True),
+        sa.Column('release_date', sa.String(), nullable=True),
+        sa.Column('poster_path', sa.String(), nullable=True),
+        sa.Column('backdrop_path', sa.String(), nullable=True),
+        sa.Column('vote_average', sa.Float(), nullable=True),
+        sa.Column('vote_count', sa.Integer(), nullable=True),
+        sa.Column('popularity', sa.Float(), nullable=True),
+        sa.Column('genres', sa.String(), nullable=True),
+        sa.Column('runtime', sa.Integer(), nullable=True),
+        sa.Column('original_language', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_movies_id', 'movies', ['id'])
+    op.create_index('ix_movies_tmdb_id', 'movies', ['tmdb_id'], unique=True)
+    op.create_index('ix_movies_title', 'movies', ['title'])
+
+    op.create_table(
+        'likes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'user_id', 'movie_id', name='unique_user_movie_like'
+        ),
+    )
+    op.create_index('ix_likes_id', 'likes', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_likes_id', table_name='likes')
+    op.drop_table('likes')
+    op.drop_index('ix_movies_title', table_name='movies')
+    op.drop_index('ix_movies_tmdb_id', table_name='movies')
+    op.drop_index('ix_movies_id', table_name='movies')
+    op.drop_table('movies')
+    op.drop_index('ix_users_username', table_name='users')
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_table('users')
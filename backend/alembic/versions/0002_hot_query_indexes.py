@@ -0,0 +1,36 @@
+"""Indexes for the hot query patterns
+
+- likes(user_id, created_at): a user's likes, newest first
+- likes(movie_id): like counts per movie for the popularity ranking
+- movies(created_at, id): the default movie listing
+- movies(popularity): search results ordering
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_likes_user_id_created_at', 'likes', ['user_id', 'created_at']
+    )
+    op.create_index('ix_likes_movie_id', 'likes', ['movie_id'])
+    op.create_index(
+        'ix_movies_created_at_id', 'movies', ['created_at', 'id']
+    )
+    op.create_index('ix_movies_popularity', 'movies', ['popularity'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_movies_popularity', table_name='movies')
+    op.drop_index('ix_movies_created_at_id', table_name='movies')
+    op.drop_index('ix_likes_movie_id', table_name='likes')
+    op.drop_index('ix_likes_user_id_created_at', table_name='likes')
@@ -0,0 +1,39 @@
+"""Administrator flag on users
+
+Replaces the ADMIN_USERNAMES setting, which trusted self-registered
+usernames; grant it with scripts/grant_admin.py.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tables created by create_all from the models (by an earlier
+    # scripts/generate_dataset.py) and stamped 0001 already have it; such
+    # databases were left at 0002
+    columns = sa.inspect(op.get_bind()).get_columns('users')
+    if any(column['name'] == 'is_admin' for column in columns):
+        return
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.add_column(sa.Column(
+            'is_admin',
+            sa.Boolean(),
+            server_default=sa.false(),
+            nullable=False,
+        ))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('is_admin')
@@ -0,0 +1 @@
+"""Performance benchmarks. Run from the backend directory with python -m."""
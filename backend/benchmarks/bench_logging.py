@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the logging overhead paid by requests.
+
+Each simulated request logs --events-per-request structlog events with
+a few fields, from --threads threads at once, through these pipelines:
+
+- legacy:      JSON rendered by the logging thread and written through
+               rich's RichHandler (the production setup before the log
+               queue)
+- json:        JSON lines, written by the logging thread
+- json+queue:  JSON lines, written by the writer thread (production)
+- rich:        rich console rendering, written by the logging thread
+- rich+queue:  rich console rendering, written by the writer thread
+
+All but legacy are built by configure_logging().
+
+For each pipeline it reports the time requests spend logging (mean and
+percentiles per request) and how long the writer thread then needs to
+drain its queue.
+
+Usage:
+    python -m benchmarks.bench_logging
+        [--requests 5000] [--events-per-request 3] [--threads 4]
+        [--pipelines legacy json json+queue rich rich+queue]
+        [--log-file /dev/null] [--json]
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from typing import Dict, List, TextIO
+
+import structlog
+from rich.console import Console
+from rich.logging import RichHandler
+
+from src.infrastructure.config.logging import (
+    add_query_stats,
+    configure_logging,
+    stop_logging
+)
+from src.infrastructure.config.settings import settings
+
+# name -> (log_format, log_queue_enabled) of configure_logging()
+PIPELINES = {
+    "legacy": None,
+    "json": ("json", False),
+    "json+queue": ("json", True),
+    "rich": ("console", False),
+    "rich+queue": ("console", True),
+}
+# The rich pipelines take much longer; run them on request
+DEFAULT_PIPELINES = ["legacy", "json", "json+queue"]
+
+
+def configure_legacy_logging(stream: TextIO) -> None:
+    """The production logging setup before the log queue."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        datefmt="[%X]",
+        handlers=[
+            RichHandler(
+                console=Console(file=stream),
+                rich_tracebacks=True,
+                show_path=False,
+                show_time=True,
+            )
+        ],
+        force=True,
+    )
+    structlog.configure(
+        processors=[
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso"),
+            add_query_stats,
+            structlog.processors.JSONRenderer(),
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    index = min(int(len(ordered) * fraction), len(ordered) - 1)
+    return ordered[index]
+
+
+def simulate_requests(
+    requests: int,
+    events_per_request: int,
+    threads: int,
+) -> List[float]:
+    logger = structlog.get_logger("benchmarks.bench_logging")
+    timings: List[float] = []
+    lock = threading.Lock()
+
+    def worker(count: int) -> None:
+        local = []
+        for request in range(count):
+            start = time.perf_counter()
+            for event in range(events_per_request):
+                logger.info(
+                    "request_event",
+                    request=request,
+                    event_index=event,
+                    route="/api/v1/recommendations/",
+                    user_id=request % 500,
+                    duration_ms=12.5,
+                )
+            local.append(time.perf_counter() - start)
+        with lock:
+            timings.extend(local)
+
+    workers = [
+        threading.Thread(target=worker, args=(requests // threads,))
+        for _ in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return timings
+
+
+def bench_pipeline(
+    name: str,
+    requests: int,
+    events_per_request: int,
+    threads: int,
+    log_file: str,
+) -> Dict[str, float]:
+    settings.log_level = "INFO"
+    # Large enough that no record is dropped
+    settings.log_queue_max_size = requests * events_per_request + 1
+
+    with open(log_file, "w") as stream:
+        if PIPELINES[name] is None:
+            configure_legacy_logging(stream)
+        else:
+            settings.log_format, settings.log_queue_enabled = (
+                PIPELINES[name]
+            )
+            configure_logging(stream=stream)
+        start = time.perf_counter()
+        timings = simulate_requests(requests, events_per_request, threads)
+        logged = time.perf_counter() - start
+        stop_logging()
+        drained = time.perf_counter() - start
+
+    ordered = sorted(timing * 1_000_000 for timing in timings)
+    return {
+        "pipeline": name,
+        "requests": len(ordered),
+        "mean_us": statistics.fmean(ordered),
+        "p50_us": percentile(ordered, 0.50),
+        "p99_us": percentile(ordered, 0.99),
+        "logging_s": logged,
+        "drain_ms": (drained - logged) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--events-per-request", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--log-file",
+        default=os.devnull,
+        help="Where the logs are written",
+    )
+    parser.add_argument(
+        "--pipelines",
+        nargs="+",
+        choices=list(PIPELINES),
+        default=DEFAULT_PIPELINES,
+    )
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    results = [
+        bench_pipeline(
+            name,
+            args.requests,
+            args.events_per_request,
+            args.threads,
+            args.log_file,
+        )
+        for name in args.pipelines
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{args.events_per_request} events per request, "
+        f"{args.threads} threads"
+    )
+    print(
+        f"{'pipeline':<12} {'mean us':>9} {'p50 us':>9} {'p99 us':>9} "
+        f"{'drain ms':>9}"
+    )
+    for result in results:
+        print(
+            f"{result['pipeline']:<12} {result['mean_us']:>9.1f} "
+            f"{result['p50_us']:>9.1f} {result['p99_us']:>9.1f} "
+            f"{result['drain_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
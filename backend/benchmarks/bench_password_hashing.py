@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Load benchmark of login throughput against hashing pool size.
+
+Drives LoginUserUseCase from a thread pool the size of the server's
+request threadpool and reports successful logins per second and
+backpressure rejections for each number of hashing processes.
+`--workers 0` measures inline hashing in the request threads.
+
+Usage:
+    python -m benchmarks.bench_password_hashing [--workers 0 1 2 4]
+        [--concurrency 40] [--requests 200] [--max-queue 32]
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from src.application.dtos.user_dto import UserLoginDTO
+from src.application.use_cases.auth.login_use_case import LoginUserUseCase
+from src.domain.entities.user import User
+from src.infrastructure.external.password_hasher_pool import (
+    PasswordHasherPool
+)
+from src.infrastructure.external.password_hashing_worker import (
+    hash_password
+)
+from src.infrastructure.external.security_service_impl import (
+    SecurityServiceImpl
+)
+from src.shared.exceptions.auth_exceptions import (
+    PasswordHashingBusyException
+)
+
+PASSWORD = "benchmark-password"
+
+
+class StaticUserRepository:
+    """Returns the same user for every lookup, so only hashing is timed."""
+
+    def __init__(self, user: User):
+        self.user = user
+
+    def get_by_username_or_email(self, username_or_email: str) -> User:
+        return self.user
+
+
+def run(
+    workers: int,
+    concurrency: int,
+    requests: int,
+    max_queue: int,
+    hashed_password: str,
+) -> Dict[str, float]:
+    pool = PasswordHasherPool(max_workers=workers, max_queue=max_queue)
+    pool.start()
+    use_case = LoginUserUseCase(
+        StaticUserRepository(
+            User(
+                id=1,
+                email="bench@example.com",
+                username="bench",
+                hashed_password=hashed_password,
+            )
+        ),
+        SecurityServiceImpl(hasher_pool=pool),
+    )
+    login_data = UserLoginDTO(username="bench", password=PASSWORD)
+
+    def login() -> bool:
+        try:
+            use_case.execute(login_data)
+            return True
+        except PasswordHashingBusyException:
+            return False
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as clients:
+            start = time.perf_counter()
+            outcomes = list(
+                clients.map(lambda _: login(), range(requests))
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    succeeded = sum(outcomes)
+    return {
+        "workers": workers,
+        "succeeded": succeeded,
+        "rejected": requests - succeeded,
+        "elapsed_s": elapsed,
+        "logins_per_s": succeeded / elapsed,
+    }
+
+
+def main() -> None:
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({0, 1, max(cores // 2, 1), cores}),
+    )
+    parser.add_argument("--concurrency", type=int, default=40)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--max-queue", type=int, default=32)
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    hashed_password = hash_password(PASSWORD)
+    results: List[Dict[str, float]] = [
+        run(
+            workers,
+            args.concurrency,
+            args.requests,
+            args.max_queue,
+            hashed_password,
+        )
+        for workers in args.workers
+    ]
+
+    if args.json:
+        print(json.dumps({"cores": cores, "results": results}, indent=2))
+        return
+
+    print(
+        f"{args.requests} logins from {args.concurrency} threads, "
+        f"{cores} cores, queue depth {args.max_queue}"
+    )
+    for result in results:
+        label = result["workers"] or "inline"
+        print(
+            f"  workers {label:>6}  {result['logins_per_s']:8.1f} logins/s  "
+            f"ok {result['succeeded']:4d}  429 {result['rejected']:4d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the recommendation strategies on generated datasets.
+
+For each dataset size (users x movies) a synthetic dataset is generated
+with scripts/generate_dataset.py into an in-memory SQLite database, and
+every strategy built by RecommendationStrategyFactory is measured for:
+
+- model build time and peak traced memory of the build (warm_up)
+- latency percentiles of recommend() for a sample of users with likes
+- peak traced memory while serving those requests
+
+Results can be written as JSON (--output) and compared with a previous
+report (--baseline); the exit status is 1 when a metric regressed by
+more than --threshold.
+
+Usage:
+    python -m benchmarks.bench_recommendations
+        [--sizes 500x1000 2000x4000] [--requests 50] [--seed 42]
+        [--output report.json] [--baseline previous.json] [--threshold 0.2]
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from scripts.generate_dataset import Dataset, generate_dataset, write_database
+from src.domain.entities.user import User
+from src.domain.value_objects.recommendation import RecommendationAlgorithm
+from src.infrastructure.external.factories\
+    .recommendation_strategy_factory import RecommendationStrategyFactory
+from src.infrastructure.external.recommendation_engine import (
+    RecommendationEngine
+)
+
+# Metrics compared against a baseline; all of them are lower-is-better
+COMPARED_METRICS = ("build_ms", "build_peak_mb", "p50_ms", "p95_ms")
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    users, _, movies = value.lower().partition("x")
+    try:
+        return int(users), int(movies)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Expected USERSxMOVIES, got {value!r}"
+        )
+
+
+def load_dataset(dataset: Dataset) -> Callable[[], Session]:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    write_database(engine, dataset)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    index = min(int(len(ordered) * fraction), len(ordered) - 1)
+    return ordered[index]
+
+
+def traced_peak_mb(func: Callable[[], None]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def bench_strategy(
+    algorithm: RecommendationAlgorithm,
+    session_factory: Callable[[], Session],
+    users: List[User],
+) -> Dict[str, float]:
+    engine = RecommendationEngine(session_factory=session_factory)
+    db = session_factory()
+    try:
+        strategy = RecommendationStrategyFactory(
+            db, engine=engine
+        ).create_strategy(algorithm)
+
+        # Build time without tracing overhead, then peak memory of a
+        # second, traced build
+        start = time.perf_counter()
+        strategy.warm_up()
+        build_ms = (time.perf_counter() - start) * 1000
+        engine.clear()
+        build_peak_mb = traced_peak_mb(strategy.warm_up)
+
+        timings = []
+        for user in users:
+            start = time.perf_counter()
+            strategy.recommend(user, limit=20, page=1)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        request_peak_mb = traced_peak_mb(
+            lambda: [
+                strategy.recommend(user, limit=20, page=1)
+                for user in users[:10]
+            ]
+        )
+    finally:
+        db.close()
+
+    ordered = sorted(timings)
+    return {
+        "build_ms": build_ms,
+        "build_peak_mb": build_peak_mb,
+        "requests": len(timings),
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "p99_ms": percentile(ordered, 0.99),
+        "request_peak_mb": request_peak_mb,
+    }
+
+
+def run(
+    sizes: List[Tuple[int, int]],
+    requests: int,
+    seed: int,
+    likes_per_user: float,
+) -> List[Dict]:
+    # Strategies import these lazily; keep import time out of build time
+    import pandas  # noqa: F401
+    import sklearn.feature_extraction.text  # noqa: F401
+    import sklearn.metrics.pairwise  # noqa: F401
+
+    results = []
+    for user_count, movie_count in sizes:
+        dataset = generate_dataset(
+            users=user_count,
+            movies=movie_count,
+            likes_per_user=likes_per_user,
+            seed=seed,
+            hashed_password="benchmark",
+        )
+        session_factory = load_dataset(dataset)
+
+        # Users with likes; the others only exercise the fallback
+        active_ids = sorted({user + 1 for user, _ in dataset.likes})
+        sample = random.Random(seed).sample(
+            active_ids, min(requests, len(active_ids))
+        )
+        users = [
+            User(
+                id=user_id,
+                email=f"user{user_id}@example.com",
+                username=f"user{user_id}",
+                hashed_password="benchmark",
+            )
+            for user_id in sample
+        ]
+
+        for algorithm in RecommendationAlgorithm:
+            result = bench_strategy(algorithm, session_factory, users)
+            results.append({
+                "strategy": algorithm.value,
+                "users": user_count,
+                "movies": movie_count,
+                "likes": len(dataset.likes),
+                **result,
+            })
+    return results
+
+
+def environment() -> Dict[str, Optional[str]]:
+    import numpy
+    import sklearn
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "scikit_learn": sklearn.__version__,
+        "machine": platform.machine(),
+    }
+
+
+def compare(
+    results: List[Dict],
+    baseline: List[Dict],
+    threshold: float,
+) -> List[str]:
+    """Metrics that got worse than the baseline by more than threshold."""
+    def key(result: Dict) -> Tuple:
+        return result["strategy"], result["users"], result["movies"]
+
+    previous = {key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(key(result))
+        if before is None:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > threshold:
+                strategy, users, movies = key(result)
+                regressions.append(
+                    f"{strategy} {users}x{movies} {metric}: "
+                    f"{old:.2f} -> {new:.2f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sizes",
+        type=parse_size,
+        nargs="+",
+        default=[(500, 1000), (2000, 4000)],
+        help="Dataset sizes as USERSxMOVIES",
+    )
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--likes-per-user", type=float, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="JSON report to compare with")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    report = {
+        "environment": environment(),
+        "parameters": {
+            "requests": args.requests,
+            "likes_per_user": args.likes_per_user,
+            "seed": args.seed,
+        },
+        "results": run(
+            args.sizes, args.requests, args.seed, args.likes_per_user
+        ),
+    }
+
+    if args.output:
+        with open(args.output, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"{'strategy':<14} {'size':>11} {'likes':>7} {'build ms':>9} "
+            f"{'build MB':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'req MB':>7}"
+        )
+        for result in report["results"]:
+            size = f"{result['users']}x{result['movies']}"
+            print(
+                f"{result['strategy']:<14} {size:>11} {result['likes']:>7} "
+                f"{result['build_ms']:>9.1f} {result['build_peak_mb']:>9.1f} "
+                f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+                f"{result['p99_ms']:>8.2f} {result['request_peak_mb']:>7.1f}"
+            )
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(report["results"], baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
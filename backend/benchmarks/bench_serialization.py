@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of list response serialization.
+
+Compares FastAPI's default path for a route with response_model
+(re-validation + jsonable_encoder + json.dumps) against rendering the
+DTO directly with PydanticJSONResponse.
+
+Usage:
+    python -m benchmarks.bench_serialization [--per-page 100] [--rounds 200]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.application.dtos.movie_dto import (
+    MovieListResponseDTO,
+    MovieResponseDTO
+)
+from src.infrastructure.api.responses import PydanticJSONResponse
+
+
+def build_page(per_page: int) -> MovieListResponseDTO:
+    now = datetime.now(timezone.utc)
+    movies = [
+        MovieResponseDTO(
+            id=movie_id,
+            title=f"Movie {movie_id}",
+            overview="A long overview of the movie plot. " * 12,
+            release_date="1999-03-31",
+            poster_path=f"/posters/{movie_id}.jpg",
+            backdrop_path=f"/backdrops/{movie_id}.jpg",
+            vote_average=7.5,
+            vote_count=1200,
+            popularity=55.3,
+            genres=["Action", "Sci-Fi", "Thriller"],
+            runtime=136,
+            original_language="en",
+            tmdb_id=1000 + movie_id,
+            year="1999",
+            created_at=now,
+            updated_at=now,
+            is_liked=movie_id % 3 == 0,
+        )
+        for movie_id in range(1, per_page + 1)
+    ]
+    return MovieListResponseDTO(
+        movies=movies,
+        total=10_000,
+        page=1,
+        total_pages=10_000 // per_page,
+        per_page=per_page,
+    )
+
+
+RESPONSE_FIELD = create_response_field(
+    name="Response_get_movies", type_=MovieListResponseDTO
+)
+EVENT_LOOP = asyncio.new_event_loop()
+
+
+def default_fastapi_path(page: MovieListResponseDTO) -> bytes:
+    content = EVENT_LOOP.run_until_complete(
+        serialize_response(field=RESPONSE_FIELD, response_content=page)
+    )
+    return JSONResponse(content).body
+
+
+def pydantic_path(page: MovieListResponseDTO) -> bytes:
+    return PydanticJSONResponse(page).body
+
+
+def measure(
+    func: Callable[[MovieListResponseDTO], bytes],
+    page: MovieListResponseDTO,
+    rounds: int,
+) -> List[float]:
+    func(page)  # warm-up
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(page)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings)
+    return {
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p95_ms": ordered[int(len(ordered) * 0.95) - 1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    page = build_page(args.per_page)
+    assert json.loads(default_fastapi_path(page)) == json.loads(
+        pydantic_path(page)
+    ), "Both paths must produce the same document"
+
+    results = {
+        "default_fastapi": summarize(
+            measure(default_fastapi_path, page, args.rounds)
+        ),
+        "pydantic_json_response": summarize(
+            measure(pydantic_path, page, args.rounds)
+        ),
+    }
+    results["speedup"] = (
+        results["default_fastapi"]["mean_ms"]
+        / results["pydantic_json_response"]["mean_ms"]
+    )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Serializing {args.per_page}-movie pages, {args.rounds} rounds")
+    for name in ("default_fastapi", "pydantic_json_response"):
+        stats = results[name]
+        print(
+            f"  {name:<24} mean {stats['mean_ms']:7.3f} ms  "
+            f"p50 {stats['p50_ms']:7.3f} ms  p95 {stats['p95_ms']:7.3f} ms"
+        )
+    print(f"  speedup                  {results['speedup']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
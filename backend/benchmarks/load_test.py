@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+End-to-end HTTP load test of a running API.
+
+Virtual users run sessions against the server: each session registers
+a new account (--register-ratio) or logs in as one of the users in
+--users-csv, then performs a random number of actions with think time
+between them, following SCENARIO: paging through /movies, searching,
+toggling likes on movies it has seen and requesting recommendations.
+Like a browser, each virtual user revalidates pages it already fetched
+with If-None-Match.
+
+The report gives overall throughput and, per endpoint, request counts,
+error rates, status codes, latency percentiles and a latency histogram.
+
+Start the server with rate limiting disabled, since all the traffic
+comes from one address, e.g. with a generated dataset:
+
+    python scripts/generate_dataset.py --users 2000 --movies 4000 \\
+        --csv-dir /tmp/dataset
+    python scripts/generate_dataset.py --users 2000 --movies 4000 \\
+        --truncate
+    RATE_LIMIT_ENABLED=false python run_production.py --workers 4
+
+Usage:
+    python -m benchmarks.load_test [--base-url http://localhost:8000]
+        [--concurrency 50] [--duration 60] [--ramp-up 10]
+        [--users-csv /tmp/dataset/users.csv] [--register-ratio 0.05]
+        [--think-time 0.5] [--output report.json]
+"""
+import argparse
+import asyncio
+import csv
+import json
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from src.domain.value_objects.recommendation import RecommendationAlgorithm
+from src.infrastructure.config.settings import settings
+
+# Relative weights of the actions within a session
+SCENARIO = {
+    "movies": 45,
+    "movies_search": 10,
+    "like_toggle": 15,
+    "recommendations": 30,
+}
+
+SEARCH_TERMS = [
+    "love", "night", "war", "man", "world", "dark", "king", "life",
+    "city", "last", "story", "day", "girl", "dead", "star",
+]
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS_MS = [
+    5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf")
+]
+
+
+@dataclass
+class EndpointStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+    def record(self, latency_ms: float, status: str, error: bool) -> None:
+        self.latencies_ms.append(latency_ms)
+        self.statuses[status] += 1
+        if error:
+            self.errors += 1
+
+    def summary(self, elapsed: float) -> Dict:
+        ordered = sorted(self.latencies_ms)
+        count = len(ordered)
+
+        def percentile(fraction: float) -> float:
+            return ordered[min(int(count * fraction), count - 1)]
+
+        histogram = Counter()
+        for latency in ordered:
+            bound = next(b for b in HISTOGRAM_BUCKETS_MS if latency <= b)
+            histogram[bound] += 1
+
+        return {
+            "requests": count,
+            "throughput_rps": count / elapsed,
+            "errors": self.errors,
+            "error_rate": self.errors / count,
+            "statuses": dict(self.statuses),
+            "mean_ms": statistics.fmean(ordered),
+            "p50_ms": percentile(0.50),
+            "p90_ms": percentile(0.90),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": ordered[-1],
+            "histogram_ms": {
+                ("inf" if bound == float("inf") else str(bound)):
+                    histogram[bound]
+                for bound in HISTOGRAM_BUCKETS_MS
+            },
+        }
+
+
+class LoadTest:
+    def __init__(
+        self,
+        base_url: str,
+        concurrency: int,
+        duration: float,
+        ramp_up: float,
+        credentials: List[Tuple[str, str]],
+        register_ratio: float,
+        session_actions: int,
+        think_time: float,
+        timeout: float,
+        seed: int,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api = settings.api_v1_str
+        self.concurrency = concurrency
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.credentials = credentials
+        self.register_ratio = register_ratio if credentials else 1.0
+        self.session_actions = session_actions
+        self.think_time = think_time
+        self.timeout = timeout
+        self.seed = seed
+        self.stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        self.deadline = 0.0
+        # Keeps usernames unique across runs against the same database
+        self._run_id = int(time.time())
+        self._registered = 0
+
+    async def run(self) -> Dict:
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
+        async with httpx.AsyncClient(
+            base_url=self.base_url, limits=limits, timeout=self.timeout
+        ) as client:
+            start = time.perf_counter()
+            self.deadline = start + self.duration
+            await asyncio.gather(*[
+                self._virtual_user(client, index)
+                for index in range(self.concurrency)
+            ])
+            elapsed = time.perf_counter() - start
+
+        endpoints = {
+            name: stats.summary(elapsed)
+            for name, stats in sorted(self.stats.items())
+        }
+        total = sum(e["requests"] for e in endpoints.values())
+        errors = sum(e["errors"] for e in endpoints.values())
+        return {
+            "elapsed_s": elapsed,
+            "requests": total,
+            "throughput_rps": total / elapsed,
+            "errors": errors,
+            "error_rate": errors / total if total else 0.0,
+            "endpoints": endpoints,
+        }
+
+    async def _virtual_user(self, client: httpx.AsyncClient, index: int):
+        rng = random.Random(self.seed * 100003 + index)
+        # Spread session starts over the ramp-up period
+        await asyncio.sleep(self.ramp_up * index / self.concurrency)
+
+        while not self._expired():
+            headers = await self._start_session(client, rng)
+            if headers is None:
+                await self._think(rng)
+                continue
+
+            etags: Dict[str, str] = {}
+            movie_ids: List[int] = []
+            # Geometric session length with the configured mean
+            actions = 1 + int(rng.expovariate(1 / self.session_actions))
+            for _ in range(actions):
+                if self._expired():
+                    break
+                await self._think(rng)
+                action = rng.choices(
+                    list(SCENARIO), weights=list(SCENARIO.values())
+                )[0]
+                if action == "like_toggle" and not movie_ids:
+                    action = "movies"
+                await self._perform(
+                    client, rng, action, headers, etags, movie_ids
+                )
+
+    async def _start_session(
+        self,
+        client: httpx.AsyncClient,
+        rng: random.Random,
+    ) -> Optional[Dict[str, str]]:
+        if rng.random() < self.register_ratio:
+            self._registered += 1
+            username = f"load_{self._run_id}_{self._registered}"
+            password = "load-test-password"
+            response = await self._request(
+                client,
+                "register",
+                "POST",
+                f"{self.api}/auth/register",
+                json={
+                    "email": f"{username}@example.com",
+                    "username": username,
+                    "password": password,
+                },
+            )
+            if response is None or response.status_code != 201:
+                return None
+        else:
+            username, password = rng.choice(self.credentials)
+
+        response = await self._request(
+            client,
+            "login",
+            "POST",
+            f"{self.api}/auth/login-json",
+            json={"username": username, "password": password},
+        )
+        if response is None or response.status_code != 200:
+            return None
+        token = response.json()["access_token"]
+        return {"Authorization": f"Bearer {token}"}
+
+    async def _perform(
+        self,
+        client: httpx.AsyncClient,
+        rng: random.Random,
+        action: str,
+        headers: Dict[str, str],
+        etags: Dict[str, str],
+        movie_ids: List[int],
+    ) -> None:
+        if action == "like_toggle":
+            await self._request(
+                client,
+                action,
+                "POST",
+                f"{self.api}/likes/toggle",
+                headers=headers,
+                json={"movie_id": rng.choice(movie_ids)},
+            )
+            return
+
+        if action == "movies":
+            # Most users stay on the first pages
+            page = 1 + int(rng.expovariate(1 / 2))
+            url = f"{self.api}/movies/?page={page}&per_page=20"
+        elif action == "movies_search":
+            url = f"{self.api}/movies/?search={rng.choice(SEARCH_TERMS)}"
+        else:
+            algorithm = rng.choice(list(RecommendationAlgorithm)).value
+            url = f"{self.api}/recommendations/?algorithm={algorithm}"
+
+        request_headers = dict(headers)
+        if url in etags:
+            request_headers["If-None-Match"] = etags[url]
+        response = await self._request(
+            client, action, "GET", url, headers=request_headers
+        )
+        if response is None or response.status_code != 200:
+            return
+
+        if "etag" in response.headers:
+            etags[url] = response.headers["etag"]
+        movie_ids.extend(
+            movie["id"] for movie in response.json().get("movies", [])
+        )
+        # Remember a bounded number of movies to like
+        del movie_ids[:-200]
+
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.stats[endpoint].record(latency_ms, type(e).__name__, True)
+            return None
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.stats[endpoint].record(
+            latency_ms,
+            str(response.status_code),
+            response.status_code >= 400,
+        )
+        return response
+
+    async def _think(self, rng: random.Random) -> None:
+        if self.think_time > 0:
+            await asyncio.sleep(rng.expovariate(1 / self.think_time))
+
+    def _expired(self) -> bool:
+        return time.perf_counter() >= self.deadline
+
+
+def read_credentials(path: str) -> List[Tuple[str, str]]:
+    """Usernames and passwords from a generate_dataset.py users.csv."""
+    with open(path, newline="") as users_file:
+        return [
+            (row["username"], row["password"])
+            for row in csv.DictReader(users_file)
+        ]
+
+
+def print_report(report: Dict) -> None:
+    print(
+        f"{report['requests']} requests in {report['elapsed_s']:.1f}s: "
+        f"{report['throughput_rps']:.1f} req/s, "
+        f"{report['error_rate']:.2%} errors"
+    )
+    print(
+        f"{'endpoint':<16} {'requests':>8} {'req/s':>8} {'errors':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for name, endpoint in report["endpoints"].items():
+        print(
+            f"{name:<16} {endpoint['requests']:>8} "
+            f"{endpoint['throughput_rps']:>8.1f} "
+            f"{endpoint['error_rate']:>7.2%} "
+            f"{endpoint['p50_ms']:>8.1f} {endpoint['p95_ms']:>8.1f} "
+            f"{endpoint['p99_ms']:>8.1f} {endpoint['max_ms']:>8.1f}"
+        )
+
+    for name, endpoint in report["endpoints"].items():
+        statuses = ", ".join(
+            f"{status}: {count}"
+            for status, count in sorted(endpoint["statuses"].items())
+        )
+        print(f"\n{name} ({statuses})")
+        # Only the range of buckets that have requests
+        buckets = list(endpoint["histogram_ms"].items())
+        used = [i for i, (_, count) in enumerate(buckets) if count]
+        for bound, count in buckets[used[0]:used[-1] + 1]:
+            label = "> 5000" if bound == "inf" else f"<= {bound}"
+            bar = "#" * round(50 * count / endpoint["requests"])
+            print(f"  {label:>8} ms {count:>7}  {bar}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument(
+        "--concurrency", type=int, default=50, help="Virtual users"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60, help="Seconds"
+    )
+    parser.add_argument(
+        "--ramp-up", type=float, default=10, help="Seconds"
+    )
+    parser.add_argument(
+        "--users-csv",
+        help="users.csv written by scripts/generate_dataset.py --csv-dir",
+    )
+    parser.add_argument(
+        "--register-ratio",
+        type=float,
+        default=0.05,
+        help="Share of sessions that register a new user",
+    )
+    parser.add_argument(
+        "--session-actions",
+        type=int,
+        default=20,
+        help="Mean number of actions per session",
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=0.5,
+        help="Mean seconds between actions",
+    )
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--json", action="store_true", help="JSON output")
+    args = parser.parse_args()
+
+    load_test = LoadTest(
+        base_url=args.base_url,
+        concurrency=args.concurrency,
+        duration=args.duration,
+        ramp_up=args.ramp_up,
+        credentials=(
+            read_credentials(args.users_csv) if args.users_csv else []
+        ),
+        register_ratio=args.register_ratio,
+        session_actions=args.session_actions,
+        think_time=args.think_time,
+        timeout=args.timeout,
+        seed=args.seed,
+    )
+    report = asyncio.run(load_test.run())
+    report["parameters"] = {
+        key: value for key, value in vars(args).items()
+        if key not in ("output", "json")
+    }
+
+    if args.output:
+        with open(args.output, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
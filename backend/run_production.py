@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Script para executar a aplicação em produção com múltiplos workers.
+
+Recommendation models are built once in the parent process and
+published as memory-mapped snapshots that all forked workers share;
+later rebuilds are done by one worker and attached by the others.
+Send SIGHUP to rebuild them and replace the workers without dropping
+connections.
+
+Unless DEBUG is set (in the environment or .env), it runs with debug
+off: JSON logs, no SQL echo, API docs or debug response headers.
+"""
+import argparse
+import shutil
+import tempfile
+
+from src.infrastructure.config.settings import settings
+
+# Before the modules reading it (e.g. the database engine) are imported
+if "debug" not in settings.model_fields_set:
+    settings.debug = False
+
+from src.infrastructure.cache.versions import version_store  # noqa: E402
+from src.infrastructure.config.logging import configure_logging  # noqa: E402
+from src.infrastructure.metrics.instruments import (  # noqa: E402
+    metrics_registry
+)
+from src.infrastructure.server.prefork import (  # noqa: E402
+    PreforkServer,
+    default_worker_count,
+    processes_per_worker
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, default=settings.server_port)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.server_workers or default_worker_count(),
+    )
+    return parser.parse_args()
+
+
+def load_app():
+    from src.infrastructure.api.main import app
+
+    return app
+
+
+def preload_models() -> None:
+    from src.infrastructure.database.connection import engine
+    from src.infrastructure.external.recommendation_engine import (
+        recommendation_engine
+    )
+
+    recommendation_engine.clear()
+    recommendation_engine.warm_up()
+    # Workers must open their own database connections
+    engine.dispose()
+
+
+def main() -> None:
+    args = parse_args()
+    configure_logging()
+
+    # Split the password hashing processes between the workers; must be
+    # set before the application (and its hashing pool) is imported
+    if settings.password_hash_workers is None:
+        settings.password_hash_workers = processes_per_worker(args.workers)
+    # Writes in one worker must invalidate caches in all of them
+    version_store.share()
+    # Any worker reports the metrics of all of them
+    metrics_registry.share(processes=args.workers * 4)
+    # Workers map the models published by whichever process built them
+    snapshot_dir = None
+    if settings.recommendation_snapshot_dir is None:
+        snapshot_dir = tempfile.mkdtemp(prefix="rurax-models-")
+        settings.recommendation_snapshot_dir = snapshot_dir
+
+    server = PreforkServer(
+        load_app=load_app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        graceful_timeout=settings.server_graceful_timeout_seconds,
+        preload=preload_models if settings.server_preload_models else None,
+        log_level=settings.log_level.lower(),
+    )
+    try:
+        server.run()
+    finally:
+        if snapshot_dir is not None:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic, production-sized dataset.
+
+Creates users, movies with genre-dependent titles and overviews, and a
+like graph whose movie popularity follows a power law (a few movies get
+most of the likes) and whose per-user activity is heavy-tailed. Users
+prefer one or two genres, so content-based and collaborative
+recommendations have structure to find. The same seed always produces
+the same dataset.
+
+The dataset is written to the configured database (bulk COPY on
+PostgreSQL, batched executemany elsewhere) or, with --csv-dir, to CSV
+files: movies.csv in the format of the CSV import endpoint, plus
+users.csv and likes.csv for load tests.
+
+Usage:
+    python scripts/generate_dataset.py --users 10000 --movies 5000
+        [--likes-per-user 20] [--seed 42] [--csv-dir data/] [--truncate]
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# flake8: noqa: E402
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from src.infrastructure.database.migrations import upgrade_database
+from src.infrastructure.database.models import (
+    LikeModel,
+    MovieModel,
+    UserModel
+)
+
+DEFAULT_PASSWORD = "password123"
+# Fixed reference time, so timestamps are part of the deterministic output
+BASE_TIME = datetime(2024, 1, 1)
+
+# Genre -> relative frequency in the catalog
+GENRES = {
+    "Drama": 10, "Comedy": 7, "Action": 6, "Thriller": 5, "Romance": 4,
+    "Horror": 3, "Adventure": 3, "Crime": 3, "Sci-Fi": 2, "Fantasy": 2,
+    "Animation": 2, "Mystery": 2, "Family": 2, "Documentary": 1,
+    "War": 1, "History": 1, "Music": 1, "Western": 1,
+}
+
+GENRE_WORDS = {
+    "Drama": "family loss grief secret marriage choice past letter",
+    "Comedy": "wedding road trip roommates prank disaster chaos party",
+    "Action": "mission chase explosion agent rescue heist weapon escape",
+    "Thriller": "conspiracy witness stalker hostage deadline betrayal",
+    "Romance": "love summer kiss heart wedding affair reunion letter",
+    "Horror": "haunted curse demon cabin ritual nightmare creature blood",
+    "Adventure": "treasure jungle island quest map expedition voyage",
+    "Crime": "detective murder mob heist police cartel robbery trial",
+    "Sci-Fi": "space robot planet future alien android galaxy time",
+    "Fantasy": "dragon kingdom wizard sword prophecy magic realm elf",
+    "Animation": "talking animals toy adventure friendship dream forest",
+    "Mystery": "disappearance clue puzzle secret island manor riddle",
+    "Family": "holiday dog kids grandparents school christmas home",
+    "Documentary": "history nature ocean music politics climate life",
+    "War": "soldier battle front resistance platoon siege homecoming",
+    "History": "empire revolution king queen dynasty rebellion era",
+    "Music": "band concert singer tour album stage dream rhythm",
+    "Western": "sheriff outlaw frontier ranch desert gold revenge",
+}
+
+COMMON_WORDS = (
+    "a young woman man must face their world after city town discovers "
+    "old friend finds an unexpected journey when everything changes "
+    "against all odds two strangers years later only hope"
+).split()
+
+TITLE_ADJECTIVES = (
+    "Silent Last Broken Golden Dark Hidden Lost Crimson Eternal Wild "
+    "Frozen Burning Secret Final Distant Savage Midnight Forgotten"
+).split()
+TITLE_NOUNS = (
+    "Harbor Empire Road Promise Horizon Night Signal Garden River Storm "
+    "Kingdom Witness Mirror Frontier Echo Shadow Summer Machine"
+).split()
+
+LANGUAGES = {"en": 70, "fr": 6, "es": 6, "pt": 5, "ja": 5, "ko": 4, "de": 4}
+
+MOVIE_COLUMNS = [
+    "title", "overview", "release_date", "poster_path", "backdrop_path",
+    "vote_average", "vote_count", "popularity", "genres", "runtime",
+    "original_language", "tmdb_id",
+]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    movies: List[Dict[str, Any]]
+    users: List[Dict[str, Any]]
+    # (user index, movie index), zero-based positions in the lists above
+    likes: List[Tuple[int, int]]
+    password: str
+
+
+def _weights(frequencies: Dict[str, int]) -> Tuple[List[str], np.ndarray]:
+    names = list(frequencies)
+    weights = np.array([frequencies[name] for name in names], dtype=float)
+    return names, weights / weights.sum()
+
+
+def generate_movies(count: int, rng: np.random.Generator) -> List[Dict]:
+    genre_names, genre_weights = _weights(GENRES)
+    languages, language_weights = _weights(LANGUAGES)
+    # Heavy-tailed popularity, as in real catalogs
+    popularity = rng.lognormal(mean=2.0, sigma=1.0, size=count)
+
+    movies = []
+    titles = set()
+    for index in range(count):
+        genres = list(rng.choice(
+            genre_names,
+            size=int(rng.integers(1, 4)),
+            replace=False,
+            p=genre_weights
+        ))
+        vocabulary = COMMON_WORDS + " ".join(
+            GENRE_WORDS[genre] for genre in genres
+        ).split()
+
+        title = (
+            f"{rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}"
+        )
+        if title in titles:
+            # Titles must be unique: the CSV import matches on them
+            title = f"{title} {index + 1}"
+        titles.add(title)
+
+        tmdb_id = 100000 + index
+        release = BASE_TIME - timedelta(days=int(rng.integers(0, 365 * 70)))
+        movies.append({
+            "title": title,
+            "overview": " ".join(
+                rng.choice(vocabulary, size=int(rng.integers(15, 41)))
+            ).capitalize() + ".",
+            "release_date": release.strftime("%Y-%m-%d"),
+            "poster_path": f"/posters/{tmdb_id}.jpg",
+            "backdrop_path": f"/backdrops/{tmdb_id}.jpg",
+            "vote_average": round(
+                float(np.clip(rng.normal(6.5, 1.2), 1, 10)), 1
+            ),
+            "vote_count": int(popularity[index] * rng.integers(20, 200)),
+            "popularity": round(float(popularity[index]), 3),
+            "genres": json.dumps([str(genre) for genre in genres]),
+            "runtime": int(np.clip(rng.normal(110, 20), 70, 200)),
+            "original_language": str(
+                rng.choice(languages, p=language_weights)
+            ),
+            "tmdb_id": tmdb_id,
+        })
+    return movies
+
+
+def generate_users(count: int, hashed_password: str) -> List[Dict]:
+    return [
+        {
+            "email": f"user{index:07d}@example.com",
+            "username": f"user{index:07d}",
+            "hashed_password": hashed_password,
+        }
+        for index in range(count)
+    ]
+
+
+def generate_likes(
+    user_count: int,
+    movies: Sequence[Dict],
+    likes_per_user: float,
+    rng: np.random.Generator,
+    popularity_exponent: float = 1.0,
+) -> List[Tuple[int, int]]:
+    """
+    Sample each user's likes without replacement.
+
+    Movie weights follow a Zipf law over the popularity rank, boosted
+    for the user's favourite genres; the number of likes per user is
+    log-normal around `likes_per_user`.
+    """
+    movie_count = len(movies)
+    if user_count == 0 or movie_count == 0:
+        return []
+
+    genre_names = list(GENRES)
+    genre_matrix = np.zeros((movie_count, len(genre_names)), dtype=bool)
+    for movie_index, movie in enumerate(movies):
+        for genre in json.loads(movie["genres"]):
+            genre_matrix[movie_index, genre_names.index(genre)] = True
+
+    ranks = np.empty(movie_count)
+    ranks[np.argsort([-movie["popularity"] for movie in movies])] = (
+        np.arange(1, movie_count + 1)
+    )
+    base_weights = ranks ** -popularity_exponent
+
+    # Log-normal activity with the requested mean
+    sigma = 1.0
+    activity = rng.lognormal(
+        mean=np.log(max(likes_per_user, 1e-9)) - sigma ** 2 / 2,
+        sigma=sigma,
+        size=user_count
+    )
+    like_counts = np.clip(np.rint(activity), 0, movie_count).astype(int)
+
+    likes = []
+    for user_index, like_count in enumerate(like_counts):
+        if like_count == 0:
+            continue
+        favourites = rng.choice(
+            len(genre_names), size=int(rng.integers(1, 3)), replace=False
+        )
+        weights = base_weights * np.where(
+            genre_matrix[:, favourites].any(axis=1), 4.0, 1.0
+        )
+        liked = rng.choice(
+            movie_count,
+            size=int(like_count),
+            replace=False,
+            p=weights / weights.sum()
+        )
+        likes.extend((user_index, int(movie)) for movie in np.sort(liked))
+    return likes
+
+
+def generate_dataset(
+    users: int,
+    movies: int,
+    likes_per_user: float = 20,
+    seed: int = 42,
+    password: str = DEFAULT_PASSWORD,
+    hashed_password: str = "",
+) -> Dataset:
+    """
+    Build the whole dataset in memory.
+
+    All users share `password`; pass its hash to skip hashing (bcrypt
+    salts make the hash itself the only non-deterministic field).
+    """
+    rng = np.random.default_rng(seed)
+    if not hashed_password:
+        from src.infrastructure.external.password_hashing_worker import (
+            hash_password
+        )
+        hashed_password = hash_password(password)
+
+    movie_rows = generate_movies(movies, rng)
+    return Dataset(
+        movies=movie_rows,
+        users=generate_users(users, hashed_password),
+        likes=generate_likes(users, movie_rows, likes_per_user, rng),
+        password=password,
+    )
+
+
+def write_database(
+    engine: Engine,
+    dataset: Dataset,
+    truncate: bool = False,
+    batch_size: int = 5000,
+) -> None:
+    """
+    Insert the dataset with ids 1..N into empty tables, creating or
+    migrating them first.
+
+    Uses COPY on PostgreSQL and batched executemany on other databases.
+    """
+    upgrade_database(engine)
+    tables = [
+        LikeModel.__table__, MovieModel.__table__, UserModel.__table__
+    ]
+
+    with engine.begin() as conn:
+        if truncate:
+            for table in tables:
+                conn.execute(table.delete())
+        for table in tables:
+            if conn.execute(
+                text(f"SELECT 1 FROM {table.name} LIMIT 1")
+            ).first():
+                raise RuntimeError(
+                    f"Table {table.name} is not empty; use --truncate"
+                )
+
+        rows = _database_rows(dataset)
+        for table in reversed(tables):
+            if engine.dialect.name == "postgresql":
+                _copy_rows(conn, table.name, rows[table.name])
+            else:
+                for start in range(0, len(rows[table.name]), batch_size):
+                    conn.execute(
+                        table.insert(),
+                        rows[table.name][start:start + batch_size]
+                    )
+
+        if engine.dialect.name == "postgresql":
+            # Explicit ids leave the sequences behind
+            for table in tables:
+                conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', "
+                    f"'id'), COALESCE(MAX(id), 1)) FROM {table.name}"
+                ))
+
+
+def _database_rows(dataset: Dataset) -> Dict[str, List[Dict[str, Any]]]:
+    def timestamp(index: int) -> datetime:
+        return BASE_TIME + timedelta(seconds=index)
+
+    movies = [
+        {
+            **movie,
+            "id": index + 1,
+            "created_at": timestamp(index),
+            "updated_at": timestamp(index),
+        }
+        for index, movie in enumerate(dataset.movies)
+    ]
+    users = [
+        {
+            **user,
+            "id": index + 1,
+            "is_active": True,
+            "created_at": timestamp(index),
+            "updated_at": timestamp(index),
+        }
+        for index, user in enumerate(dataset.users)
+    ]
+    likes = [
+        {
+            "id": index + 1,
+            "user_id": user_index + 1,
+            "movie_id": movie_index + 1,
+            "created_at": timestamp(index),
+        }
+        for index, (user_index, movie_index) in enumerate(dataset.likes)
+    ]
+    return {"movies": movies, "users": users, "likes": likes}
+
+
+def _copy_rows(
+    conn: Connection,
+    table_name: str,
+    rows: List[Dict[str, Any]],
+) -> None:
+    if not rows:
+        return
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(row[column] for column in columns)
+    buffer.seek(0)
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table_name} ({', '.join(columns)}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+    finally:
+        cursor.close()
+
+
+def write_csv(directory: str, dataset: Dataset) -> None:
+    """
+    Write movies.csv (CSV import format), users.csv and likes.csv.
+
+    Likes reference users by username and movies by tmdb_id, so they
+    stay valid whatever ids the database assigns.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    with open(os.path.join(directory, "movies.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=MOVIE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(dataset.movies)
+
+    with open(os.path.join(directory, "users.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["username", "email", "password"])
+        for user in dataset.users:
+            writer.writerow(
+                [user["username"], user["email"], dataset.password]
+            )
+
+    with open(os.path.join(directory, "likes.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["username", "tmdb_id"])
+        for user_index, movie_index in dataset.likes:
+            writer.writerow([
+                dataset.users[user_index]["username"],
+                dataset.movies[movie_index]["tmdb_id"],
+            ])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--movies", type=int, default=2000)
+    parser.add_argument("--likes-per-user", type=float, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--password",
+        default=DEFAULT_PASSWORD,
+        help="Password shared by all generated users"
+    )
+    parser.add_argument(
+        "--csv-dir",
+        help="Write CSV files to this directory instead of the database"
+    )
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Delete existing users, movies and likes first"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    dataset = generate_dataset(
+        users=args.users,
+        movies=args.movies,
+        likes_per_user=args.likes_per_user,
+        seed=args.seed,
+        password=args.password,
+    )
+    generated = time.perf_counter()
+
+    if args.csv_dir:
+        write_csv(args.csv_dir, dataset)
+        target = args.csv_dir
+    else:
+        from src.infrastructure.database.connection import engine
+
+        try:
+            write_database(engine, dataset, truncate=args.truncate)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        target = engine.url.render_as_string(hide_password=True)
+
+    print(
+        f"Generated {len(dataset.users)} users, {len(dataset.movies)} "
+        f"movies and {len(dataset.likes)} likes in "
+        f"{generated - start:.1f}s; written to {target} in "
+        f"{time.perf_counter() - generated:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
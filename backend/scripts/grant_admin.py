@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Grant (or revoke) administrator access to an existing user.
+
+Administrators can call the /api/v1/admin endpoints (profiling). Running
+workers pick the change up once their cached copy of the user expires
+(USER_CACHE_TTL_SECONDS).
+
+Usage:
+    python scripts/grant_admin.py <username> [--revoke]
+"""
+import argparse
+import os
+import sys
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# flake8: noqa: E402
+from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.database.repositories.user_repository_impl import (
+    UserRepositoryImpl
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("username")
+    parser.add_argument(
+        "--revoke",
+        action="store_true",
+        help="Remove administrator access instead",
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        repository = UserRepositoryImpl(db)
+        user = repository.get_by_username(args.username)
+        if user is None:
+            print(f"❌ User {args.username!r} not found")
+            sys.exit(1)
+
+        user.is_admin = not args.revoke
+        repository.save(user)
+    finally:
+        db.close()
+
+    action = "revoked from" if args.revoke else "granted to"
+    print(f"✅ Administrator access {action} {args.username!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 # flake8: noqa: E402
 from sqlalchemy import text
 from src.infrastructure.database.connection import engine, SessionLocal
+from src.infrastructure.database.migrations import upgrade_database
 from src.infrastructure.database.models import MovieModel, UserModel, LikeModel
 from src.infrastructure.config.logging import configure_logging, get_logger
 
@@ -16,12 +17,9 @@ logger = get_logger(__name__)
 
 
 def create_tables():
-    """Create all tables in the database."""
+    """Create the tables, or bring them up to date, with the migrations."""
     try:
-        # Import all models to register them
-        from src.infrastructure.database.connection import Base
-
-        Base.metadata.create_all(bind=engine)
+        upgrade_database(engine)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating tables: {e}")
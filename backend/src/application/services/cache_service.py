@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+
+class CacheService(ABC):
+    """Abstract key/value cache used to share computed results."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value or None when missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (backend default when None)
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Remove a key. Returns True if it was present."""
+        pass
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove every key starting with prefix. Returns removed count."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every key."""
+        pass
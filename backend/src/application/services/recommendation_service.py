@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 
 from src.domain.entities.user import User
 from src.domain.value_objects.recommendation import (
     RecommendationRequest,
     RecommendationResult,
-    RecommendationAlgorithm
+    RecommendationAlgorithm,
+    RankedRecommendations
 )
 
 
@@ -32,6 +33,27 @@ class RecommendationStrategy(ABC):
         """
         pass
 
+    def rank(self, user: User) -> Optional[RankedRecommendations]:
+        """
+        Compute the full ranked list of movie IDs for a user.
+
+        Strategies with a per-user ranking override this so the list can
+        be cached and paginated without recomputing the model.
+
+        Returns:
+            RankedRecommendations, or None when the strategy has no
+            per-user ranking (pages must then come from recommend)
+        """
+        return None
+
+    def warm_up(self) -> None:
+        """
+        Precompute state shared by all users (e.g. model matrices).
+
+        Called in the background at startup so the first request does not
+        pay for it. Strategies without such state keep this no-op.
+        """
+
     @abstractmethod
     def get_name(self) -> str:
         """Get the strategy name."""
@@ -19,10 +19,15 @@ class RegisterUserUseCase:
         self.security_service = security_service
 
     def execute(self, user_data: UserCreateDTO) -> User:
-        if self.user_repository.get_by_email(user_data.email):
+        # One lookup before hashing; the unique constraints still guard
+        # the insert against concurrent signups
+        email_taken, username_taken = self.user_repository\
+            .exists_by_email_or_username(user_data.email, user_data.username)
+
+        if email_taken:
             raise EmailAlreadyExistsException("Email already exists")
 
-        if self.user_repository.get_by_username(user_data.username):
+        if username_taken:
             raise UsernameAlreadyExistsException(
                 "Username already exists"
             )
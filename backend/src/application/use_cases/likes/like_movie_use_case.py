@@ -1,3 +1,5 @@
+from typing import Optional
+
 from src.domain.entities.like import Like
 from src.domain.repositories.like_repository import LikeRepository
 from src.domain.repositories.movie_repository import MovieRepository
@@ -6,6 +8,8 @@ from src.application.dtos.like_dto import (
     LikeToggleResponseDTO,
     LikeResponseDTO
 )
+from src.application.services.cache_service import CacheService
+from src.shared.constants.cache_keys import USER_RECOMMENDATIONS_CACHE_PREFIX
 from src.shared.exceptions.movie_exceptions import (
     MovieNotFoundException
 )
@@ -16,10 +20,12 @@ class LikeMovieUseCase:
     def __init__(
         self,
         like_repository: LikeRepository,
-        movie_repository: MovieRepository
+        movie_repository: MovieRepository,
+        recommendation_cache: Optional[CacheService] = None
     ):
         self.like_repository = like_repository
         self.movie_repository = movie_repository
+        self.recommendation_cache = recommendation_cache
 
     def execute(
         self,
@@ -43,6 +49,7 @@ class LikeMovieUseCase:
         if existing_like:
             # User already liked this movie, so remove the like (unlike)
             self.like_repository.delete(existing_like.id)
+            self._invalidate_recommendations(user_id)
             return LikeToggleResponseDTO(
                 movie_id=like_data.movie_id,
                 is_liked=False,
@@ -57,6 +64,7 @@ class LikeMovieUseCase:
             )
 
             saved_like = self.like_repository.save(like)
+            self._invalidate_recommendations(user_id)
 
             like_dto = LikeResponseDTO(
                 id=saved_like.id,
@@ -70,3 +78,10 @@ class LikeMovieUseCase:
                 is_liked=True,
                 like=like_dto
             )
+
+    def _invalidate_recommendations(self, user_id: int) -> None:
+        # The user's ranked lists no longer reflect their likes
+        if self.recommendation_cache is not None:
+            self.recommendation_cache.delete_prefix(
+                USER_RECOMMENDATIONS_CACHE_PREFIX.format(user_id=user_id)
+            )
@@ -5,7 +5,9 @@ from src.application.dtos.movie_dto import (
     MovieListResponseDTO,
     MovieResponseDTO
 )
-from typing import Optional
+from src.application.services.cache_service import CacheService
+from src.shared.constants.cache_keys import MOVIE_LIST_CACHE_KEY
+from typing import List, Optional
 
 
 class GetMoviesUseCase:
@@ -13,10 +15,12 @@ class GetMoviesUseCase:
     def __init__(
         self,
         movie_repository: MovieRepository,
-        like_repository: LikeRepository
+        like_repository: LikeRepository,
+        cache: Optional[CacheService] = None
     ):
         self.movie_repository = movie_repository
         self.like_repository = like_repository
+        self.cache = cache
 
     def execute(
         self,
@@ -38,36 +42,66 @@ class GetMoviesUseCase:
                 page=page,
                 per_page=per_page
             )
+            result = self._build_page(movies, total, page, per_page)
         else:
-            movies, total = self.movie_repository.get_all(
-                page=page,
-                per_page=per_page
-            )
+            result = self._get_listing_page(page, per_page)
 
-        # Convert to DTOs
-        movie_dtos = [self._movie_to_dto(movie, user_id) for movie in movies]
+        # Apply the per-user overlay on top of the shared page
+        return self._apply_likes(result, user_id)
+
+    def _get_listing_page(
+        self, page: int, per_page: int
+    ) -> MovieListResponseDTO:
+        # The default listing is the same for every user, so it is cached
+        # without is_liked and shared between requests
+        cache_key = MOVIE_LIST_CACHE_KEY.format(page=page, per_page=per_page)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        movies, total = self.movie_repository.get_all(
+            page=page,
+            per_page=per_page
+        )
+        result = self._build_page(movies, total, page, per_page)
 
+        if self.cache is not None:
+            self.cache.set(cache_key, result)
+
+        return result
+
+    def _build_page(
+        self, movies: List[Movie], total: int, page: int, per_page: int
+    ) -> MovieListResponseDTO:
         # Calculate pagination info
         total_pages = (total + per_page - 1) // per_page
 
         return MovieListResponseDTO(
-            movies=movie_dtos,
+            movies=[self._movie_to_dto(movie) for movie in movies],
             total=total,
             page=page,
             total_pages=total_pages,
             per_page=per_page
         )
 
-    def _movie_to_dto(
-        self, movie: Movie, user_id: Optional[int] = None
-    ) -> MovieResponseDTO:
-        # Check if user liked this movie
-        is_liked = None
-        if user_id is not None:
-            like = self.like_repository.get_by_user_and_movie(
-                user_id, movie.id
-            )
-            is_liked = like is not None
+    def _apply_likes(
+        self, result: MovieListResponseDTO, user_id: Optional[int]
+    ) -> MovieListResponseDTO:
+        if user_id is None:
+            return result
+
+        liked_ids = self.like_repository.get_liked_movie_ids(
+            user_id, [movie.id for movie in result.movies]
+        )
+        # Copies keep the cached page untouched
+        movies = [
+            movie.model_copy(update={"is_liked": movie.id in liked_ids})
+            for movie in result.movies
+        ]
+        return result.model_copy(update={"movies": movies})
+
+    def _movie_to_dto(self, movie: Movie) -> MovieResponseDTO:
         return MovieResponseDTO(
             id=movie.id,
             tmdb_id=movie.tmdb_id,
@@ -84,6 +118,5 @@ class GetMoviesUseCase:
             original_language=movie.original_language,
             year=movie.get_year(),
             created_at=movie.created_at,
-            updated_at=movie.updated_at,
-            is_liked=is_liked
+            updated_at=movie.updated_at
         )
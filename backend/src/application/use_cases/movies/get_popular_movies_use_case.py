@@ -3,13 +3,21 @@ from src.application.dtos.movie_dto import (
     MovieListResponseDTO,
     MovieResponseDTO
 )
+from src.application.services.cache_service import CacheService
 from src.domain.entities.movie import Movie
+from src.shared.constants.cache_keys import POPULAR_MOVIES_CACHE_KEY
+from typing import Optional
 
 
 class GetPopularMoviesUseCase:
 
-    def __init__(self, movie_repository: MovieRepository):
+    def __init__(
+        self,
+        movie_repository: MovieRepository,
+        cache: Optional[CacheService] = None
+    ):
         self.movie_repository = movie_repository
+        self.cache = cache
 
     def execute(
         self,
@@ -22,6 +30,16 @@ class GetPopularMoviesUseCase:
         if per_page < 1 or per_page > 100:
             per_page = 20
 
+        # Popular pages carry no per-user data and are shared as-is.
+        # Like counts may lag behind by at most the cache TTL.
+        cache_key = POPULAR_MOVIES_CACHE_KEY.format(
+            page=page, per_page=per_page
+        )
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Get popular movies
         movies, total = self.movie_repository.get_popular(
             page=page,
@@ -34,7 +52,7 @@ class GetPopularMoviesUseCase:
         # Calculate pagination info
         total_pages = (total + per_page - 1) // per_page
 
-        return MovieListResponseDTO(
+        result = MovieListResponseDTO(
             movies=movie_dtos,
             total=total,
             page=page,
@@ -42,6 +60,11 @@ class GetPopularMoviesUseCase:
             per_page=per_page
         )
 
+        if self.cache is not None:
+            self.cache.set(cache_key, result)
+
+        return result
+
     def _movie_to_dto(self, movie: Movie) -> MovieResponseDTO:
         return MovieResponseDTO(
             id=movie.id,
@@ -1,10 +1,12 @@
 import csv
 import io
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
 from src.domain.entities.movie import Movie
 from src.domain.repositories.movie_repository import MovieRepository
+from src.application.services.cache_service import CacheService
+from src.shared.constants.cache_keys import MOVIES_CACHE_PREFIX
 from src.application.dtos.csv_dto import (
     MovieCsvRowDTO,
     CsvUploadResponseDTO
@@ -13,8 +15,13 @@ from src.application.dtos.csv_dto import (
 
 class ImportMoviesCsvUseCase:
 
-    def __init__(self, movie_repository: MovieRepository):
+    def __init__(
+        self,
+        movie_repository: MovieRepository,
+        cache: Optional[CacheService] = None
+    ):
         self.movie_repository = movie_repository
+        self.cache = cache
 
     def execute(self, csv_content: str) -> CsvUploadResponseDTO:
 
@@ -94,6 +101,10 @@ class ImportMoviesCsvUseCase:
             except Exception as e:
                 errors.append(f"Error saving to database: {str(e)}")
 
+            # Cached movie pages are stale once anything was written
+            if self.cache is not None and (created_count or updated_count):
+                self.cache.delete_prefix(MOVIES_CACHE_PREFIX)
+
             # Prepare response
             success = len(errors) == 0
             if success:
@@ -49,9 +49,13 @@ class GetRecommendationsUseCase:
         # Get recommendations from service
         result = self.recommendation_service.get_recommendations(request)
 
-        # Convert to DTOs
+        # Convert to DTOs, resolving likes for the whole page at once
+        liked_ids = self.like_repository.get_liked_movie_ids(
+            user_id, [movie.id for movie in result.movies]
+        )
         movie_dtos = [
-            self._movie_to_dto(movie, user_id) for movie in result.movies
+            self._movie_to_dto(movie, movie.id in liked_ids)
+            for movie in result.movies
         ]
 
         # Calculate pagination info
@@ -69,10 +73,7 @@ class GetRecommendationsUseCase:
 
         return self.recommendation_service.get_available_algorithms()
 
-    def _movie_to_dto(self, movie: Movie, user_id: int) -> MovieResponseDTO:
-        # Check if user liked this movie
-        like = self.like_repository.get_by_user_and_movie(user_id, movie.id)
-        is_liked = like is not None
+    def _movie_to_dto(self, movie: Movie, is_liked: bool) -> MovieResponseDTO:
         return MovieResponseDTO(
             id=movie.id,
             tmdb_id=movie.tmdb_id,
@@ -10,6 +10,7 @@ class User:
     username: str
     hashed_password: str
     is_active: bool = True
+    is_admin: bool = False
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 
 from src.domain.entities.like import Like
 
@@ -15,6 +15,12 @@ class LikeRepository(ABC):
     ) -> Optional[Like]:
         pass
 
+    @abstractmethod
+    def get_liked_movie_ids(
+        self, user_id: int, movie_ids: List[int]
+    ) -> Set[int]:
+        pass
+
     @abstractmethod
     def get_by_user(
         self, user_id: int, page: int = 1, per_page: int = 20
@@ -17,6 +17,10 @@ class MovieRepository(ABC):
     def get_by_id(self, movie_id: int) -> Optional[Movie]:
         pass
 
+    @abstractmethod
+    def get_by_ids(self, movie_ids: List[int]) -> List[Movie]:
+        pass
+
     @abstractmethod
     def get_by_tmdb_id(self, tmdb_id: int) -> Optional[Movie]:
         pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.domain.entities.user import User
 
@@ -25,6 +25,15 @@ class UserRepository(ABC):
     def get_by_username_or_email(self, identifier: str) -> Optional[User]:
         pass
 
+    @abstractmethod
+    def exists_by_email_or_username(
+        self,
+        email: str,
+        username: str,
+    ) -> Tuple[bool, bool]:
+        """Return (email_taken, username_taken) in a single lookup."""
+        pass
+
     @abstractmethod
     def delete(self, user_id: int) -> bool:
         pass
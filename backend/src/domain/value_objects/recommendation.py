@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Tuple
 
 from src.domain.entities.movie import Movie
 
@@ -26,3 +26,18 @@ class RecommendationResult:
     algorithm_used: str
     page: int
     per_page: int
+
+
+@dataclass(frozen=True)
+class RankedRecommendations:
+    """Full ranked list of recommended movie IDs for one user."""
+    movie_ids: Tuple[int, ...]
+    algorithm_used: str
+
+    @property
+    def total(self) -> int:
+        return len(self.movie_ids)
+
+    def page(self, page: int, per_page: int) -> Tuple[int, ...]:
+        start_idx = (page - 1) * per_page
+        return self.movie_ids[start_idx:start_idx + per_page]
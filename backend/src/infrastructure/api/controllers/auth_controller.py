@@ -19,12 +19,21 @@ from src.shared.exceptions.auth_exceptions import (
     EmailAlreadyExistsException,
     UsernameAlreadyExistsException,
     InvalidCredentialsException,
-    UserInactiveException
+    UserInactiveException,
+    PasswordHashingBusyException
 )
 
 router = APIRouter()
 
 
+def _too_many_requests() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Server busy, try again shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post(
     path="/register",
     response_model=UserResponseDTO,
@@ -48,6 +57,8 @@ def register(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except PasswordHashingBusyException:
+        raise _too_many_requests()
 
 
 @router.post(
@@ -74,6 +85,8 @@ def login(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
+    except PasswordHashingBusyException:
+        raise _too_many_requests()
 
 
 @router.post(
@@ -96,3 +109,5 @@ def login_json(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
+    except PasswordHashingBusyException:
+        raise _too_many_requests()
@@ -1,16 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from typing import Optional
 
 from src.application.use_cases.movies.get_movies_use_case import (
     GetMoviesUseCase
 )
+from src.application.use_cases.movies.get_popular_movies_use_case import (
+    GetPopularMoviesUseCase
+)
 from src.application.dtos.movie_dto import MovieListResponseDTO
 from src.infrastructure.api.dependencies.movie_dependencies import (
-    get_movies_use_case
+    get_movies_use_case,
+    get_popular_movies_use_case
+)
+from src.infrastructure.api.responses import PydanticJSONResponse
+from src.infrastructure.api.sparse_fields import (
+    FIELDS_QUERY_DESCRIPTION,
+    parse_movie_fields,
+    movie_list_include
 )
 from src.infrastructure.api.dependencies.auth_dependencies import (
     get_current_user
 )
+from src.infrastructure.api.etags import (
+    make_weak_etag,
+    etag_matches,
+    set_etag,
+    not_modified
+)
+from src.infrastructure.cache.versions import version_store
 from src.domain.entities.user import User
 
 router = APIRouter()
@@ -23,15 +40,35 @@ router = APIRouter()
     description="Get paginated list of movies with optional search"
 )
 def get_movies(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number (1-based)"),
     per_page: int = Query(20, ge=1, le=100, description="Number of movies"),
     search: Optional[str] = Query(None, description="Search query to filter"),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     use_case: GetMoviesUseCase = Depends(get_movies_use_case)
 ):
 
+    movie_fields = parse_movie_fields(fields)
+
+    # Versions are read before the query, so a concurrent write can only
+    # make the ETag older than the content, never newer
+    etag = make_weak_etag(
+        "movies",
+        version_store.epoch,
+        version_store.catalog_version(),
+        version_store.user_likes_version(current_user.id),
+        current_user.id,
+        page,
+        per_page,
+        search or "",
+        sorted(movie_fields or [])
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
-        return use_case.execute(
+        result = use_case.execute(
             user_id=current_user.id,
             page=page,
             per_page=per_page,
@@ -42,3 +79,33 @@ def get_movies(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving movies: {str(e)}"
         )
+
+    response = PydanticJSONResponse(
+        result, include=movie_list_include(movie_fields)
+    )
+    set_etag(response, etag)
+    return response
+
+
+@router.get(
+    path="/popular",
+    response_model=MovieListResponseDTO,
+    summary="Get popular movies",
+    description="Get paginated list of movies ordered by number of likes"
+)
+def get_popular_movies(
+    page: int = Query(1, ge=1, description="Page number (1-based)"),
+    per_page: int = Query(20, ge=1, le=100, description="Number of movies"),
+    current_user: User = Depends(get_current_user),
+    use_case: GetPopularMoviesUseCase = Depends(get_popular_movies_use_case)
+):
+
+    try:
+        result = use_case.execute(page=page, per_page=per_page)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving popular movies: {str(e)}"
+        )
+
+    return PydanticJSONResponse(result)
@@ -0,0 +1,52 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from src.infrastructure.api.dependencies.auth_dependencies import (
+    get_current_admin_user
+)
+from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics.profiler import profiler
+from src.domain.entities.user import User
+
+router = APIRouter()
+
+
+@router.get(
+    path="/profile",
+    response_class=PlainTextResponse,
+    summary="Profile the worker process",
+    description="Sample the Python stacks of every thread of the worker "
+    "that serves the request for the given number of seconds and return "
+    "them in collapsed format (one 'frame;frame;... count' line per "
+    "stack), ready for flamegraph.pl or speedscope. Admins only."
+)
+async def profile_process(
+    seconds: float = Query(
+        10.0,
+        gt=0,
+        le=settings.profiling_max_seconds,
+        description="How long to sample"
+    ),
+    current_user: User = Depends(get_current_admin_user)
+):
+    # Runs on the event loop thread, so the profiler can use signals
+    if not profiler.start(settings.profiling_interval_seconds):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running"
+        )
+
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profile = profiler.stop()
+
+    return PlainTextResponse(
+        content=profile.collapsed(),
+        headers={
+            "X-Profile-Mode": profile.mode,
+            "X-Profile-Samples": str(profile.samples),
+        }
+    )
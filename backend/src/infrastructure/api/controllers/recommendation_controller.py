@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import (
+    APIRouter, Depends, HTTPException, status, Query, Request, Response
+)
 from typing import Optional
 
 from src.application.use_cases.recommendations\
@@ -12,6 +14,20 @@ from src.infrastructure.api.dependencies.recommendation_dependencies import (
 )
 from src.infrastructure.api.dependencies\
     .auth_dependencies import get_current_user
+from src.infrastructure.api.responses import PydanticJSONResponse
+from src.infrastructure.api.sparse_fields import (
+    FIELDS_QUERY_DESCRIPTION,
+    parse_movie_fields,
+    movie_list_include
+)
+from src.infrastructure.api.etags import (
+    make_weak_etag,
+    etag_matches,
+    set_etag,
+    not_modified
+)
+from src.infrastructure.cache.versions import version_store
+from src.infrastructure.metrics.slow_log import tag_request
 from src.domain.entities.user import User
 
 router = APIRouter()
@@ -25,6 +41,7 @@ router = APIRouter()
     "different algorithms"
 )
 def get_recommendations(
+    request: Request,
     algorithm: Optional[RecommendationAlgorithm] = Query(
         RecommendationAlgorithm.COLLABORATIVE,
         description="Recommendation algorithm to use"
@@ -33,11 +50,36 @@ def get_recommendations(
     per_page: int = Query(
         20, ge=1, le=100, description="Number of movies per page"
     ),
+    fields: Optional[str] = Query(None, description=FIELDS_QUERY_DESCRIPTION),
     current_user: User = Depends(get_current_user),
     use_case: GetRecommendationsUseCase = Depends(get_recommendations_use_case)
 ):
+    movie_fields = parse_movie_fields(fields)
+    tag_request(algorithm=algorithm.value if algorithm else None)
+
+    # Content-based results only depend on the catalog and the user's own
+    # likes; the other algorithms also depend on everyone else's likes
+    likes_version = (
+        version_store.user_likes_version(current_user.id)
+        if algorithm == RecommendationAlgorithm.CONTENT_BASED
+        else version_store.likes_version()
+    )
+    etag = make_weak_etag(
+        "recommendations",
+        version_store.epoch,
+        version_store.catalog_version(),
+        likes_version,
+        current_user.id,
+        algorithm.value if algorithm else "",
+        page,
+        per_page,
+        sorted(movie_fields or [])
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
-        return use_case.execute(
+        result = use_case.execute(
             user_id=current_user.id,
             algorithm=algorithm,
             page=page,
@@ -54,6 +96,12 @@ def get_recommendations(
             detail=f"Error generating recommendations: {str(e)}"
         )
 
+    response = PydanticJSONResponse(
+        result, include=movie_list_include(movie_fields)
+    )
+    set_etag(response, etag)
+    return response
+
 
 @router.get(
     path="/algorithms",
@@ -61,13 +109,27 @@ def get_recommendations(
     description="Get information about available recommendation algorithms"
 )
 def get_available_algorithms(
+    request: Request,
+    response: Response,
     use_case: GetRecommendationsUseCase = Depends(get_recommendations_use_case)
 ):
 
+    # The registered algorithms only change with a new deployment
+    etag = make_weak_etag(
+        "algorithms",
+        version_store.epoch,
+        *[algorithm.value for algorithm in RecommendationAlgorithm]
+    )
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
-        return use_case.get_available_algorithms()
+        result = use_case.get_available_algorithms()
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error retrieving algorithms: {str(e)}"
         )
+
+    set_etag(response, etag)
+    return result
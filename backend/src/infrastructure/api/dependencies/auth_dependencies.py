@@ -1,3 +1,6 @@
+from dataclasses import replace
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
@@ -6,25 +9,38 @@ from src.application.use_cases.auth.register_use_case import (
     RegisterUserUseCase
 )
 from src.application.use_cases.auth.login_use_case import LoginUserUseCase
+from src.application.services.cache_service import CacheService
 from src.domain.entities.user import User
+from src.infrastructure.cache.caches import user_cache
+from src.infrastructure.cache.versions import version_store
 from src.infrastructure.database.connection import get_db
 from src.infrastructure.database.repositories.user_repository_impl import (
     UserRepositoryImpl
 )
+from src.infrastructure.metrics.slow_log import tag_request
 from src.infrastructure.external.security_service_impl import (
-    SecurityServiceImpl
+    SecurityServiceImpl,
+    security_service as app_security_service
 )
+from src.shared.constants.cache_keys import USER_CACHE_KEY
 
 # Security scheme para JWT
 security = HTTPBearer()
 
 
 def get_security_service() -> SecurityServiceImpl:
-    return SecurityServiceImpl()
+    return app_security_service
+
+
+def get_user_cache() -> Optional[CacheService]:
+    return user_cache
 
 
-def get_user_repository(db: Session = Depends(get_db)) -> UserRepositoryImpl:
-    return UserRepositoryImpl(db)
+def get_user_repository(
+    db: Session = Depends(get_db),
+    cache: Optional[CacheService] = Depends(get_user_cache)
+) -> UserRepositoryImpl:
+    return UserRepositoryImpl(db, cache=cache)
 
 
 def get_register_user_use_case(
@@ -44,7 +60,8 @@ def get_login_user_use_case(
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     user_repository: UserRepositoryImpl = Depends(get_user_repository),
-    security_service: SecurityServiceImpl = Depends(get_security_service)
+    security_service: SecurityServiceImpl = Depends(get_security_service),
+    cache: Optional[CacheService] = Depends(get_user_cache)
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,8 +76,8 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    # Get user from database
-    user = user_repository.get_by_id(int(user_id))
+    # Get user from cache or database
+    user = _load_user(int(user_id), user_repository, cache)
 
     if user is None:
         raise credentials_exception
@@ -71,9 +88,32 @@ def get_current_user(
             detail="Inactive user"
         )
 
+    tag_request(user_id=user.id)
     return user
 
 
+def _load_user(
+    user_id: int,
+    user_repository: UserRepositoryImpl,
+    cache: Optional[CacheService],
+) -> Optional[User]:
+    if cache is None:
+        return user_repository.get_by_id(user_id)
+
+    cache_key = USER_CACHE_KEY.format(
+        user_id=user_id, version=version_store.user_version(user_id)
+    )
+    user = cache.get(cache_key)
+    if user is None:
+        user = user_repository.get_by_id(user_id)
+        if user is None:
+            return None
+        cache.set(cache_key, user)
+
+    # Callers get their own copy so the cached entity stays untouched
+    return replace(user)
+
+
 def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -83,3 +123,14 @@ def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+
+def get_current_admin_user(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator access required"
+        )
+    return current_user
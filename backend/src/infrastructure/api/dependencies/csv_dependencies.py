@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from src.infrastructure.cache.caches import response_cache
 from src.infrastructure.database.connection import get_db
 from src.infrastructure.database.repositories.movie_repository_impl import (
     MovieRepositoryImpl
@@ -14,7 +15,7 @@ def get_movie_repository_for_csv(
     db: Session = Depends(get_db)
 ) -> MovieRepositoryImpl:
     """Get movie repository instance for CSV operations."""
-    return MovieRepositoryImpl(db)
+    return MovieRepositoryImpl(db, cache=response_cache)
 
 
 def get_import_movies_csv_use_case(
@@ -23,4 +24,4 @@ def get_import_movies_csv_use_case(
     )
 ) -> ImportMoviesCsvUseCase:
     """Get import movies CSV use case instance."""
-    return ImportMoviesCsvUseCase(movie_repository)
+    return ImportMoviesCsvUseCase(movie_repository, cache=response_cache)
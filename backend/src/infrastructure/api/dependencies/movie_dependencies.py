@@ -1,6 +1,10 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from src.infrastructure.cache.caches import (
+    response_cache,
+    recommendation_cache
+)
 from src.infrastructure.database.connection import get_db
 from src.infrastructure.database.repositories\
     .movie_repository_impl import MovieRepositoryImpl
@@ -18,7 +22,7 @@ from src.application.use_cases.recommendations\
 
 def get_movie_repository(db: Session = Depends(get_db)) -> MovieRepositoryImpl:
     """Get movie repository instance."""
-    return MovieRepositoryImpl(db)
+    return MovieRepositoryImpl(db, cache=response_cache)
 
 
 def get_like_repository(db: Session = Depends(get_db)) -> LikeRepositoryImpl:
@@ -31,14 +35,16 @@ def get_movies_use_case(
     like_repository: LikeRepositoryImpl = Depends(get_like_repository)
 ) -> GetMoviesUseCase:
     """Get movies use case instance."""
-    return GetMoviesUseCase(movie_repository, like_repository)
+    return GetMoviesUseCase(
+        movie_repository, like_repository, cache=response_cache
+    )
 
 
 def get_popular_movies_use_case(
     movie_repository: MovieRepositoryImpl = Depends(get_movie_repository)
 ) -> GetPopularMoviesUseCase:
     """Get popular movies use case instance."""
-    return GetPopularMoviesUseCase(movie_repository)
+    return GetPopularMoviesUseCase(movie_repository, cache=response_cache)
 
 
 def get_like_movie_use_case(
@@ -46,7 +52,11 @@ def get_like_movie_use_case(
     movie_repository: MovieRepositoryImpl = Depends(get_movie_repository)
 ) -> LikeMovieUseCase:
     """Get like movie use case instance."""
-    return LikeMovieUseCase(like_repository, movie_repository)
+    return LikeMovieUseCase(
+        like_repository,
+        movie_repository,
+        recommendation_cache=recommendation_cache
+    )
 
 
 def get_recommendations_use_case(
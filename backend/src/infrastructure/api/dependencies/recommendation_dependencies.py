@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from src.infrastructure.cache.caches import recommendation_cache
 from src.infrastructure.database.connection import get_db
 from src.infrastructure.database.repositories\
     .user_repository_impl import UserRepositoryImpl
@@ -30,7 +31,8 @@ def get_recommendation_service(
     return RecommendationServiceImpl(
         db_session=db,
         user_repository=user_repository,
-        default_algorithm=RecommendationAlgorithm.COLLABORATIVE
+        default_algorithm=RecommendationAlgorithm.COLLABORATIVE,
+        cache=recommendation_cache
     )
 
 
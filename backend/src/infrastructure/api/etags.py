@@ -0,0 +1,37 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def make_weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values a response depends on."""
+    raw = "|".join(str(part) for part in parts)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of If-None-Match against the current ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    current = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == current:
+            return True
+    return False
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    # Authenticated content: clients may store it but must revalidate
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_etag(response, etag)
+    return response
@@ -1,6 +1,8 @@
 from contextlib import asynccontextmanager
+from typing import List
 
-from fastapi import FastAPI
+import structlog
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.infrastructure.api.controllers.auth_controller import (
@@ -18,8 +20,55 @@ from src.infrastructure.api.controllers.recommendation_controller import (
 from src.infrastructure.api.controllers.csv_controller import (
     router as csv_router
 )
+from src.infrastructure.api.controllers.profiling_controller import (
+    router as profiling_router
+)
+from src.infrastructure.api.middlewares.compression import (
+    CompressionMiddleware
+)
+from src.infrastructure.api.middlewares.metrics import MetricsMiddleware
+from src.infrastructure.api.middlewares.query_accounting import (
+    QueryAccountingMiddleware
+)
+from src.infrastructure.api.middlewares.rate_limit import (
+    RateLimitMiddleware,
+    RateLimitRule
+)
+from src.infrastructure.api.middlewares.slow_request_log import (
+    SlowRequestLogMiddleware
+)
+from src.infrastructure.api.middlewares.slow_request_profiling import (
+    SlowRequestProfilingMiddleware
+)
+from src.infrastructure.api.middlewares.stage_timing import (
+    StageTimingMiddleware
+)
+from src.infrastructure.cache.caches import cache_stats
 from src.infrastructure.config.settings import settings
-from src.infrastructure.config.logging import configure_logging
+from src.infrastructure.config.logging import (
+    configure_logging,
+    stop_logging
+)
+from src.infrastructure.database.connection import engine
+from src.infrastructure.metrics import CONTENT_TYPE
+from src.infrastructure.metrics.database import instrument_engine
+from src.infrastructure.metrics.instruments import (
+    http_metrics,
+    metrics_registry
+)
+from src.infrastructure.metrics.slow_log import slow_log
+from src.infrastructure.rate_limiting.factory import (
+    create_token_bucket_store
+)
+from src.infrastructure.external.password_hasher_pool import (
+    password_hasher_pool
+)
+from src.infrastructure.external.recommendation_engine import (
+    recommendation_engine
+)
+from src.infrastructure.external.security_service_impl import (
+    security_service
+)
 
 
 @asynccontextmanager
@@ -27,11 +76,85 @@ async def lifespan(app: FastAPI):
     """Context manager to manage application lifecycle."""
     # Startup
     configure_logging()
+    logger = structlog.get_logger(__name__)
+    password_hasher_pool.start()
+    if _slow_log_enabled():
+        slow_log.start(
+            path=settings.slow_log_path,
+            query_threshold=settings.slow_query_threshold_seconds,
+        )
+    if settings.password_hash_self_test_enabled:
+        _log_hash_cost(logger)
+    if settings.recommendation_warm_up_enabled:
+        recommendation_engine.start_warm_up()
 
     yield
 
     # Shutdown
-    pass
+    password_hasher_pool.shutdown()
+    slow_log.close()
+    for name, stats in cache_stats().items():
+        logger.info(
+            "cache_stats",
+            cache=name,
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_ratio=round(stats.hit_ratio, 3),
+            evictions=stats.evictions,
+            size=stats.size,
+        )
+    stop_logging()
+
+
+def _slow_log_enabled() -> bool:
+    return (
+        settings.slow_request_threshold_seconds is not None
+        or settings.slow_query_threshold_seconds is not None
+    )
+
+
+def _log_hash_cost(logger) -> None:
+    report = security_service.self_test()
+    log = logger.info if report.within_budget else logger.warning
+    log(
+        "password_hash_cost",
+        bcrypt_rounds=report.rounds,
+        cost_ms=round(report.cost_ms, 1),
+        budget_ms=report.budget_ms,
+        suggested_rounds=report.suggested_rounds,
+    )
+
+
+def create_rate_limit_rules() -> List[RateLimitRule]:
+    """Route groups and their limits; the first matching rule applies."""
+    auth_prefix = f"{settings.api_v1_str}/auth"
+    return [
+        RateLimitRule(
+            name="login",
+            path_prefix=f"{auth_prefix}/login",
+            methods=("POST",),
+            capacity=settings.rate_limit_login_burst,
+            per_minute=settings.rate_limit_login_per_minute,
+            identifier_field="username",
+            identifier_capacity=settings.rate_limit_login_identifier_burst,
+            identifier_per_minute=(
+                settings.rate_limit_login_identifier_per_minute
+            ),
+        ),
+        RateLimitRule(
+            name="register",
+            path_prefix=f"{auth_prefix}/register",
+            methods=("POST",),
+            capacity=settings.rate_limit_register_burst,
+            per_minute=settings.rate_limit_register_per_minute,
+        ),
+        RateLimitRule(
+            name="api",
+            path_prefix=settings.api_v1_str,
+            capacity=settings.rate_limit_api_burst,
+            per_minute=settings.rate_limit_api_per_minute,
+        ),
+    ]
 
 
 def create_application() -> FastAPI:
@@ -45,15 +168,85 @@ def create_application() -> FastAPI:
         lifespan=lifespan
     )
 
-    # Configure CORS
+    # Configure response compression
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_min_size,
+            content_types=settings.compression_content_types,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+            enable_brotli=settings.compression_brotli_enabled,
+        )
+
+    # Configure rate limiting. Middleware added later wraps it, so it runs
+    # inside CORS (browsers can read its 429s) and metrics (rejections are
+    # counted); only compression runs after it
+    if settings.rate_limit_enabled:
+        app.add_middleware(
+            RateLimitMiddleware,
+            rules=create_rate_limit_rules(),
+            store=create_token_bucket_store(),
+            trust_forwarded_for=settings.rate_limit_trust_forwarded_for,
+        )
+
+    # Configure CORS (around the rate limiter, so browsers can read its
+    # 429 responses)
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"] if settings.debug else [],
+        allow_origins=(
+            (["*"] if settings.debug else [])
+            if settings.cors_allow_origins is None
+            else settings.cors_allow_origins
+        ),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+    # Configure metrics (added late so it also sees rejected requests)
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware, metrics=http_metrics)
+
+    # Configure profiling of slow requests
+    if settings.profiling_slow_request_threshold_seconds is not None:
+        app.add_middleware(
+            SlowRequestProfilingMiddleware,
+            threshold=settings.profiling_slow_request_threshold_seconds,
+            interval=settings.profiling_interval_seconds,
+        )
+
+    # Configure stage timing of a sample of requests
+    if settings.stage_timing_sample_rate > 0:
+        app.add_middleware(
+            StageTimingMiddleware,
+            sample_rate=settings.stage_timing_sample_rate,
+            expose_headers=(
+                settings.debug
+                if settings.stage_timing_headers_enabled is None
+                else settings.stage_timing_headers_enabled
+            ),
+        )
+
+    # Configure the slow request log
+    if settings.slow_request_threshold_seconds is not None:
+        app.add_middleware(
+            SlowRequestLogMiddleware,
+            threshold=settings.slow_request_threshold_seconds,
+        )
+
+    # Configure SQL query accounting, around everything else
+    instrument_engine(engine)
+    app.add_middleware(
+        QueryAccountingMiddleware,
+        n_plus_one_threshold=settings.query_n_plus_one_threshold,
+        expose_headers=(
+            settings.debug
+            if settings.query_headers_enabled is None
+            else settings.query_headers_enabled
+        ),
+    )
+
     # Include API routers
     app.include_router(
         router=auth_router,
@@ -85,6 +278,13 @@ def create_application() -> FastAPI:
         tags=["CSV Import"]
     )
 
+    if settings.profiling_enabled:
+        app.include_router(
+            router=profiling_router,
+            prefix=f"{settings.api_v1_str}/admin",
+            tags=["Administration"]
+        )
+
     # Health check endpoint
     @app.get(path="/health")
     def health_check():
@@ -94,6 +294,16 @@ def create_application() -> FastAPI:
             "version": "2.0.0"
         }
 
+    if settings.metrics_enabled:
+        @app.get(path=settings.metrics_path, include_in_schema=False)
+        def metrics():
+            return Response(
+                content=metrics_registry.render(),
+                media_type=CONTENT_TYPE
+            )
+
+        http_metrics.register_routes(app.routes)
+
     return app
 
 
@@ -0,0 +1,57 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.database import current_queries
+from src.infrastructure.metrics.instruments import (
+    UNMATCHED_ROUTE,
+    HttpMetrics
+)
+
+
+class MetricsMiddleware:
+    """
+    Record latency, status and SQL usage of every HTTP request.
+
+    Requests are labelled with the template of the route they matched
+    (e.g. /api/v1/movies/{movie_id}) rather than their path, which keeps
+    the number of series bounded; requests that matched no route,
+    including those rejected before routing, are labelled "unmatched".
+    SQL usage is read from an enclosing QueryAccountingMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: HttpMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = self.metrics.requests_in_flight
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - start
+            in_flight.dec()
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status,
+                duration,
+                current_queries(),
+            )
+            self.metrics.registry.maybe_collect()
@@ -0,0 +1,64 @@
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.database import track_queries
+
+logger = structlog.get_logger(__name__)
+
+
+class QueryAccountingMiddleware:
+    """
+    Count the SQL statements and time spent on them by each request.
+
+    The counts are added to log events emitted while serving the request
+    and, with `expose_headers`, to the response as X-DB-Queries and
+    X-DB-Time-Ms. A statement shape executed `n_plus_one_threshold`
+    times or more by one request is logged as a likely N+1 query.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        n_plus_one_threshold: int = 10,
+        expose_headers: bool = False,
+    ):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Queries"] = str(queries.count)
+                    headers["X-DB-Time-Ms"] = f"{queries.seconds * 1000:.1f}"
+                await send(message)
+
+            await self.app(
+                scope,
+                receive,
+                send_with_headers if self.expose_headers else send
+            )
+
+        if self.n_plus_one_threshold > 0:
+            self._warn_repeated(scope, queries)
+
+    def _warn_repeated(self, scope: Scope, queries) -> None:
+        route = scope.get("route")
+        for statement, executions in queries.repeated(
+            self.n_plus_one_threshold
+        ):
+            logger.warning(
+                "n_plus_one_query",
+                method=scope["method"],
+                route=getattr(route, "path", scope["path"]),
+                statement=statement,
+                executions=executions,
+                db_queries=queries.count,
+            )
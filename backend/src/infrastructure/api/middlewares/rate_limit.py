@@ -0,0 +1,171 @@
+import json
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+from urllib.parse import parse_qs
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.rate_limiting.store import TokenBucketStore
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Token bucket limit for one route group.
+
+    Requests are limited per client IP and, when `identifier_field` is
+    set, also per value of that field in the form or JSON body (e.g. the
+    username of a login attempt).
+    """
+    name: str
+    path_prefix: str
+    capacity: int
+    per_minute: float
+    methods: Tuple[str, ...] = ()
+    identifier_field: Optional[str] = None
+    identifier_capacity: Optional[int] = None
+    identifier_per_minute: Optional[float] = None
+
+    def __post_init__(self):
+        if self.capacity < 1 or self.per_minute <= 0:
+            raise ValueError(f"Invalid rate limit for {self.name}")
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods and method not in self.methods:
+            return False
+        return path.startswith(self.path_prefix)
+
+
+class RateLimitMiddleware:
+    """
+    Reject requests over their route group's limit with 429.
+
+    Runs before routing, so limited requests never reach the database or
+    the password hasher. The first matching rule applies.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: Sequence[RateLimitRule],
+        store: TokenBucketStore,
+        trust_forwarded_for: bool = False,
+        max_body_size: int = 16_384,
+    ):
+        self.app = app
+        self.rules = tuple(rules)
+        self.store = store
+        self.trust_forwarded_for = trust_forwarded_for
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._match_rule(scope)
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        allowed, retry_after = self.store.consume(
+            f"{rule.name}:ip:{self._client_ip(scope, headers)}",
+            rule.capacity,
+            rule.per_minute / 60,
+        )
+
+        if allowed and rule.identifier_field:
+            body, receive = await self._buffer_body(receive)
+            identifier = _extract_identifier(
+                body, headers.get("content-type", ""), rule.identifier_field
+            )
+            if identifier:
+                allowed, retry_after = self.store.consume(
+                    f"{rule.name}:id:{identifier.lower()}",
+                    rule.identifier_capacity or rule.capacity,
+                    (rule.identifier_per_minute or rule.per_minute) / 60,
+                )
+
+        if not allowed:
+            response = JSONResponse(
+                {"detail": "Too many requests"},
+                status_code=429,
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+    def _match_rule(self, scope: Scope) -> Optional[RateLimitRule]:
+        for rule in self.rules:
+            if rule.matches(scope["method"], scope["path"]):
+                return rule
+        return None
+
+    def _client_ip(self, scope: Scope, headers: Headers) -> str:
+        if self.trust_forwarded_for:
+            forwarded_for = headers.get("x-forwarded-for")
+            if forwarded_for:
+                return forwarded_for.split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def _buffer_body(
+        self,
+        receive: Receive,
+    ) -> Tuple[Optional[bytes], Receive]:
+        """
+        Read the request body so it can be inspected, and return a receive
+        callable that replays it to the application. Bodies larger than
+        `max_body_size` are replayed but not inspected.
+        """
+        messages = []
+        body = b""
+        complete = False
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                complete = True
+                break
+            if len(body) > self.max_body_size:
+                break
+
+        async def replay() -> Message:
+            if messages:
+                return messages.pop(0)
+            return await receive()
+
+        return (body if complete else None), replay
+
+
+def _extract_identifier(
+    body: Optional[bytes],
+    content_type: str,
+    field: str,
+) -> Optional[str]:
+    if not body:
+        return None
+
+    content_type = content_type.lower()
+    try:
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            values = parse_qs(body.decode("utf-8")).get(field)
+            value = values[0] if values else None
+        elif content_type.startswith("application/json"):
+            payload = json.loads(body)
+            value = payload.get(field) if isinstance(payload, dict) else None
+        else:
+            return None
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+    return value if isinstance(value, str) and value else None
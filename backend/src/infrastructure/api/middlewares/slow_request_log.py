@@ -0,0 +1,68 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.database import current_queries
+from src.infrastructure.metrics.slow_log import (
+    SlowLog,
+    slow_log,
+    track_request_tags
+)
+
+
+class SlowRequestLogMiddleware:
+    """
+    Log requests taking `threshold` seconds or more to the slow log.
+
+    Each entry has the route, status, total time, SQL queries and time
+    (from an enclosing QueryAccountingMiddleware) and the tags attached
+    while serving the request, such as user_id and algorithm.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        threshold: float,
+        log: SlowLog = slow_log,
+    ):
+        self.app = app
+        self.threshold = threshold
+        self.log = log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        with track_request_tags() as tags:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                duration = time.perf_counter() - start
+                if duration >= self.threshold:
+                    self._write(scope, status, duration, tags)
+
+    def _write(self, scope: Scope, status: int, duration: float, tags):
+        route = scope.get("route")
+        queries = current_queries()
+        self.log.write(
+            "slow_request",
+            method=scope["method"],
+            route=getattr(route, "path", scope["path"]),
+            status=status,
+            duration_ms=round(duration * 1000, 1),
+            db_queries=queries.count if queries else None,
+            db_time_ms=(
+                round(queries.seconds * 1000, 1) if queries else None
+            ),
+            **tags,
+        )
@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import structlog
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.metrics.profiler import SamplingProfiler, profiler
+
+logger = structlog.get_logger(__name__)
+
+# Stacks logged per slow request, most sampled first
+LOGGED_STACKS = 20
+
+
+class SlowRequestProfilingMiddleware:
+    """
+    Profile requests still running after `threshold` seconds.
+
+    Sampling starts once a request crosses the threshold and stops when
+    it completes; its most sampled stacks are then logged as
+    "slow_request_profile". Requests that finish in time cost one timer.
+    The profiler samples the whole process, so stacks of requests served
+    concurrently show up too, and only one request (or admin profile) is
+    profiled at a time.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        threshold: float,
+        interval: float = 0.005,
+        sampling_profiler: SamplingProfiler = profiler,
+    ):
+        self.app = app
+        self.threshold = threshold
+        self.interval = interval
+        self.profiler = sampling_profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profiling = False
+
+        def start_profiling() -> None:
+            nonlocal profiling
+            profiling = self.profiler.start(self.interval)
+
+        start = time.perf_counter()
+        timer = asyncio.get_running_loop().call_later(
+            self.threshold, start_profiling
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            timer.cancel()
+            if profiling:
+                profile = self.profiler.stop()
+                route = scope.get("route")
+                logger.warning(
+                    "slow_request_profile",
+                    method=scope["method"],
+                    route=getattr(route, "path", scope["path"]),
+                    duration_ms=round(
+                        (time.perf_counter() - start) * 1000, 1
+                    ),
+                    mode=profile.mode,
+                    samples=profile.samples,
+                    stacks=profile.collapsed(LOGGED_STACKS),
+                )
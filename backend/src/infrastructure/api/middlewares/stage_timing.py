@@ -0,0 +1,72 @@
+import random
+import time
+from typing import Callable
+
+import structlog
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.metrics.spans import StageTimings, time_stages
+
+logger = structlog.get_logger(__name__)
+
+
+class StageTimingMiddleware:
+    """
+    Time the stages (span() blocks) of a sample of requests.
+
+    A `sample_rate` fraction of requests is timed; the others skip the
+    bookkeeping. Sampled requests that ran any stage are logged as
+    "request_stages" and, with `expose_headers`, report their stages in
+    a Server-Timing header.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 0.01,
+        expose_headers: bool = False,
+        sampler: Callable[[], float] = random.random,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.expose_headers = expose_headers
+        self.sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or self.sampler() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        with time_stages() as timings:
+            async def send_with_headers(message: Message) -> None:
+                if (message["type"] == "http.response.start"
+                        and timings.stages):
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timings.server_timing())
+                await send(message)
+
+            await self.app(
+                scope,
+                receive,
+                send_with_headers if self.expose_headers else send
+            )
+
+        if timings.stages:
+            self._log(scope, timings, time.perf_counter() - start)
+
+    def _log(
+        self,
+        scope: Scope,
+        timings: StageTimings,
+        seconds: float
+    ) -> None:
+        route = scope.get("route")
+        logger.info(
+            "request_stages",
+            method=scope["method"],
+            route=getattr(route, "path", scope["path"]),
+            duration_ms=round(seconds * 1000, 2),
+            stages=timings.as_milliseconds(),
+        )
@@ -0,0 +1,32 @@
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered directly by pydantic-core.
+
+    Endpoints return it with the DTO itself, which skips FastAPI's
+    response_model re-validation and jsonable_encoder pass. The
+    response_model on the route is kept for the OpenAPI schema.
+    `include` follows pydantic's include syntax to send sparse fields.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        include: Optional[dict] = None,
+        **kwargs: Any,
+    ):
+        # Must be set before JSONResponse.__init__ calls render
+        self.include = include
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(
+                include=self.include
+            ).encode("utf-8")
+        return super().render(content)
@@ -0,0 +1,39 @@
+from typing import Optional, Set
+
+from fastapi import HTTPException, status
+
+from src.application.dtos.movie_dto import (
+    MovieListResponseDTO,
+    MovieResponseDTO
+)
+
+FIELDS_QUERY_DESCRIPTION = (
+    "Comma-separated movie fields to return, e.g. id,title,poster_path"
+)
+
+
+def parse_movie_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Parse the ?fields= parameter, rejecting unknown movie fields."""
+    if not fields or not fields.strip():
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(MovieResponseDTO.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested
+
+
+def movie_list_include(fields: Optional[Set[str]]) -> Optional[dict]:
+    """Build a pydantic include that keeps pagination and trims movies."""
+    if fields is None:
+        return None
+
+    include = {
+        name: True for name in MovieListResponseDTO.model_fields
+    }
+    include["movies"] = {"__all__": fields}
+    return include
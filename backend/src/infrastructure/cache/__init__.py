@@ -0,0 +1,12 @@
+"""Cache package."""
+
+from .memory_cache import InMemoryCacheService, CacheStats
+from .factory import create_cache_service
+from .versioned_cache import VersionedCacheService
+
+__all__ = [
+    "InMemoryCacheService",
+    "CacheStats",
+    "create_cache_service",
+    "VersionedCacheService",
+]
@@ -0,0 +1,73 @@
+"""Application-scoped cache instances."""
+
+from typing import Dict, Optional
+
+from src.application.services.cache_service import CacheService
+from src.infrastructure.cache.factory import create_cache_service
+from src.infrastructure.cache.memory_cache import CacheStats
+from src.infrastructure.cache.versioned_cache import VersionedCacheService
+from src.infrastructure.cache.versions import version_store
+from src.infrastructure.config.settings import settings
+
+# User-independent movie pages (listing and popular), keyed by catalog
+# version so writes in any worker process invalidate them
+response_cache: Optional[CacheService] = (
+    VersionedCacheService(
+        create_cache_service(
+            max_entries=settings.response_cache_max_entries,
+            default_ttl=settings.response_cache_ttl_seconds,
+        ),
+        version=version_store.catalog_version,
+    )
+    if settings.response_cache_enabled
+    else None
+)
+
+# Full ranked recommendation lists per (user, algorithm), bounded by the
+# total number of stored movie IDs
+recommendation_cache: Optional[CacheService] = (
+    create_cache_service(
+        max_entries=settings.recommendation_cache_max_entries,
+        default_ttl=settings.recommendation_cache_ttl_seconds,
+        max_weight=settings.recommendation_cache_max_ids,
+        weigher=lambda ranked: len(ranked.movie_ids) + 1,
+    )
+    if settings.recommendation_cache_enabled
+    else None
+)
+
+# Authenticated users by id, so token-authenticated requests skip the
+# user lookup
+user_cache: Optional[CacheService] = (
+    create_cache_service(
+        max_entries=settings.user_cache_max_entries,
+        default_ttl=settings.user_cache_ttl_seconds,
+    )
+    if settings.user_cache_enabled
+    else None
+)
+
+# Verified access tokens -> (subject, exp); entries expire with the token
+token_cache: Optional[CacheService] = (
+    create_cache_service(
+        max_entries=settings.token_cache_max_entries,
+        default_ttl=settings.token_cache_max_ttl_seconds,
+    )
+    if settings.token_cache_enabled
+    else None
+)
+
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """Statistics of the enabled caches that expose them."""
+    caches = {
+        "response": response_cache,
+        "recommendation": recommendation_cache,
+        "user": user_cache,
+        "token": token_cache,
+    }
+    return {
+        name: cache.stats()
+        for name, cache in caches.items()
+        if cache is not None and hasattr(cache, "stats")
+    }
@@ -0,0 +1,31 @@
+from typing import Any, Callable, Optional
+
+from src.application.services.cache_service import CacheService
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+from src.infrastructure.config.settings import settings
+
+
+def create_cache_service(
+    max_entries: int,
+    default_ttl: Optional[float],
+    max_weight: Optional[int] = None,
+    weigher: Optional[Callable[[Any], int]] = None,
+    backend: Optional[str] = None,
+) -> CacheService:
+    """
+    Create a cache for the configured backend.
+
+    Shared backends (e.g. Redis) plug in here by implementing
+    CacheService; callers only depend on the interface.
+    """
+    backend = (backend or settings.cache_backend).lower()
+
+    if backend == "memory":
+        return InMemoryCacheService(
+            max_entries=max_entries,
+            default_ttl=default_ttl,
+            max_weight=max_weight,
+            weigher=weigher,
+        )
+
+    raise ValueError(f"Unsupported cache backend: {backend}")
@@ -0,0 +1,133 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from src.application.services.cache_service import CacheService
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    weight: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class InMemoryCacheService(CacheService):
+    """
+    Thread-safe in-process LRU cache with per-entry TTL.
+
+    Entries are evicted in least-recently-used order when either
+    `max_entries` or, if a `weigher` is given, `max_weight` is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: Optional[float] = 60.0,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[Any], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self._clock = clock
+        # key -> (value, expires_at, weight)
+        self._entries: OrderedDict = OrderedDict()
+        self._weight = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= self._clock():
+                self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+        weight = self.weigher(value) if self.weigher else 1
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # Values heavier than the whole budget are never cached
+            if self.max_weight is not None and weight > self.max_weight:
+                return
+
+            self._entries[key] = (value, expires_at, weight)
+            self._weight += weight
+            self._evict()
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weight = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                weight=self._weight,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, _, weight = self._entries.pop(key)
+        self._weight -= weight
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (
+                self.max_weight is not None
+                and self._weight > self.max_weight
+            )
+        ):
+            _, (_, _, weight) = self._entries.popitem(last=False)
+            self._weight -= weight
+            self._evictions += 1
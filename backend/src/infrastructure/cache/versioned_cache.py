@@ -0,0 +1,40 @@
+from typing import Any, Callable, Optional
+
+from src.application.services.cache_service import CacheService
+
+
+class VersionedCacheService(CacheService):
+    """
+    Cache whose keys are namespaced by a data version.
+
+    Bumping the version (e.g. the catalog version) makes every entry
+    unreachable in all processes sharing the version store, without
+    cross-process invalidation; stale entries age out of the wrapped
+    cache. delete and delete_prefix act on the current version only.
+    """
+
+    def __init__(self, cache: CacheService, version: Callable[[], int]):
+        self.cache = cache
+        self._version = version
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.cache.get(self._key(key))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.cache.set(self._key(key), value, ttl)
+
+    def delete(self, key: str) -> bool:
+        return self.cache.delete(self._key(key))
+
+    def delete_prefix(self, prefix: str) -> int:
+        return self.cache.delete_prefix(self._key(prefix))
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose extras of the wrapped cache, such as stats()
+        return getattr(self.cache, name)
+
+    def _key(self, key: str) -> str:
+        return f"v{self._version()}:{key}"
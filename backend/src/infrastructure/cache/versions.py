@@ -0,0 +1,95 @@
+import multiprocessing
+import threading
+import uuid
+import zlib
+from typing import Dict, Optional, Sequence
+
+CATALOG_VERSION_KEY = "catalog"
+LIKES_VERSION_KEY = "likes"
+USER_LIKES_VERSION_KEY = "likes:{user_id}"
+USER_VERSION_KEY = "user:{user_id}"
+
+
+class VersionStore:
+    """
+    Monotonic in-process version counters.
+
+    Counters are bumped by repositories on writes and combined into HTTP
+    validators, so a validator only matches while the data behind it is
+    unchanged. The epoch changes on every process start, which keeps
+    validators issued before a restart from matching fresh counters.
+
+    Calling share() before forking worker processes moves the counters
+    into shared memory, so a write in one worker invalidates validators
+    and cache keys in all of them. Keys are hashed into a fixed number
+    of slots; keys sharing a slot bump each other, which only causes
+    extra invalidations.
+    """
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:12]
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Shared uint64 counters once share() has been called
+        self._slots: Optional[Sequence[int]] = None
+
+    @property
+    def shared(self) -> bool:
+        return self._slots is not None
+
+    def share(self, slots: int = 65536) -> None:
+        """Move the counters to memory inherited by forked children."""
+        if self._slots is not None:
+            return
+        context = multiprocessing.get_context("fork")
+        shared_slots = context.RawArray("Q", slots)
+        for key, version in self._versions.items():
+            index = self._slot(key, slots)
+            shared_slots[index] = max(shared_slots[index], version)
+        self._lock = context.Lock()
+        self._slots = shared_slots
+
+    def get(self, key: str) -> int:
+        if self._slots is not None:
+            return self._slots[self._slot(key, len(self._slots))]
+        return self._versions.get(key, 0)
+
+    def bump(self, key: str) -> int:
+        with self._lock:
+            if self._slots is not None:
+                index = self._slot(key, len(self._slots))
+                self._slots[index] += 1
+                return self._slots[index]
+            version = self._versions.get(key, 0) + 1
+            self._versions[key] = version
+            return version
+
+    def catalog_version(self) -> int:
+        return self.get(CATALOG_VERSION_KEY)
+
+    def likes_version(self) -> int:
+        return self.get(LIKES_VERSION_KEY)
+
+    def user_likes_version(self, user_id: int) -> int:
+        return self.get(USER_LIKES_VERSION_KEY.format(user_id=user_id))
+
+    def user_version(self, user_id: int) -> int:
+        return self.get(USER_VERSION_KEY.format(user_id=user_id))
+
+    def bump_catalog(self) -> None:
+        self.bump(CATALOG_VERSION_KEY)
+
+    def bump_likes(self, user_id: int) -> None:
+        self.bump(LIKES_VERSION_KEY)
+        self.bump(USER_LIKES_VERSION_KEY.format(user_id=user_id))
+
+    def bump_user(self, user_id: int) -> None:
+        self.bump(USER_VERSION_KEY.format(user_id=user_id))
+
+    @staticmethod
+    def _slot(key: str, slots: int) -> int:
+        return zlib.crc32(key.encode()) % slots
+
+
+# Global instance of version store
+version_store = VersionStore()
@@ -1,37 +1,120 @@
+import atexit
 import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, List, Optional, TextIO
 
 import structlog
 from rich.console import Console
 from rich.logging import RichHandler
 
 from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics.database import current_queries
 
 
-def configure_logging() -> None:
-    console = Console()
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler for a queue in this process.
+
+    Records are queued as they are, leaving all formatting (and rich
+    tracebacks) to the writer thread, and dropped (and counted) when the
+    queue is full instead of blocking or failing the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+
+    def enqueue_sentinel(self) -> None:
+        # Waits for room rather than failing on a full queue
+        self.queue.put(self._sentinel)
+
+
+# The handler requests log through and the thread writing what it queues
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+# Writer of the listener stopped while the process forks
+_stopped_handler: Optional[logging.Handler] = None
+
+
+def add_query_stats(logger, method_name: str, event_dict: dict) -> dict:
+    """Add the SQL usage so far of the request being served, if any."""
+    queries = current_queries()
+    if queries is not None:
+        event_dict.setdefault("db_queries", queries.count)
+        event_dict.setdefault(
+            "db_time_ms", round(queries.seconds * 1000, 1)
+        )
+    return event_dict
+
+
+def capture_exc_info(logger, method_name: str, event_dict: dict) -> dict:
+    """
+    Resolve exc_info=True (logger.exception) to the exception being
+    handled, before the event leaves the thread handling it.
+    """
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def configure_logging(stream: Optional[TextIO] = None) -> None:
+    """
+    Configure structlog and the root logger.
+
+    Events are rendered by the handler's formatter, for the console by
+    rich or as JSON lines written by a plain stream handler (LOG_FORMAT,
+    console in debug and json otherwise); records of standard library
+    loggers (e.g. uvicorn) are rendered the same way. With the log queue
+    enabled, callers only run the cheap processors and enqueue the
+    record, and a background thread renders and writes it.
+    """
+    stop_logging()
+
+    # Processors for events logged through structlog and the standard
+    # library alike
+    shared_processors = [
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        # Add timestamp to log entries
+        structlog.processors.TimeStamper(fmt="iso"),
+    ]
+
+    handler = _create_handler(stream, shared_processors)
+    if settings.log_queue_enabled:
+        global _queue_handler
+        _queue_handler = DroppingQueueHandler(
+            queue.Queue(settings.log_queue_max_size)
+        )
+        _start_listener(handler)
+        handler = _queue_handler
 
     logging.basicConfig(
         level=getattr(logging, settings.log_level.upper()),
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[
-            RichHandler(
-                console=console,
-                rich_tracebacks=True,
-                show_path=settings.debug,
-                show_time=True,
-            )
-        ],
+        handlers=[handler],
+        force=True,
     )
 
     structlog.configure(
         processors=[
-            # Add timestamp to log entries
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(colors=True) if settings.debug
-            else structlog.processors.JSONRenderer(),
+            *shared_processors,
+            add_query_stats,
+            capture_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -40,5 +123,102 @@ def configure_logging() -> None:
     )
 
 
+def stop_logging() -> None:
+    """
+    Write the queued records and stop the log writer thread; records
+    logged afterwards are written synchronously.
+    """
+    global _queue_handler
+    handler = _stop_listener()
+    root = logging.getLogger()
+    if handler is not None and _queue_handler in root.handlers:
+        root.removeHandler(_queue_handler)
+        root.addHandler(handler)
+    _queue_handler = None
+
+
+def log_format() -> str:
+    """The configured log format, following debug when unset."""
+    if settings.log_format is not None:
+        return settings.log_format
+    return "console" if settings.debug else "json"
+
+
+def _create_handler(
+    stream: Optional[TextIO],
+    shared_processors: List[Callable]
+) -> logging.Handler:
+    if log_format() == "console":
+        handler = RichHandler(
+            console=Console(file=stream),
+            rich_tracebacks=True,
+            show_path=settings.debug,
+            show_time=True,
+            log_time_format="[%X]",
+        )
+        renderers = [structlog.dev.ConsoleRenderer(colors=True)]
+    else:
+        # Plain writes; rich console rendering is too slow for production
+        handler = logging.StreamHandler(stream or sys.stderr)
+        renderers = [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(),
+        ]
+
+    handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=shared_processors,
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            *renderers,
+        ],
+    ))
+    return handler
+
+
+def _start_listener(handler: logging.Handler) -> None:
+    global _listener
+    _listener = _Listener(
+        _queue_handler.queue, handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def _stop_listener() -> Optional[logging.Handler]:
+    global _listener
+    if _listener is None:
+        return None
+    _listener.stop()
+    handler = _listener.handlers[0]
+    _listener = None
+    return handler
+
+
+def _before_fork() -> None:
+    # Nothing may hold the queue's lock while the process is copied
+    global _stopped_handler
+    _stopped_handler = _stop_listener()
+
+
+def _after_fork_in_parent() -> None:
+    if _stopped_handler is not None:
+        _start_listener(_stopped_handler)
+
+
+def _after_fork_in_child() -> None:
+    if _stopped_handler is not None:
+        # A fresh queue, as the parent's may have records in flight
+        _queue_handler.queue = queue.Queue(settings.log_queue_max_size)
+        _start_listener(_stopped_handler)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
@@ -1,4 +1,6 @@
 import os
+from typing import List, Literal, Optional
+
 from dotenv import load_dotenv
 from pydantic import Field, ConfigDict
 from pydantic_settings import BaseSettings
@@ -30,6 +32,41 @@ class Settings(BaseSettings):
         description="Token expiration time in minutes"
     )
 
+    # Password hashing
+    password_hash_pool_enabled: bool = Field(
+        default=True,
+        description="Hash passwords in a dedicated process pool"
+    )
+    password_hash_workers: Optional[int] = Field(
+        default=None,
+        description="Password hashing processes (defaults to CPU count)"
+    )
+    password_hash_max_queue: int = Field(
+        default=32,
+        description="Hashing operations allowed to wait for a free process"
+    )
+    password_hash_max_in_flight: int = Field(
+        default=16,
+        ge=1,
+        description="Hashing operations admitted at once, running or "
+                    "waiting; each holds a request thread, so keep it "
+                    "below the threadpool size (40)"
+    )
+    bcrypt_rounds: int = Field(
+        default=12,
+        ge=4,
+        le=31,
+        description="bcrypt cost factor (each extra round doubles the cost)"
+    )
+    password_hash_latency_budget_ms: int = Field(
+        default=250,
+        description="Target time to hash one password in milliseconds"
+    )
+    password_hash_self_test_enabled: bool = Field(
+        default=True,
+        description="Measure hash cost against the budget at startup"
+    )
+
     # External APIs
     tmdb_api_key: str = Field(
         default="",
@@ -39,6 +76,273 @@ class Settings(BaseSettings):
     # Application
     debug: bool = Field(default=True, description="Modo debug")
     log_level: str = Field(default="INFO", description="Log level")
+    log_format: Optional[Literal["json", "console"]] = Field(
+        default=None,
+        description="JSON lines, or rich console rendering (defaults to "
+                    "console in debug, json otherwise)"
+    )
+    log_queue_enabled: bool = Field(
+        default=True,
+        description="Write log records from a background thread instead "
+                    "of the thread that logs them"
+    )
+    log_queue_max_size: int = Field(
+        default=10_000,
+        description="Log records allowed to wait for the writer thread; "
+                    "further records are dropped"
+    )
+
+    # Cache
+    cache_backend: str = Field(
+        default="memory",
+        description="Cache backend (memory)"
+    )
+    response_cache_enabled: bool = Field(
+        default=True,
+        description="Cache user-independent movie pages"
+    )
+    response_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Time to live of cached movie pages in seconds"
+    )
+    response_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum number of cached movie pages"
+    )
+    recommendation_cache_enabled: bool = Field(
+        default=True,
+        description="Cache ranked recommendation lists per user"
+    )
+    recommendation_cache_ttl_seconds: int = Field(
+        default=300,
+        description="Time to live of ranked recommendation lists in seconds"
+    )
+    recommendation_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of cached recommendation lists"
+    )
+    recommendation_cache_max_ids: int = Field(
+        default=2_000_000,
+        description="Maximum total movie IDs held by the recommendation cache"
+    )
+    user_cache_enabled: bool = Field(
+        default=True,
+        description="Cache authenticated users between requests"
+    )
+    user_cache_ttl_seconds: int = Field(
+        default=30,
+        description="Time to live of cached users (bounds staleness across "
+                    "workers)"
+    )
+    user_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of cached users"
+    )
+    token_cache_enabled: bool = Field(
+        default=True,
+        description="Cache verified access tokens"
+    )
+    token_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of cached access tokens"
+    )
+    token_cache_max_ttl_seconds: int = Field(
+        default=300,
+        description="Upper bound on how long a verified token is cached"
+    )
+
+    # Recommendations
+    recommendation_warm_up_enabled: bool = Field(
+        default=True,
+        description="Build recommendation models in the background at "
+                    "startup"
+    )
+    recommendation_model_max_age_seconds: int = Field(
+        default=300,
+        description="Rebuild models at least this often, to pick up writes "
+                    "from other processes"
+    )
+    recommendation_snapshot_dir: Optional[str] = Field(
+        default=None,
+        description="Directory where models are published for all worker "
+                    "processes to map; models are per process when unset"
+    )
+
+    # Rate limiting
+    rate_limit_enabled: bool = Field(
+        default=True,
+        description="Limit request rates per client"
+    )
+    rate_limit_backend: str = Field(
+        default="memory",
+        description="Token bucket storage backend (memory)"
+    )
+    rate_limit_max_keys: int = Field(
+        default=100_000,
+        description="Maximum number of buckets kept in memory"
+    )
+    rate_limit_trust_forwarded_for: bool = Field(
+        default=False,
+        description="Key clients by X-Forwarded-For (behind a proxy only)"
+    )
+    rate_limit_login_burst: int = Field(
+        default=10,
+        description="Login attempts a client IP may burst"
+    )
+    rate_limit_login_per_minute: float = Field(
+        default=10,
+        description="Sustained login attempts per minute per client IP"
+    )
+    rate_limit_login_identifier_burst: int = Field(
+        default=5,
+        description="Login attempts an account may burst"
+    )
+    rate_limit_login_identifier_per_minute: float = Field(
+        default=5,
+        description="Sustained login attempts per minute per account"
+    )
+    rate_limit_register_burst: int = Field(
+        default=5,
+        description="Registrations a client IP may burst"
+    )
+    rate_limit_register_per_minute: float = Field(
+        default=5,
+        description="Sustained registrations per minute per client IP"
+    )
+    rate_limit_api_burst: int = Field(
+        default=120,
+        description="API requests a client IP may burst"
+    )
+    rate_limit_api_per_minute: float = Field(
+        default=600,
+        description="Sustained API requests per minute per client IP"
+    )
+
+    # Compression
+    compression_enabled: bool = Field(
+        default=True,
+        description="Compress large responses"
+    )
+    compression_min_size: int = Field(
+        default=1024,
+        description="Minimum body size in bytes to compress"
+    )
+    compression_gzip_level: int = Field(
+        default=6,
+        description="Gzip compression level (1-9)"
+    )
+    compression_brotli_enabled: bool = Field(
+        default=True,
+        description="Prefer brotli when the brotli package is installed"
+    )
+    compression_brotli_quality: int = Field(
+        default=4,
+        description="Brotli quality (0-11)"
+    )
+    compression_content_types: List[str] = Field(
+        default=["application/json", "text/csv", "text/plain"],
+        description="Content types eligible for compression"
+    )
+
+    # Metrics
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Record runtime metrics and expose them at metrics_path"
+    )
+    metrics_path: str = Field(
+        default="/metrics",
+        description="Path of the Prometheus metrics endpoint"
+    )
+    metrics_collect_interval_seconds: float = Field(
+        default=5.0,
+        description="How often values kept elsewhere (cache statistics) "
+                    "are copied into metrics"
+    )
+
+    # SQL query accounting
+    query_n_plus_one_threshold: int = Field(
+        default=10,
+        description="Warn when one request executes the same statement "
+                    "this many times (0 disables)"
+    )
+    query_headers_enabled: Optional[bool] = Field(
+        default=None,
+        description="Report SQL queries and time in X-DB-Queries and "
+                    "X-DB-Time-Ms headers (defaults to debug)"
+    )
+
+    # Slow log
+    slow_request_threshold_seconds: Optional[float] = Field(
+        default=1.0,
+        description="Log requests taking at least this long to the slow "
+                    "log (disabled when unset)"
+    )
+    slow_query_threshold_seconds: Optional[float] = Field(
+        default=0.1,
+        description="Log SQL statements taking at least this long to the "
+                    "slow log, with literals and parameters redacted "
+                    "(disabled when unset)"
+    )
+    slow_log_path: Optional[str] = Field(
+        default=None,
+        description="File the slow log is appended to as JSON lines "
+                    "(defaults to stderr)"
+    )
+
+    # Stage timing
+    stage_timing_sample_rate: float = Field(
+        default=0.01,
+        description="Fraction of requests whose stages (likes fetch, "
+                    "similarity, hydration...) are timed and logged"
+    )
+    stage_timing_headers_enabled: Optional[bool] = Field(
+        default=None,
+        description="Report the stages of timed requests in a "
+                    "Server-Timing header (defaults to debug)"
+    )
+
+    # Profiling
+    profiling_enabled: bool = Field(
+        default=True,
+        description="Let admins profile a worker at /api/v1/admin/profile"
+    )
+    profiling_interval_seconds: float = Field(
+        default=0.005,
+        description="Time between stack samples of the profiler"
+    )
+    profiling_max_seconds: float = Field(
+        default=60.0,
+        description="Longest profile an admin may request"
+    )
+    profiling_slow_request_threshold_seconds: Optional[float] = Field(
+        default=None,
+        description="Profile requests still running after this many "
+                    "seconds and log their stacks (disabled when unset)"
+    )
+
+    # Server
+    server_host: str = Field(
+        default="0.0.0.0",
+        description="Address the production server binds to"
+    )
+    server_port: int = Field(
+        default=8000,
+        description="Port the production server binds to"
+    )
+    server_workers: Optional[int] = Field(
+        default=None,
+        description="Worker processes (defaults to CPU count)"
+    )
+    server_graceful_timeout_seconds: int = Field(
+        default=30,
+        description="Time a worker may spend finishing in-flight requests "
+                    "when stopped or replaced"
+    )
+    server_preload_models: bool = Field(
+        default=True,
+        description="Build recommendation models before forking workers so "
+                    "they share them"
+    )
 
     # API
     api_v1_str: str = Field(default="/api/v1", description="API prefix")
@@ -46,6 +350,11 @@ class Settings(BaseSettings):
         default="Rurax - Movie Recommendation System",
         description="Project name",
     )
+    cors_allow_origins: Optional[List[str]] = Field(
+        default=None,
+        description="Origins allowed by CORS (defaults to all in debug, "
+                    "none otherwise)"
+    )
 
     model_config = ConfigDict(
         env_file=".env",
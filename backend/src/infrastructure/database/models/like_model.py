@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import (
+    Column, DateTime, ForeignKey, Index, Integer, UniqueConstraint
+)
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.database.connection import Base
@@ -28,4 +30,8 @@ class LikeModel(Base):
     # Constraint to ensure a user can only like a movie once
     __table_args__ = (
         UniqueConstraint('user_id', 'movie_id', name='unique_user_movie_like'),
+        # A user's likes, newest first (get_by_user)
+        Index('ix_likes_user_id_created_at', 'user_id', 'created_at'),
+        # Like counts per movie (get_popular)
+        Index('ix_likes_movie_id', 'movie_id'),
     )
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.database.connection import Base
@@ -42,6 +42,13 @@ class MovieModel(Base):
         cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Default listing, newest first (get_all)
+        Index('ix_movies_created_at_id', 'created_at', 'id'),
+        # Search results ordering (search)
+        Index('ix_movies_popularity', 'popularity'),
+    )
+
     @property
     def like_count(self) -> int:
         return len(self.likes)
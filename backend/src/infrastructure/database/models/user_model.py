@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, false
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.database.connection import Base
@@ -19,6 +19,10 @@ class UserModel(Base):
     username = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     is_active = Column(Boolean, default=True)
+    # Granted with scripts/grant_admin.py, never through the API
+    is_admin = Column(
+        Boolean, default=False, server_default=false(), nullable=False
+    )
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
@@ -1,4 +1,4 @@
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
@@ -6,12 +6,14 @@ from sqlalchemy import desc
 from src.domain.entities.like import Like
 from src.domain.repositories.like_repository import LikeRepository
 from src.infrastructure.database.models.like_model import LikeModel
+from src.infrastructure.cache.versions import VersionStore, version_store
 
 
 class LikeRepositoryImpl(LikeRepository):
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, versions: VersionStore = version_store):
         self.db = db
+        self.versions = versions
 
     def save(self, like: Like) -> Like:
         if like.id is None:
@@ -24,6 +26,7 @@ class LikeRepositoryImpl(LikeRepository):
             self.db.add(like_model)
             self.db.commit()
             self.db.refresh(like_model)
+            self.versions.bump_likes(like.user_id)
 
             return self._model_to_entity(like_model)
         else:
@@ -38,6 +41,7 @@ class LikeRepositoryImpl(LikeRepository):
 
                 self.db.commit()
                 self.db.refresh(like_model)
+                self.versions.bump_likes(like.user_id)
 
                 return self._model_to_entity(like_model)
 
@@ -54,6 +58,21 @@ class LikeRepositoryImpl(LikeRepository):
             .first()
         return self._model_to_entity(like_model) if like_model else None
 
+    def get_liked_movie_ids(
+        self, user_id: int, movie_ids: List[int]
+    ) -> Set[int]:
+        """Return which of the given movies the user liked, in one query."""
+        if not movie_ids:
+            return set()
+
+        results = self.db.query(LikeModel.movie_id)\
+            .filter(
+                LikeModel.user_id == user_id,
+                LikeModel.movie_id.in_(movie_ids)
+            )\
+            .all()
+        return {result.movie_id for result in results}
+
     def get_by_user(
         self, user_id: int, page: int = 1, per_page: int = 20
     ) -> Tuple[List[Like], int]:
@@ -86,8 +105,10 @@ class LikeRepositoryImpl(LikeRepository):
             .filter(LikeModel.id == like_id)\
             .first()
         if like_model:
+            user_id = like_model.user_id
             self.db.delete(like_model)
             self.db.commit()
+            self.versions.bump_likes(user_id)
             return True
         return False
 
@@ -101,6 +122,7 @@ class LikeRepositoryImpl(LikeRepository):
         if like_model:
             self.db.delete(like_model)
             self.db.commit()
+            self.versions.bump_likes(user_id)
             return True
         return False
 
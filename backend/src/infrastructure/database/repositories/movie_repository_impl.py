@@ -3,16 +3,26 @@ from typing import Optional, List, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func
 
+from src.application.services.cache_service import CacheService
 from src.domain.entities.movie import Movie
 from src.domain.repositories.movie_repository import MovieRepository
 from src.infrastructure.database.models.movie_model import MovieModel
 from src.infrastructure.database.models.like_model import LikeModel
+from src.infrastructure.cache.versions import VersionStore, version_store
+from src.shared.constants.cache_keys import MOVIES_CACHE_PREFIX
 
 
 class MovieRepositoryImpl(MovieRepository):
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        cache: Optional[CacheService] = None,
+        versions: VersionStore = version_store
+    ):
         self.db = db
+        self.cache = cache
+        self.versions = versions
 
     def save(self, movie: Movie) -> Movie:
         if movie.id is None:
@@ -36,6 +46,7 @@ class MovieRepositoryImpl(MovieRepository):
             self.db.add(movie_model)
             self.db.commit()
             self.db.refresh(movie_model)
+            self._on_catalog_changed()
 
             return self._model_to_entity(movie_model)
         else:
@@ -60,6 +71,7 @@ class MovieRepositoryImpl(MovieRepository):
 
                 self.db.commit()
                 self.db.refresh(movie_model)
+                self._on_catalog_changed()
 
                 return self._model_to_entity(movie_model)
 
@@ -98,6 +110,7 @@ class MovieRepositoryImpl(MovieRepository):
         if movie_models:
             self.db.add_all(movie_models)
             self.db.commit()
+            self._on_catalog_changed()
 
         return len(movie_models)
 
@@ -107,6 +120,22 @@ class MovieRepositoryImpl(MovieRepository):
             .first()
         return self._model_to_entity(movie_model) if movie_model else None
 
+    def get_by_ids(self, movie_ids: List[int]) -> List[Movie]:
+        """Get movies by ID in a single query, keeping the given order."""
+        if not movie_ids:
+            return []
+
+        movie_models = self.db.query(MovieModel)\
+            .filter(MovieModel.id.in_(movie_ids))\
+            .all()
+        models_by_id = {model.id: model for model in movie_models}
+
+        return [
+            self._model_to_entity(models_by_id[movie_id])
+            for movie_id in movie_ids
+            if movie_id in models_by_id
+        ]
+
     def get_by_tmdb_id(self, tmdb_id: int) -> Optional[Movie]:
         movie_model = self.db.query(MovieModel)\
             .filter(MovieModel.tmdb_id == tmdb_id)\
@@ -130,9 +159,10 @@ class MovieRepositoryImpl(MovieRepository):
         # Get total count
         total = self.db.query(MovieModel).count()
 
-        # Get movies for current page
+        # Get movies for current page; the id tie-break keeps pages stable
+        # and lets the (created_at, id) index serve the ordering
         movie_models = self.db.query(MovieModel)\
-            .order_by(desc(MovieModel.created_at))\
+            .order_by(desc(MovieModel.created_at), desc(MovieModel.id))\
             .offset(offset)\
             .limit(per_page)\
             .all()
@@ -202,9 +232,16 @@ class MovieRepositoryImpl(MovieRepository):
         if movie_model:
             self.db.delete(movie_model)
             self.db.commit()
+            self._on_catalog_changed()
             return True
         return False
 
+    def _on_catalog_changed(self) -> None:
+        """Bump the catalog version and drop cached movie pages."""
+        self.versions.bump_catalog()
+        if self.cache is not None:
+            self.cache.delete_prefix(MOVIES_CACHE_PREFIX)
+
     def _model_to_entity(self, movie_model: MovieModel) -> Movie:
         return Movie(
             id=movie_model.id,
@@ -1,16 +1,32 @@
-from typing import Optional
+from typing import Optional, Tuple
 
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from src.application.services.cache_service import CacheService
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
 from src.infrastructure.database.models.user_model import UserModel
+from src.infrastructure.cache.versions import VersionStore, version_store
+from src.shared.constants.cache_keys import USER_CACHE_PREFIX
+from src.shared.exceptions.auth_exceptions import (
+    EmailAlreadyExistsException,
+    UsernameAlreadyExistsException
+)
 
 
 class UserRepositoryImpl(UserRepository):
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        cache: Optional[CacheService] = None,
+        versions: VersionStore = version_store
+    ):
         self.db = db
+        self.cache = cache
+        self.versions = versions
 
     def save(self, user: User) -> User:
         if user.id is None:
@@ -20,11 +36,20 @@ class UserRepositoryImpl(UserRepository):
                 username=user.username,
                 hashed_password=user.hashed_password,
                 is_active=user.is_active,
+                is_admin=user.is_admin,
                 created_at=user.created_at,
                 updated_at=user.updated_at
             )
             self.db.add(user_model)
-            self.db.commit()
+            try:
+                self.db.commit()
+            except IntegrityError as e:
+                # Concurrent signup won the race for a unique column
+                self.db.rollback()
+                conflict = self._conflict_from_integrity_error(e)
+                if conflict is None:
+                    raise
+                raise conflict from e
             self.db.refresh(user_model)
 
             # Convert back to entity
@@ -39,10 +64,12 @@ class UserRepositoryImpl(UserRepository):
                 user_model.username = user.username
                 user_model.hashed_password = user.hashed_password
                 user_model.is_active = user.is_active
+                user_model.is_admin = user.is_admin
                 user_model.updated_at = user.updated_at
 
                 self.db.commit()
                 self.db.refresh(user_model)
+                self._on_user_changed(user.id)
 
                 return self._model_to_entity(user_model)
 
@@ -75,6 +102,21 @@ class UserRepositoryImpl(UserRepository):
             .first()
         return self._model_to_entity(user_model) if user_model else None
 
+    def exists_by_email_or_username(
+        self,
+        email: str,
+        username: str,
+    ) -> Tuple[bool, bool]:
+        rows = self.db.query(UserModel.email, UserModel.username)\
+            .filter(
+                or_(UserModel.email == email, UserModel.username == username)
+            )\
+            .limit(2)\
+            .all()
+        email_taken = any(row.email == email for row in rows)
+        username_taken = any(row.username == username for row in rows)
+        return email_taken, username_taken
+
     def delete(self, user_id: int) -> bool:
         user_model = self.db.query(UserModel)\
             .filter(UserModel.id == user_id)\
@@ -82,9 +124,31 @@ class UserRepositoryImpl(UserRepository):
         if user_model:
             self.db.delete(user_model)
             self.db.commit()
+            self._on_user_changed(user_id)
             return True
         return False
 
+    def _on_user_changed(self, user_id: int) -> None:
+        self.versions.bump_user(user_id)
+        if self.cache is not None:
+            self.cache.delete_prefix(USER_CACHE_PREFIX.format(user_id=user_id))
+
+    @staticmethod
+    def _conflict_from_integrity_error(
+        error: IntegrityError,
+    ) -> Optional[Exception]:
+        # Prefer the constraint name (PostgreSQL) over the message text,
+        # which may echo the conflicting value
+        diag = getattr(error.orig, "diag", None)
+        detail = (
+            getattr(diag, "constraint_name", None) or str(error.orig)
+        ).lower()
+        if "username" in detail:
+            return UsernameAlreadyExistsException("Username already exists")
+        if "email" in detail:
+            return EmailAlreadyExistsException("Email already exists")
+        return None
+
     def _model_to_entity(self, user_model: UserModel) -> User:
         return User(
             id=user_model.id,
@@ -92,6 +156,7 @@ class UserRepositoryImpl(UserRepository):
             username=user_model.username,
             hashed_password=user_model.hashed_password,
             is_active=user_model.is_active,
+            is_admin=user_model.is_admin,
             created_at=user_model.created_at,
             updated_at=user_model.updated_at
         )
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional, Type
 from sqlalchemy.orm import Session
 
 from src.application.services.recommendation_service import (
@@ -10,6 +10,12 @@ from src.infrastructure.external.recommendation_strategies import (
     CollaborativeFilteringStrategy,
     ContentBasedStrategy
 )
+from src.infrastructure.external.recommendation_strategies\
+    .collaborative_strategy import InteractionModel
+from src.infrastructure.external.recommendation_strategies\
+    .content_based_strategy import CatalogModel
+from src.infrastructure.external.recommendation_strategies.model_holder \
+    import ModelHolder
 from src.infrastructure.database.repositories.like_repository_impl import (
     LikeRepositoryImpl
 )
@@ -17,14 +23,61 @@ from src.infrastructure.database.repositories.movie_repository_impl import (
     MovieRepositoryImpl
 )
 
+if TYPE_CHECKING:
+    from src.infrastructure.external.recommendation_engine import (
+        RecommendationEngine
+    )
+
+# Strategy classes by algorithm; names and descriptions are class
+# attributes, so describing algorithms constructs no strategy
+STRATEGY_CLASSES: Dict[
+    RecommendationAlgorithm, Type[RecommendationStrategy]
+] = {
+    RecommendationAlgorithm.POPULARITY: PopularityRecommendationStrategy,
+    RecommendationAlgorithm.COLLABORATIVE: CollaborativeFilteringStrategy,
+    RecommendationAlgorithm.CONTENT_BASED: ContentBasedStrategy,
+}
+
+# Models held across requests, by the algorithm that builds them
+MODEL_CLASSES: Dict[RecommendationAlgorithm, type] = {
+    RecommendationAlgorithm.COLLABORATIVE: InteractionModel,
+    RecommendationAlgorithm.CONTENT_BASED: CatalogModel,
+}
+
 
 class RecommendationStrategyFactory:
+    """
+    Builds strategies bound to one database session, on demand.
+
+    Strategies are cheap per-request objects; the models they compute
+    are kept in the engine's model holders so they outlive the request.
+    Without an engine each strategy keeps its own, request-local model.
+    """
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        engine: Optional["RecommendationEngine"] = None
+    ):
         self.db_session = db_session
+        self.engine = engine
         self.like_repository = LikeRepositoryImpl(db_session)
         self.movie_repository = MovieRepositoryImpl(db_session)
 
+    @staticmethod
+    def supports(algorithm: RecommendationAlgorithm) -> bool:
+        return algorithm in STRATEGY_CLASSES
+
+    @staticmethod
+    def describe_algorithms() -> Dict[str, Dict[str, str]]:
+        return {
+            algorithm.value: {
+                "name": strategy_class.NAME,
+                "description": strategy_class.DESCRIPTION
+            }
+            for algorithm, strategy_class in STRATEGY_CLASSES.items()
+        }
+
     def create_strategy(
         self,
         algorithm: RecommendationAlgorithm
@@ -48,14 +101,13 @@ class RecommendationStrategyFactory:
 
         return strategy_creator()
 
-    def get_all_strategies(
-        self
-    ) -> Dict[RecommendationAlgorithm, RecommendationStrategy]:
-
-        return {
-            algorithm: self.create_strategy(algorithm)
-            for algorithm in RecommendationAlgorithm
-        }
+    def _model_holder(
+        self,
+        algorithm: RecommendationAlgorithm
+    ) -> Optional[ModelHolder]:
+        if self.engine is None:
+            return None
+        return self.engine.model_holder(algorithm)
 
     def _create_popularity_strategy(self) -> PopularityRecommendationStrategy:
         """Create popularity-based recommendation strategy."""
@@ -69,7 +121,10 @@ class RecommendationStrategyFactory:
             like_repository=self.like_repository,
             movie_repository=self.movie_repository,
             min_common_movies=2,
-            max_similar_users=20
+            max_similar_users=20,
+            interaction_model=self._model_holder(
+                RecommendationAlgorithm.COLLABORATIVE
+            )
         )
 
     def _create_content_based_strategy(self) -> ContentBasedStrategy:
@@ -78,5 +133,8 @@ class RecommendationStrategyFactory:
             like_repository=self.like_repository,
             movie_repository=self.movie_repository,
             similarity_threshold=0.1,
-            max_recommendations=100
+            max_recommendations=100,
+            catalog_model=self._model_holder(
+                RecommendationAlgorithm.CONTENT_BASED
+            )
         )
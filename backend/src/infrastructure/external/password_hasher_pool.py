@@ -0,0 +1,127 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.external import password_hashing_worker
+from src.shared.exceptions.auth_exceptions import (
+    PasswordHashingBusyException
+)
+
+
+class PasswordHasherPool:
+    """
+    Bounded process pool for bcrypt hashing and verification.
+
+    bcrypt is CPU bound, so it runs in separate processes instead of the
+    request threadpool. At most `max_workers + max_queue` operations, and
+    never more than `max_in_flight`, are admitted at once; further calls
+    fail fast with PasswordHashingBusyException instead of queueing
+    without bound. With `max_workers=0` hashing runs inline in the
+    calling thread.
+
+    Callers (the sync auth routes) hold a request threadpool thread while
+    their operation waits, so `max_in_flight` must stay below the size of
+    that threadpool (40 threads by default) for a burst of logins to
+    leave threads to the other endpoints.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: int = 32,
+        max_in_flight: Optional[int] = None,
+        bcrypt_rounds: Optional[int] = None,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+    ):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.bcrypt_rounds = bcrypt_rounds
+        if bcrypt_rounds is not None:
+            # Inline and thread executors hash in this process
+            password_hashing_worker.configure(bcrypt_rounds)
+        self._executor_factory = executor_factory or self._create_executor
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        admitted = max(max_workers, 1) + max_queue
+        if max_in_flight is not None:
+            admitted = min(admitted, max_in_flight)
+        self._slots = threading.BoundedSemaphore(max(admitted, 1))
+
+    def hash(self, password: str) -> str:
+        return self._run(password_hashing_worker.hash_password, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(
+            password_hashing_worker.verify_password,
+            plain_password,
+            hashed_password,
+        )
+
+    def start(self) -> None:
+        """Start the worker processes ahead of the first request."""
+        if self.max_workers == 0:
+            return
+        executor = self._get_executor()
+        futures = [
+            executor.submit(password_hashing_worker.ping)
+            for _ in range(self.max_workers)
+        ]
+        for future in futures:
+            future.result()
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusyException(
+                "Password hashing capacity exhausted"
+            )
+        try:
+            if self.max_workers == 0:
+                return func(*args)
+            return self._get_executor().submit(func, *args).result()
+        finally:
+            self._slots.release()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = self._executor_factory(self.max_workers)
+        return self._executor
+
+    def _create_executor(self, max_workers: int) -> Executor:
+        initializer, initargs = None, ()
+        if self.bcrypt_rounds is not None:
+            initializer = password_hashing_worker.configure
+            initargs = (self.bcrypt_rounds,)
+
+        # spawn avoids forking a process that already runs threads
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs,
+        )
+
+
+# Global instance of password hasher pool
+password_hasher_pool = PasswordHasherPool(
+    max_workers=(
+        settings.password_hash_workers
+        if settings.password_hash_pool_enabled
+        else 0
+    ),
+    max_queue=settings.password_hash_max_queue,
+    max_in_flight=settings.password_hash_max_in_flight,
+    bcrypt_rounds=settings.bcrypt_rounds,
+)
@@ -0,0 +1,42 @@
+"""
+Password hashing functions executed inside the hashing processes.
+
+Kept free of application imports so spawned workers start quickly.
+"""
+from passlib.context import CryptContext
+
+_pwd_context = None
+_bcrypt_rounds = None
+
+
+def configure(bcrypt_rounds: int) -> None:
+    """Set the bcrypt cost; also used as the worker process initializer."""
+    global _pwd_context, _bcrypt_rounds
+    _bcrypt_rounds = bcrypt_rounds
+    _pwd_context = None
+
+
+def _get_context() -> CryptContext:
+    global _pwd_context
+    if _pwd_context is None:
+        options = {}
+        if _bcrypt_rounds is not None:
+            options["bcrypt__rounds"] = _bcrypt_rounds
+        _pwd_context = CryptContext(
+            schemes=["bcrypt"], deprecated="auto", **options
+        )
+    return _pwd_context
+
+
+def hash_password(password: str) -> str:
+    return _get_context().hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _get_context().verify(plain_password, hashed_password)
+
+
+def ping() -> bool:
+    """No-op used to start worker processes ahead of the first request."""
+    _get_context()
+    return True
@@ -0,0 +1,143 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+import structlog
+from sqlalchemy.orm import Session
+
+from src.domain.value_objects.recommendation import RecommendationAlgorithm
+from src.infrastructure.cache.versions import version_store
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.external.factories\
+    .recommendation_strategy_factory import (
+        MODEL_CLASSES,
+        RecommendationStrategyFactory
+    )
+from src.infrastructure.external.recommendation_strategies.model_holder \
+    import ModelHolder
+from src.infrastructure.external.recommendation_strategies.model_snapshots \
+    import ModelSnapshotStore, SharedModelHolder
+from src.infrastructure.metrics.instruments import model_build_duration
+
+logger = structlog.get_logger(__name__)
+
+
+class RecommendationEngine:
+    """
+    Application-scoped state of the recommendation strategies.
+
+    Holds one model holder per algorithm, created on first use, so models
+    built by one request serve the following ones. `warm_up` builds them
+    ahead of the first request, optionally in a background thread.
+
+    With a snapshot store, models are published there and attached by
+    every process using the same store, so worker processes share one
+    copy of each model and only one of them builds it.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        model_max_age: Optional[float] = None,
+        snapshot_store: Optional[ModelSnapshotStore] = None,
+    ):
+        self.session_factory = session_factory
+        self.model_max_age = model_max_age
+        self.snapshot_store = snapshot_store
+        self._model_holders: Dict[RecommendationAlgorithm, ModelHolder] = {}
+        self._lock = threading.Lock()
+
+    def model_holder(self, algorithm: RecommendationAlgorithm) -> ModelHolder:
+        holder = self._model_holders.get(algorithm)
+        if holder is None:
+            with self._lock:
+                holder = self._model_holders.get(algorithm)
+                if holder is None:
+                    holder = self._create_model_holder(algorithm)
+                    self._model_holders[algorithm] = holder
+        return holder
+
+    def _create_model_holder(
+        self,
+        algorithm: RecommendationAlgorithm
+    ) -> ModelHolder:
+        model_class = MODEL_CLASSES.get(algorithm)
+        on_build = model_build_duration.labels(algorithm.value).observe
+        if self.snapshot_store is None or model_class is None:
+            return ModelHolder(
+                max_age=self.model_max_age, on_build=on_build
+            )
+        return SharedModelHolder(
+            self.snapshot_store,
+            name=algorithm.value,
+            model_class=model_class,
+            max_age=self.model_max_age,
+            on_build=on_build,
+        )
+
+    def clear(self) -> None:
+        """Drop every held model, so the next warm-up rebuilds them all."""
+        with self._lock:
+            holders = list(self._model_holders.values())
+        for holder in holders:
+            holder.clear()
+
+    def warm_up(
+        self,
+        algorithms: Optional[Iterable[RecommendationAlgorithm]] = None,
+    ) -> Dict[str, float]:
+        """Run each strategy's warm-up; returns durations in ms."""
+        durations = {}
+        db = self.session_factory()
+        try:
+            factory = RecommendationStrategyFactory(db, engine=self)
+            for algorithm in algorithms or RecommendationAlgorithm:
+                start = time.perf_counter()
+                factory.create_strategy(algorithm).warm_up()
+                durations[algorithm.value] = (
+                    (time.perf_counter() - start) * 1000
+                )
+        finally:
+            db.close()
+        return durations
+
+    def start_warm_up(self) -> threading.Thread:
+        """Warm up in a daemon thread so startup is not delayed."""
+        thread = threading.Thread(
+            target=self._warm_up_in_background,
+            name="recommendation-warm-up",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _warm_up_in_background(self) -> None:
+        try:
+            durations = self.warm_up()
+        except Exception:
+            # Requests build models on demand if warm-up fails
+            logger.exception("recommendation_warm_up_failed")
+            return
+        logger.info(
+            "recommendation_warm_up",
+            **{
+                f"{algorithm}_ms": round(duration, 1)
+                for algorithm, duration in durations.items()
+            }
+        )
+
+
+def create_snapshot_store() -> Optional[ModelSnapshotStore]:
+    if not settings.recommendation_snapshot_dir:
+        return None
+    return ModelSnapshotStore(
+        settings.recommendation_snapshot_dir, epoch=version_store.epoch
+    )
+
+
+# Global instance of recommendation engine
+recommendation_engine = RecommendationEngine(
+    model_max_age=settings.recommendation_model_max_age_seconds,
+    snapshot_store=create_snapshot_store()
+)
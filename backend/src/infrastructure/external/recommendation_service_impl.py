@@ -1,18 +1,31 @@
-from typing import Dict
+from typing import Dict, Optional
 from sqlalchemy.orm import Session
 
+from src.application.services.cache_service import CacheService
 from src.application.services.recommendation_service import (
     RecommendationService,
     RecommendationStrategy
 )
+from src.domain.entities.user import User
 from src.domain.value_objects.recommendation import (
     RecommendationRequest,
     RecommendationResult,
-    RecommendationAlgorithm
+    RecommendationAlgorithm,
+    RankedRecommendations
 )
 from src.domain.repositories.user_repository import UserRepository
+from src.infrastructure.cache.versions import VersionStore, version_store
+from src.infrastructure.database.repositories.movie_repository_impl import (
+    MovieRepositoryImpl
+)
+from src.shared.constants.cache_keys import RECOMMENDATIONS_CACHE_KEY
 from src.infrastructure.external.factories\
     .recommendation_strategy_factory import RecommendationStrategyFactory
+from src.infrastructure.external.recommendation_engine import (
+    RecommendationEngine,
+    recommendation_engine
+)
+from src.infrastructure.metrics.spans import span
 
 
 class RecommendationServiceImpl(RecommendationService):
@@ -23,22 +36,40 @@ class RecommendationServiceImpl(RecommendationService):
         user_repository: UserRepository,
         default_algorithm: RecommendationAlgorithm = (
             RecommendationAlgorithm.CONTENT_BASED
-        )
+        ),
+        cache: Optional[CacheService] = None,
+        engine: Optional[RecommendationEngine] = recommendation_engine,
+        versions: VersionStore = version_store
     ):
         self.db_session = db_session
         self.user_repository = user_repository
-        self.strategy_factory = RecommendationStrategyFactory(db_session)
+        self.movie_repository = MovieRepositoryImpl(db_session)
+        self.cache = cache
+        self.versions = versions
+        self.strategy_factory = RecommendationStrategyFactory(
+            db_session, engine=engine
+        )
+        # Strategies are built on first use; a request needs only one
         self._strategies: Dict[
             RecommendationAlgorithm, RecommendationStrategy
         ] = {}
         self._default_algorithm = default_algorithm
 
-        # Initialize all strategies
-        self._initialize_strategies()
+    def _get_strategy(
+        self,
+        algorithm: RecommendationAlgorithm
+    ) -> Optional[RecommendationStrategy]:
+        strategy = self._strategies.get(algorithm)
+        if strategy is None and self.strategy_factory.supports(algorithm):
+            strategy = self.strategy_factory.create_strategy(algorithm)
+            self._strategies[algorithm] = strategy
+        return strategy
 
-    def _initialize_strategies(self):
-        """Initialize all available recommendation strategies."""
-        self._strategies = self.strategy_factory.get_all_strategies()
+    def _is_available(self, algorithm: RecommendationAlgorithm) -> bool:
+        return (
+            algorithm in self._strategies
+            or self.strategy_factory.supports(algorithm)
+        )
 
     def register_strategy(
         self,
@@ -53,11 +84,13 @@ class RecommendationServiceImpl(RecommendationService):
     ) -> RecommendationResult:
 
         # Get the requested strategy
-        strategy = self._strategies.get(request.algorithm)
+        algorithm = request.algorithm
+        strategy = self._get_strategy(algorithm)
 
         if not strategy:
             # Fallback to default strategy
-            strategy = self._strategies.get(self._default_algorithm)
+            algorithm = self._default_algorithm
+            strategy = self._get_strategy(algorithm)
 
         if not strategy:
             raise ValueError("No recommendation strategy available")
@@ -67,22 +100,69 @@ class RecommendationServiceImpl(RecommendationService):
         if not user:
             raise ValueError(f"User with ID {request.user_id} not found")
 
-        # Generate recommendations using the strategy
-        return strategy.recommend(user, request.limit, request.page)
+        ranked = self._get_ranking(strategy, algorithm, user)
+
+        # Strategies without a per-user ranking paginate on their own
+        if ranked is None:
+            return strategy.recommend(user, request.limit, request.page)
+
+        # Serve the requested page from the full ranked list
+        with span("hydrate"):
+            movies = self.movie_repository.get_by_ids(
+                list(ranked.page(request.page, request.limit))
+            )
+
+        return RecommendationResult(
+            movies=movies,
+            total=ranked.total,
+            algorithm_used=ranked.algorithm_used,
+            page=request.page,
+            per_page=request.limit
+        )
+
+    def _get_ranking(
+        self,
+        strategy: RecommendationStrategy,
+        algorithm: RecommendationAlgorithm,
+        user: User
+    ) -> Optional[RankedRecommendations]:
+        """Get the user's ranked list, computing it only on cache miss."""
+        cache_key = RECOMMENDATIONS_CACHE_KEY.format(
+            user_id=user.id,
+            algorithm=algorithm.value,
+            version=self.versions.user_likes_version(user.id)
+        )
+
+        if self.cache is not None:
+            with span("ranking_cache"):
+                ranked = self.cache.get(cache_key)
+            if ranked is not None:
+                return ranked
+
+        ranked = strategy.rank(user)
+
+        if ranked is not None and self.cache is not None:
+            self.cache.set(cache_key, ranked)
+
+        return ranked
 
     def get_available_algorithms(self) -> Dict[str, Dict[str, str]]:
 
-        return {
+        # Built-in algorithms are described from their classes; only
+        # strategies registered at runtime are asked directly
+        algorithms = self.strategy_factory.describe_algorithms()
+        algorithms.update({
             algorithm.value: {
                 "name": strategy.get_name(),
                 "description": strategy.get_description()
             }
             for algorithm, strategy in self._strategies.items()
-        }
+        })
+        return algorithms
 
     def set_default_algorithm(self, algorithm: RecommendationAlgorithm):
 
-        if algorithm not in self._strategies:
+        if not self._is_available(algorithm):
             raise ValueError(f"Algorithm {algorithm} is not available")
         self._default_algorithm = algorithm
 
@@ -91,7 +171,7 @@ class RecommendationServiceImpl(RecommendationService):
         algorithm: RecommendationAlgorithm
     ) -> RecommendationStrategy:
 
-        strategy = self._strategies.get(algorithm)
+        strategy = self._get_strategy(algorithm)
         if not strategy:
             raise ValueError(f"Strategy for {algorithm} is not available")
         return strategy
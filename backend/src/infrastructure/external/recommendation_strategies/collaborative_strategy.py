@@ -1,30 +1,107 @@
-from typing import List, Set, Tuple
-import pandas as pd
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from dataclasses import dataclass
 from collections import defaultdict
 
 from src.application.services.recommendation_service import (
     RecommendationStrategy
 )
 from src.domain.entities.user import User
-from src.domain.value_objects.recommendation import RecommendationResult
+from src.domain.value_objects.recommendation import (
+    RecommendationResult,
+    RankedRecommendations
+)
 from src.domain.repositories.like_repository import LikeRepository
 from src.domain.repositories.movie_repository import MovieRepository
+from src.infrastructure.cache.versions import VersionStore, version_store
+from src.infrastructure.external.recommendation_strategies.model_holder \
+    import ModelHolder
+from src.infrastructure.metrics.spans import span
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime to keep application startup fast
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+
+@dataclass(frozen=True)
+class InteractionModel:
+    """User-movie like matrix shared by all users."""
+    like_count: int
+    # Sorted ids of the matrix rows and columns
+    user_ids: "np.ndarray"
+    movie_ids: "np.ndarray"
+    # Binary users x movies matrix; None when there are no likes yet
+    user_movie_matrix: Optional["csr_matrix"]
+
+    def user_row(self, user_id: int) -> Optional[int]:
+        import numpy as np
+
+        row = int(np.searchsorted(self.user_ids, user_id))
+        if row < len(self.user_ids) and self.user_ids[row] == user_id:
+            return row
+        return None
+
+    def liked_movie_ids(self, row: int) -> "np.ndarray":
+        """Movies liked by the user in `row`, in ascending id order."""
+        matrix = self.user_movie_matrix
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        return self.movie_ids[matrix.indices[start:end]]
+
+    def to_snapshot(self) -> Tuple[Dict[str, "np.ndarray"], Dict[str, Any]]:
+        arrays = {"user_ids": self.user_ids, "movie_ids": self.movie_ids}
+        if self.user_movie_matrix is not None:
+            arrays["data"] = self.user_movie_matrix.data
+            arrays["indices"] = self.user_movie_matrix.indices
+            arrays["indptr"] = self.user_movie_matrix.indptr
+        return arrays, {"like_count": self.like_count}
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        arrays: Dict[str, "np.ndarray"],
+        meta: Dict[str, Any]
+    ) -> "InteractionModel":
+        user_movie_matrix = None
+        if "indptr" in arrays:
+            from scipy.sparse import csr_matrix
+
+            # Wraps the mapped arrays without copying them
+            user_movie_matrix = csr_matrix(
+                (arrays["data"], arrays["indices"], arrays["indptr"]),
+                shape=(len(arrays["user_ids"]), len(arrays["movie_ids"]))
+            )
+
+        return cls(
+            like_count=meta["like_count"],
+            user_ids=arrays["user_ids"],
+            movie_ids=arrays["movie_ids"],
+            user_movie_matrix=user_movie_matrix
+        )
 
 
 class CollaborativeFilteringStrategy(RecommendationStrategy):
 
+    NAME = "Collaborative Filtering"
+    DESCRIPTION = (
+        "Recommends movies based on users with similar taste using "
+        "collaborative filtering with cosine similarity"
+    )
+
     def __init__(
         self,
         like_repository: LikeRepository,
         movie_repository: MovieRepository,
         min_common_movies: int = 2,
-        max_similar_users: int = 20
+        max_similar_users: int = 20,
+        interaction_model: Optional[ModelHolder] = None,
+        versions: VersionStore = version_store
     ):
         self.like_repository = like_repository
         self.movie_repository = movie_repository
         self.min_common_movies = min_common_movies
         self.max_similar_users = max_similar_users
+        self.interaction_model = interaction_model or ModelHolder()
+        self.versions = versions
 
     def recommend(
         self,
@@ -33,101 +110,155 @@ class CollaborativeFilteringStrategy(RecommendationStrategy):
         page: int,
     ) -> RecommendationResult:
 
-        # Get user's liked movies
-        user_likes, _ = self.like_repository.get_by_user(
-            user.id, page=1, per_page=1000
-        )
-        user_liked_movie_ids = {like.movie_id for like in user_likes}
+        ranked = self.rank(user)
 
-        # If user has no likes, fall back to popularity
-        if not user_liked_movie_ids:
+        # If user has no likes or data is too sparse, fall back to popularity
+        if ranked is None:
             return self._fallback_to_popularity(limit, page)
 
-        # Get all user-movie interactions
-        all_likes = self.like_repository.get_user_movie_matrix()
+        return self._paginate(ranked, limit, page)
 
-        if len(all_likes) < self.min_common_movies:
-            return self._fallback_to_popularity(limit, page)
+    def rank(self, user: User) -> Optional[RankedRecommendations]:
 
-        # Build user-item matrix for collaborative filtering
-        user_movie_matrix = self._build_user_movie_matrix(all_likes)
+        # Get user's liked movies
+        with span("fetch_likes"):
+            user_likes, _ = self.like_repository.get_by_user(
+                user.id, page=1, per_page=1000
+            )
+            user_liked_movie_ids = {like.movie_id for like in user_likes}
+
+        if not user_liked_movie_ids:
+            return None
+
+        # The user-item matrix is shared by all users and rebuilt only
+        # when likes change
+        with span("load_model"):
+            model = self._get_interaction_model()
+
+        if model.like_count < self.min_common_movies:
+            return None
 
         # Find similar users using cosine similarity
-        similar_users = self._find_similar_users_sklearn(
-            user.id, user_movie_matrix
-        )
+        with span("similarity"):
+            similar_users = self._find_similar_users_sklearn(
+                user.id, model
+            )
 
         # Generate recommendations from similar users
-        recommended_movie_ids = self._get_recommendations_from_similar_users(
-            user_liked_movie_ids, similar_users, user_movie_matrix
+        with span("ranking"):
+            recommended_movie_ids = (
+                self._get_recommendations_from_similar_users(
+                    user_liked_movie_ids, similar_users, model
+                )
+            )
+
+        return RankedRecommendations(
+            # Convert numpy int64 to Python int if needed
+            movie_ids=tuple(
+                int(movie_id) for movie_id in recommended_movie_ids
+            ),
+            algorithm_used=self.get_name()
         )
 
-        # Apply pagination
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_movie_ids = recommended_movie_ids[start_idx:end_idx]
-
-        # Get movie details
-        movies = []
-        for movie_id in paginated_movie_ids:
-            # Convert numpy int64 to Python int if needed
-            movie_id_int = int(movie_id)
-            movie = self.movie_repository.get_by_id(movie_id_int)
-            if movie:
-                movies.append(movie)
+    def _paginate(
+        self,
+        ranked: RankedRecommendations,
+        limit: int,
+        page: int
+    ) -> RecommendationResult:
 
-        total = len(recommended_movie_ids)
+        with span("hydrate"):
+            movies = self.movie_repository.get_by_ids(
+                list(ranked.page(page, limit))
+            )
 
         return RecommendationResult(
             movies=movies,
-            total=total,
-            algorithm_used=self.get_name(),
+            total=ranked.total,
+            algorithm_used=ranked.algorithm_used,
             page=page,
             per_page=limit
         )
 
+    def warm_up(self) -> None:
+        """Build the user-item matrix ahead of the first request."""
+        self._get_interaction_model()
+
+    def _get_interaction_model(self) -> InteractionModel:
+        return self.interaction_model.get(
+            self.versions.likes_version(), self._build_interaction_model
+        )
+
+    def _build_interaction_model(self) -> InteractionModel:
+        import numpy as np
+
+        # Get all user-movie interactions
+        all_likes = self.like_repository.get_user_movie_matrix()
+
+        if not all_likes:
+            empty_ids = np.array([], dtype=np.int64)
+            return InteractionModel(
+                like_count=0,
+                user_ids=empty_ids,
+                movie_ids=empty_ids,
+                user_movie_matrix=None
+            )
+
+        # Build user-item matrix for collaborative filtering
+        likes = np.asarray(all_likes, dtype=np.int64)
+        user_ids, rows = np.unique(likes[:, 0], return_inverse=True)
+        movie_ids, columns = np.unique(likes[:, 1], return_inverse=True)
+
+        return InteractionModel(
+            like_count=len(all_likes),
+            user_ids=user_ids,
+            movie_ids=movie_ids,
+            user_movie_matrix=self._build_user_movie_matrix(
+                rows, columns, (len(user_ids), len(movie_ids))
+            )
+        )
+
     def _build_user_movie_matrix(
         self,
-        all_likes: List[Tuple[int, int]]
-    ) -> pd.DataFrame:
-
-        df = pd.DataFrame(all_likes, columns=['user_id', 'movie_id'])
-        df['rating'] = 1  # Binary rating (like = 1)
-
-        # Pivot to create user-movie matrix
-        user_movie_matrix = df.pivot_table(
-            index='user_id',
-            columns='movie_id',
-            values='rating',
-            fill_value=0
+        rows: "np.ndarray",
+        columns: "np.ndarray",
+        shape: Tuple[int, int]
+    ) -> "csr_matrix":
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        user_movie_matrix = csr_matrix(
+            (np.ones(len(rows)), (rows, columns)), shape=shape
         )
+        user_movie_matrix.sort_indices()
+        # Binary rating (like = 1), even for duplicated pairs
+        user_movie_matrix.data[:] = 1.0
 
         return user_movie_matrix
 
     def _find_similar_users_sklearn(
         self,
         target_user_id: int,
-        user_movie_matrix: pd.DataFrame
+        model: InteractionModel
     ) -> List[Tuple[int, float]]:
 
         # Check if target user exists in matrix
-        if target_user_id not in user_movie_matrix.index:
+        target_row = model.user_row(target_user_id)
+        if target_row is None:
             return []
 
-        # Get target user's preferences
-        target_user_row = user_movie_matrix.loc[target_user_id].values.reshape(
-            1, -1
-        )
+        from sklearn.metrics.pairwise import cosine_similarity
 
         # Calculate cosine similarity with all users
+        user_movie_matrix = model.user_movie_matrix
         similarities = cosine_similarity(
-            target_user_row, user_movie_matrix.values
+            user_movie_matrix[target_row], user_movie_matrix
         )[0]
 
         # Create list of (user_id, similarity) pairs
         similar_users = []
         for idx, similarity in enumerate(similarities):
-            user_id = user_movie_matrix.index[idx]
+            user_id = int(model.user_ids[idx])
 
             # Skip self and users with low similarity
             if user_id != target_user_id and similarity > 0.1:
@@ -141,25 +272,20 @@ class CollaborativeFilteringStrategy(RecommendationStrategy):
         self,
         user_liked_movie_ids: Set[int],
         similar_users: List[Tuple[int, float]],
-        user_movie_matrix: pd.DataFrame
+        model: InteractionModel
     ) -> List[int]:
 
         movie_scores = defaultdict(float)
 
         for similar_user_id, similarity_score in similar_users:
-            if similar_user_id not in user_movie_matrix.index:
+            row = model.user_row(similar_user_id)
+            if row is None:
                 continue
 
-            # Get movies liked by similar user
-            similar_user_likes = user_movie_matrix.loc[similar_user_id]
-            liked_movies = similar_user_likes[similar_user_likes == 1]\
-                .index.tolist()
-
-            # Score movies not yet liked by target user
-            for movie_id in liked_movies:
-                movie_id_int = int(movie_id)  # Ensure Python int
-                if movie_id_int not in user_liked_movie_ids:
-                    movie_scores[movie_id_int] += similarity_score
+            # Score movies liked by similar user and not yet by target user
+            for movie_id in model.liked_movie_ids(row).tolist():
+                if movie_id not in user_liked_movie_ids:
+                    movie_scores[movie_id] += similarity_score
 
         # Sort movies by score
         recommended_movies = sorted(
@@ -176,10 +302,11 @@ class CollaborativeFilteringStrategy(RecommendationStrategy):
         page: int
     ) -> RecommendationResult:
 
-        movies, total = self.movie_repository.get_popular(
-            page=page,
-            per_page=limit
-        )
+        with span("fallback_popular"):
+            movies, total = self.movie_repository.get_popular(
+                page=page,
+                per_page=limit
+            )
 
         return RecommendationResult(
             movies=movies,
@@ -190,10 +317,7 @@ class CollaborativeFilteringStrategy(RecommendationStrategy):
         )
 
     def get_name(self) -> str:
-        return "Collaborative Filtering"
+        return self.NAME
 
     def get_description(self) -> str:
-        return (
-            "Recommends movies based on users with similar taste using "
-            "collaborative filtering with cosine similarity"
-        )
+        return self.DESCRIPTION
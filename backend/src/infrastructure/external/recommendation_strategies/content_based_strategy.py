@@ -1,34 +1,153 @@
-from typing import List, Dict, Set
-import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import (
+    TYPE_CHECKING, Any, List, Dict, NamedTuple, Optional, Set, Tuple
+)
+from dataclasses import dataclass
 from collections import Counter
 import json
 
 from src.application.services.recommendation_service import (
     RecommendationStrategy
 )
+from src.domain.entities.movie import Movie
 from src.domain.entities.user import User
-from src.domain.value_objects.recommendation import RecommendationResult
+from src.domain.value_objects.recommendation import (
+    RecommendationResult,
+    RankedRecommendations
+)
 from src.domain.repositories.like_repository import LikeRepository
 from src.domain.repositories.movie_repository import MovieRepository
+from src.infrastructure.cache.versions import VersionStore, version_store
+from src.infrastructure.external.recommendation_strategies.model_holder \
+    import ModelHolder
+from src.infrastructure.metrics.spans import span
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime to keep application startup fast
+    import numpy as np
+    import pandas as pd
+
+
+class CatalogMovie(NamedTuple):
+    """The movie attributes similarities need once TF-IDF is fitted."""
+    id: int
+    genres: Optional[str]
+
+
+@dataclass(frozen=True)
+class CatalogModel:
+    """TF-IDF features of the whole catalog; independent of any user."""
+    movies: List[CatalogMovie]
+    movie_ids: List[int]
+    index: Dict[int, int]
+    # None when TF-IDF could not be fitted (e.g. empty vocabulary)
+    tfidf_matrix: Optional[Any]
+
+    @classmethod
+    def from_movies(
+        cls,
+        movies: List[Movie],
+        tfidf_matrix: Optional[Any]
+    ) -> "CatalogModel":
+        return cls.from_columns(
+            movie_ids=[int(movie.id) for movie in movies],
+            genres=[movie.genres for movie in movies],
+            tfidf_matrix=tfidf_matrix
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        movie_ids: List[int],
+        genres: List[Optional[str]],
+        tfidf_matrix: Optional[Any]
+    ) -> "CatalogModel":
+        return cls(
+            movies=[
+                CatalogMovie(id=movie_id, genres=movie_genres)
+                for movie_id, movie_genres in zip(movie_ids, genres)
+            ],
+            movie_ids=movie_ids,
+            index={movie_id: idx for idx, movie_id in enumerate(movie_ids)},
+            tfidf_matrix=tfidf_matrix
+        )
+
+    def to_snapshot(self) -> Tuple[Dict[str, "np.ndarray"], Dict[str, Any]]:
+        import numpy as np
+
+        arrays = {
+            "movie_ids": np.asarray(self.movie_ids, dtype=np.int64),
+            # Fixed-width bytes, so the column can be memory-mapped
+            "genres": np.asarray(
+                [(movie.genres or "").encode() for movie in self.movies],
+                dtype=bytes
+            ),
+        }
+        meta = {"tfidf_shape": None}
+        if self.tfidf_matrix is not None:
+            arrays["tfidf_data"] = self.tfidf_matrix.data
+            arrays["tfidf_indices"] = self.tfidf_matrix.indices
+            arrays["tfidf_indptr"] = self.tfidf_matrix.indptr
+            meta["tfidf_shape"] = list(self.tfidf_matrix.shape)
+        return arrays, meta
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        arrays: Dict[str, "np.ndarray"],
+        meta: Dict[str, Any]
+    ) -> "CatalogModel":
+        tfidf_matrix = None
+        if meta["tfidf_shape"] is not None:
+            from scipy.sparse import csr_matrix
+
+            # Wraps the mapped arrays without copying them
+            tfidf_matrix = csr_matrix(
+                (
+                    arrays["tfidf_data"],
+                    arrays["tfidf_indices"],
+                    arrays["tfidf_indptr"]
+                ),
+                shape=tuple(meta["tfidf_shape"])
+            )
+
+        return cls.from_columns(
+            movie_ids=arrays["movie_ids"].tolist(),
+            genres=[
+                movie_genres.decode() or None
+                for movie_genres in arrays["genres"]
+            ],
+            tfidf_matrix=tfidf_matrix
+        )
 
 
 class ContentBasedStrategy(RecommendationStrategy):
 
+    NAME = "Content-Based Filtering"
+    DESCRIPTION = (
+        "Recommends movies similar to those you've already liked "
+        "based on genres, title, and overview using TF-IDF and "
+        "cosine similarity. Adaptively adjusts similarity thresholds "
+        "to handle diverse user preferences and ensures minimum "
+        "recommendation counts."
+    )
+
     def __init__(
         self,
         like_repository: LikeRepository,
         movie_repository: MovieRepository,
         similarity_threshold: float = 0.05,  # Reduzido para ser mais inclusivo
         max_recommendations: int = 100,
-        min_recommendations: int = 10  # Garantir um mínimo de recomendações
+        min_recommendations: int = 10,  # Garantir um mínimo de recomendações
+        catalog_model: Optional[ModelHolder] = None,
+        versions: VersionStore = version_store
     ):
         self.like_repository = like_repository
         self.movie_repository = movie_repository
         self.similarity_threshold = similarity_threshold
         self.max_recommendations = max_recommendations
         self.min_recommendations = min_recommendations
+        self.catalog_model = catalog_model or ModelHolder()
+        self.versions = versions
 
     def recommend(
         self,
@@ -37,118 +156,160 @@ class ContentBasedStrategy(RecommendationStrategy):
         page: int,
     ) -> RecommendationResult:
 
+        ranked = self.rank(user)
+
+        # If user has no likes or catalog is too small, fall back to
+        # popularity
+        if ranked is None:
+            return self._fallback_to_popularity(limit, page)
+
+        return self._paginate(ranked, limit, page)
+
+    def rank(self, user: User) -> Optional[RankedRecommendations]:
+
         # Get user's liked movies
-        user_likes, _ = self.like_repository.get_by_user(
-            user.id, page=1, per_page=1000
-        )
-        liked_movie_ids = {like.movie_id for like in user_likes}
+        with span("fetch_likes"):
+            user_likes, _ = self.like_repository.get_by_user(
+                user.id, page=1, per_page=1000
+            )
+            liked_movie_ids = {like.movie_id for like in user_likes}
 
-        # If user has no likes, fall back to popularity
         if not liked_movie_ids:
-            return self._fallback_to_popularity(limit, page)
+            return None
 
-        # Get all movies for similarity calculation
-        all_movies, _ = self.movie_repository.get_all(page=1, per_page=10000)
+        # Catalog features are shared by all users and rebuilt only when
+        # the catalog changes
+        with span("load_model"):
+            model = self._get_catalog_model()
 
-        if len(all_movies) < 2:
-            return self._fallback_to_popularity(limit, page)
+        if len(model.movies) < 2:
+            return None
 
-        # Get liked movies details
-        liked_movies = [
-            movie for movie in all_movies
-            if movie.id in liked_movie_ids
-        ]
+        with span("similarity"):
+            # Get liked movies details
+            liked_movies = [
+                movie for movie in model.movies
+                if movie.id in liked_movie_ids
+            ]
 
-        # Calculate movie similarities
-        movie_similarities = self._calculate_movie_similarities(
-            all_movies, liked_movies
-        )
+            # Calculate movie similarities
+            movie_similarities = self._calculate_movie_similarities(
+                model, liked_movies
+            )
 
         # Generate recommendations based on similar movies
-        recommended_movie_ids = self._generate_content_recommendations(
-            movie_similarities, liked_movie_ids
-        )
-
-        # Apply pagination
-        start_idx = (page - 1) * limit
-        end_idx = start_idx + limit
-        paginated_movie_ids = recommended_movie_ids[start_idx:end_idx]
+        with span("ranking"):
+            recommended_movie_ids = self._generate_content_recommendations(
+                movie_similarities, liked_movie_ids
+            )
 
-        # Get movie details
-        movies = []
-        for movie_id in paginated_movie_ids:
+        return RankedRecommendations(
             # Convert numpy int64 to Python int
-            movie_id_int = int(movie_id)
-            movie = self.movie_repository.get_by_id(movie_id_int)
-            if movie:
-                movies.append(movie)
+            movie_ids=tuple(
+                int(movie_id) for movie_id in recommended_movie_ids
+            ),
+            algorithm_used=self.get_name()
+        )
+
+    def _paginate(
+        self,
+        ranked: RankedRecommendations,
+        limit: int,
+        page: int
+    ) -> RecommendationResult:
 
-        total = len(recommended_movie_ids)
+        with span("hydrate"):
+            movies = self.movie_repository.get_by_ids(
+                list(ranked.page(page, limit))
+            )
 
         return RecommendationResult(
             movies=movies,
-            total=total,
-            algorithm_used=self.get_name(),
+            total=ranked.total,
+            algorithm_used=ranked.algorithm_used,
             page=page,
             per_page=limit
         )
 
-    def _calculate_movie_similarities(
-        self,
-        all_movies: List,
-        liked_movies: List
-    ) -> Dict[int, float]:
+    def warm_up(self) -> None:
+        """Build the catalog TF-IDF model ahead of the first request."""
+        self._get_catalog_model()
+
+    def _get_catalog_model(self) -> CatalogModel:
+        return self.catalog_model.get(
+            self.versions.catalog_version(), self._build_catalog_model
+        )
+
+    def _build_catalog_model(self) -> CatalogModel:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        # Get all movies for similarity calculation
+        all_movies, _ = self.movie_repository.get_all(page=1, per_page=10000)
+
+        tfidf_matrix = None
 
         # Create feature vectors for all movies
         movie_features = self._create_movie_features(all_movies)
 
-        if movie_features.empty:
-            return {}
+        if not movie_features.empty:
+            # Create TF-IDF vectors
+            tfidf = TfidfVectorizer(
+                max_features=1000,
+                stop_words='english',
+                ngram_range=(1, 2)
+            )
 
-        # Create TF-IDF vectors
-        tfidf = TfidfVectorizer(
-            max_features=1000,
-            stop_words='english',
-            ngram_range=(1, 2)
-        )
+            try:
+                tfidf_matrix = tfidf.fit_transform(
+                    movie_features['features']
+                )
+            except ValueError:
+                # Similarities fall back to genres
+                tfidf_matrix = None
+
+        return CatalogModel.from_movies(all_movies, tfidf_matrix)
+
+    def _calculate_movie_similarities(
+        self,
+        model: CatalogModel,
+        liked_movies: List
+    ) -> Dict[int, float]:
+
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
 
-        try:
-            tfidf_matrix = tfidf.fit_transform(movie_features['features'])
-        except ValueError:
+        if model.tfidf_matrix is None:
             # Fallback if TF-IDF fails
             return self._calculate_genre_similarity(
-                all_movies, liked_movies
+                model.movies, liked_movies
             )
 
         # Calculate similarities between liked movies and all movies
-        movie_similarities = {}
         liked_movie_ids_set = {m.id for m in liked_movies}
         liked_indices = [
-            idx for idx, movie_id in enumerate(movie_features['movie_id'])
-            if int(movie_id) in liked_movie_ids_set
+            model.index[movie_id] for movie_id in liked_movie_ids_set
         ]
 
         # Calcular similaridade máxima ao invés de média
         # Isso ajuda quando usuário tem gostos diversos
-        for idx, movie_id in enumerate(movie_features['movie_id']):
-            movie_id = int(movie_id)
-            if movie_id not in liked_movie_ids_set:
-                max_similarity = 0
-
-                for liked_idx in liked_indices:
-                    similarity = cosine_similarity(
-                        tfidf_matrix[liked_idx:liked_idx+1],
-                        tfidf_matrix[idx:idx+1]
-                    )[0][0]
-                    max_similarity = max(max_similarity, similarity)
-
-                movie_similarities[movie_id] = max_similarity
+        if liked_indices:
+            max_similarities = cosine_similarity(
+                model.tfidf_matrix[liked_indices], model.tfidf_matrix
+            ).max(axis=0)
+        else:
+            max_similarities = np.zeros(len(model.movie_ids))
+
+        movie_similarities = {
+            movie_id: float(max_similarities[idx])
+            for idx, movie_id in enumerate(model.movie_ids)
+            if movie_id not in liked_movie_ids_set
+        }
 
         # Se a similaridade TF-IDF for muito baixa para todos os filmes,
         # combinar com similaridade de gêneros para aumentar diversidade
         if movie_similarities and max(movie_similarities.values()) < 0.1:
             genre_similarities = self._calculate_genre_similarity(
-                all_movies, liked_movies
+                model.movies, liked_movies
             )
 
             # Combinar as duas abordagens (70% TF-IDF, 30% gêneros)
@@ -162,7 +323,8 @@ class ContentBasedStrategy(RecommendationStrategy):
 
         return movie_similarities
 
-    def _create_movie_features(self, movies: List) -> pd.DataFrame:
+    def _create_movie_features(self, movies: List) -> "pd.DataFrame":
+        import pandas as pd
 
         movie_data = []
 
@@ -307,10 +469,11 @@ class ContentBasedStrategy(RecommendationStrategy):
         page: int
     ) -> RecommendationResult:
 
-        movies, total = self.movie_repository.get_popular(
-            page=page,
-            per_page=limit
-        )
+        with span("fallback_popular"):
+            movies, total = self.movie_repository.get_popular(
+                page=page,
+                per_page=limit
+            )
 
         return RecommendationResult(
             movies=movies,
@@ -321,13 +484,7 @@ class ContentBasedStrategy(RecommendationStrategy):
         )
 
     def get_name(self) -> str:
-        return "Content-Based Filtering"
+        return self.NAME
 
     def get_description(self) -> str:
-        return (
-            "Recommends movies similar to those you've already liked "
-            "based on genres, title, and overview using TF-IDF and "
-            "cosine similarity. Adaptively adjusts similarity thresholds "
-            "to handle diverse user preferences and ensures minimum "
-            "recommendation counts."
-        )
+        return self.DESCRIPTION
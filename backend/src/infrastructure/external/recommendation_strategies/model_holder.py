@@ -0,0 +1,83 @@
+import threading
+import time
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ModelHolder(Generic[T]):
+    """
+    Latest model built from a given data version.
+
+    `get` returns the held model while the version matches and rebuilds
+    it otherwise. Builds are serialized, so concurrent requests after a
+    change wait for one build instead of each computing their own.
+    `max_age` also bounds how long a model is kept when the data changes
+    without a version bump (e.g. writes from another process).
+    `on_build` is called with the duration in seconds of every build.
+    """
+
+    def __init__(
+        self,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_build: Optional[Callable[[float], None]] = None,
+    ):
+        self.max_age = max_age
+        self.on_build = on_build
+        self._clock = clock
+        # (version, model, built_at), swapped as a whole so reads need no
+        # lock
+        self._state: Optional[Tuple[Hashable, T, float]] = None
+        self._lock = threading.Lock()
+
+    def get(self, version: Hashable, build: Callable[[], T]) -> T:
+        state = self._state
+        if self._is_current(state, version):
+            return state[1]
+
+        with self._lock:
+            state = self._state
+            if self._is_current(state, version):
+                return state[1]
+
+            model, built_at = self._load(version, self._timed(build))
+            self._state = (version, model, built_at)
+            return model
+
+    @property
+    def version(self) -> Optional[Hashable]:
+        state = self._state
+        return state[0] if state is not None else None
+
+    def _load(
+        self,
+        version: Hashable,
+        build: Callable[[], T]
+    ) -> Tuple[T, float]:
+        """Produce the model for `version` and the time it was built."""
+        model = build()
+        return model, self._clock()
+
+    def _timed(self, build: Callable[[], T]) -> Callable[[], T]:
+        if self.on_build is None:
+            return build
+
+        def timed_build() -> T:
+            start = time.perf_counter()
+            model = build()
+            self.on_build(time.perf_counter() - start)
+            return model
+        return timed_build
+
+    def _is_current(self, state, version: Hashable) -> bool:
+        if state is None or state[0] != version:
+            return False
+        return (
+            self.max_age is None
+            or self._clock() - state[2] < self.max_age
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._state = None
@@ -0,0 +1,245 @@
+import fcntl
+import json
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar
+)
+
+import structlog
+
+from src.infrastructure.external.recommendation_strategies.model_holder \
+    import ModelHolder
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime to keep application startup fast
+    import numpy as np
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+CURRENT_FILE = "CURRENT"
+META_FILE = "meta.json"
+LOCK_FILE = ".lock"
+
+
+@dataclass(frozen=True)
+class ModelSnapshot:
+    version: str
+    # Wall-clock time of the build, comparable across processes
+    built_at: float
+    arrays: Dict[str, "np.ndarray"]
+    meta: Dict[str, Any]
+
+
+class ModelSnapshotStore:
+    """
+    Versioned model arrays shared between processes through files.
+
+    Each snapshot is a directory of .npy files that readers map
+    read-only, so every process attached to a snapshot shares its pages
+    through the page cache. Snapshots are written to a temporary
+    directory and published by atomically replacing the CURRENT
+    pointer: readers see the previous or the new snapshot, never a
+    partial one. Only the newest `keep` snapshots are kept on disk;
+    processes still mapping a removed one keep it until they re-attach.
+
+    Snapshots published under another `epoch` (e.g. by a previous run
+    whose version counters started over) are ignored.
+    """
+
+    def __init__(self, root: str, epoch: str = "", keep: int = 2):
+        self.root = root
+        self.epoch = epoch
+        self.keep = max(keep, 1)
+
+    def load(self, name: str) -> Optional[ModelSnapshot]:
+        import numpy as np
+
+        directory = self._model_dir(name)
+        try:
+            with open(os.path.join(directory, CURRENT_FILE)) as pointer:
+                snapshot_dir = os.path.join(directory, pointer.read().strip())
+            with open(os.path.join(snapshot_dir, META_FILE)) as meta_file:
+                meta = json.load(meta_file)
+            if meta["epoch"] != self.epoch:
+                return None
+            arrays = {
+                array_name: np.load(
+                    os.path.join(snapshot_dir, f"{array_name}.npy"),
+                    mmap_mode="r"
+                )
+                for array_name in meta["arrays"]
+            }
+        except FileNotFoundError:
+            # Nothing published yet, or pruned while being read
+            return None
+
+        return ModelSnapshot(
+            version=meta["version"],
+            built_at=meta["built_at"],
+            arrays=arrays,
+            meta=meta["meta"]
+        )
+
+    def publish(
+        self,
+        name: str,
+        version: str,
+        arrays: Dict[str, "np.ndarray"],
+        meta: Optional[Dict[str, Any]] = None
+    ) -> None:
+        import numpy as np
+
+        directory = self._model_dir(name)
+        os.makedirs(directory, exist_ok=True)
+
+        # Names sort by publication time, which pruning relies on
+        snapshot_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        staging_dir = os.path.join(directory, f".{snapshot_id}")
+        os.makedirs(staging_dir)
+        for array_name, array in arrays.items():
+            np.save(
+                os.path.join(staging_dir, f"{array_name}.npy"),
+                np.ascontiguousarray(array)
+            )
+        with open(os.path.join(staging_dir, META_FILE), "w") as meta_file:
+            json.dump(
+                {
+                    "epoch": self.epoch,
+                    "version": version,
+                    "built_at": time.time(),
+                    "arrays": list(arrays),
+                    "meta": meta or {},
+                },
+                meta_file
+            )
+        os.rename(staging_dir, os.path.join(directory, snapshot_id))
+
+        pointer_path = os.path.join(
+            directory, f".{CURRENT_FILE}-{snapshot_id}"
+        )
+        with open(pointer_path, "w") as pointer:
+            pointer.write(snapshot_id)
+        os.replace(pointer_path, os.path.join(directory, CURRENT_FILE))
+
+        self._prune(directory)
+
+    def discard(self, name: str) -> None:
+        """Unpublish the current snapshot, forcing the next rebuild."""
+        try:
+            os.remove(os.path.join(self._model_dir(name), CURRENT_FILE))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self, name: str) -> Iterator[None]:
+        """Exclusive, cross-process lock on the snapshots of a model."""
+        directory = self._model_dir(name)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, LOCK_FILE), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _prune(self, directory: str) -> None:
+        snapshots = sorted(
+            entry for entry in os.listdir(directory)
+            if not entry.startswith(".") and entry != CURRENT_FILE
+        )
+        for entry in snapshots[:-self.keep]:
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
+
+    def _model_dir(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+
+class SharedModelHolder(ModelHolder[T]):
+    """
+    Model holder whose models live in a ModelSnapshotStore.
+
+    When the version changes, the model is attached from the current
+    snapshot if another process already published it; otherwise one
+    process builds and publishes it while the others wait on the store
+    lock and attach the result. The builder serves the attached arrays
+    as well, so all processes share one copy.
+
+    `model_class` converts models to arrays with `to_snapshot()` and
+    back with `from_snapshot(arrays, meta)`.
+    """
+
+    def __init__(
+        self,
+        store: ModelSnapshotStore,
+        name: str,
+        model_class: Type[T],
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_build: Optional[Callable[[float], None]] = None,
+    ):
+        super().__init__(max_age=max_age, clock=clock, on_build=on_build)
+        self.store = store
+        self.name = name
+        self.model_class = model_class
+
+    def clear(self) -> None:
+        super().clear()
+        self.store.discard(self.name)
+
+    def _load(
+        self,
+        version: Hashable,
+        build: Callable[[], T]
+    ) -> Tuple[T, float]:
+        loaded = self._attach(version)
+        if loaded is not None:
+            return loaded
+
+        with self.store.lock(self.name):
+            # Another process may have published while we waited
+            loaded = self._attach(version)
+            if loaded is not None:
+                return loaded
+
+            model = build()
+            arrays, meta = model.to_snapshot()
+            try:
+                self.store.publish(self.name, str(version), arrays, meta)
+            except OSError:
+                # Serve the process-local model rather than failing
+                logger.exception(
+                    "model_snapshot_publish_failed", model=self.name
+                )
+                return model, self._clock()
+            logger.info(
+                "model_snapshot_published", model=self.name, version=version
+            )
+            return self._attach(version) or (model, self._clock())
+
+    def _attach(self, version: Hashable) -> Optional[Tuple[T, float]]:
+        snapshot = self.store.load(self.name)
+        if snapshot is None or snapshot.version != str(version):
+            return None
+
+        age = max(time.time() - snapshot.built_at, 0.0)
+        if self.max_age is not None and age >= self.max_age:
+            return None
+
+        model = self.model_class.from_snapshot(snapshot.arrays, snapshot.meta)
+        return model, self._clock() - age
@@ -8,6 +8,12 @@ from src.domain.repositories.movie_repository import MovieRepository
 
 class PopularityRecommendationStrategy(RecommendationStrategy):
 
+    NAME = "Popularity-Based"
+    DESCRIPTION = (
+        "Recommends movies based on overall popularity "
+        "(number of likes from all users)"
+    )
+
     def __init__(self, movie_repository: MovieRepository):
         self.movie_repository = movie_repository
 
@@ -33,10 +39,7 @@ class PopularityRecommendationStrategy(RecommendationStrategy):
         )
 
     def get_name(self) -> str:
-        return "Popularity-Based"
+        return self.NAME
 
     def get_description(self) -> str:
-        return (
-            "Recommends movies based on overall popularity "
-            "(number of likes from all users)"
-        )
+        return self.DESCRIPTION
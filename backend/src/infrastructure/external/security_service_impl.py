@@ -1,26 +1,94 @@
+import hashlib
+import math
+import statistics
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 
+from src.application.services.cache_service import CacheService
 from src.application.services.security_service import SecurityService
+from src.infrastructure.cache.caches import token_cache
 from src.infrastructure.config.settings import settings
+from src.infrastructure.external.password_hasher_pool import (
+    PasswordHasherPool,
+    password_hasher_pool
+)
+from src.shared.constants.cache_keys import TOKEN_CACHE_KEY
+
+
+@dataclass(frozen=True)
+class HashCostReport:
+    """Measured bcrypt cost compared with the configured latency budget."""
+    rounds: int
+    cost_ms: float
+    budget_ms: float
+    suggested_rounds: int
+
+    @property
+    def within_budget(self) -> bool:
+        return self.cost_ms <= self.budget_ms
+
+
+def suggest_bcrypt_rounds(
+    rounds: int,
+    cost_ms: float,
+    budget_ms: float,
+) -> int:
+    """Largest bcrypt cost whose estimated hash time fits the budget."""
+    if cost_ms <= 0:
+        return rounds
+    # Each extra round doubles the hashing time
+    delta = math.floor(math.log2(budget_ms / cost_ms))
+    return min(max(rounds + delta, 4), 31)
 
 
 class SecurityServiceImpl(SecurityService):
-    def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(
+        self,
+        hasher_pool: PasswordHasherPool = password_hasher_pool,
+        token_cache: Optional[CacheService] = token_cache,
+    ):
+        self.hasher_pool = hasher_pool
+        self.token_cache = token_cache
 
     def hash_password(self, password: str) -> str:
-        return self.pwd_context.hash(password)
+        return self.hasher_pool.hash(password)
 
     def verify_password(
         self,
         plain_password: str,
         hashed_password: str,
     ) -> bool:
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return self.hasher_pool.verify(plain_password, hashed_password)
+
+    def self_test(self, samples: int = 3) -> HashCostReport:
+        """
+        Hash and verify a sample password through the hashing pool and
+        measure the median hash time against the latency budget.
+        """
+        timings = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            hashed = self.hash_password("self-test-password")
+            timings.append((time.perf_counter() - start) * 1000)
+
+        if not self.verify_password("self-test-password", hashed):
+            raise RuntimeError("Password hashing self-test failed")
+
+        rounds = self.hasher_pool.bcrypt_rounds or settings.bcrypt_rounds
+        cost_ms = statistics.median(timings)
+        budget_ms = settings.password_hash_latency_budget_ms
+        return HashCostReport(
+            rounds=rounds,
+            cost_ms=cost_ms,
+            budget_ms=budget_ms,
+            suggested_rounds=suggest_bcrypt_rounds(
+                rounds, cost_ms, budget_ms
+            ),
+        )
 
     def create_access_token(
         self,
@@ -41,10 +109,61 @@ class SecurityServiceImpl(SecurityService):
         return encoded_jwt
 
     def verify_token(self, token: str) -> Optional[str]:
+        subject = self._get_cached_subject(token)
+        if subject is not None:
+            return subject
+
         try:
             payload = jwt.decode(
                 token, settings.secret_key, algorithms=[settings.algorithm]
             )
-            return payload.get("sub")
         except JWTError:
             return None
+
+        subject = payload.get("sub")
+        if subject is not None:
+            self._cache_subject(token, subject, payload.get("exp"))
+        return subject
+
+    def _get_cached_subject(self, token: str) -> Optional[str]:
+        if self.token_cache is None:
+            return None
+
+        key = self._token_cache_key(token)
+        entry = self.token_cache.get(key)
+        if entry is None:
+            return None
+
+        subject, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            self.token_cache.delete(key)
+            return None
+        return subject
+
+    def _cache_subject(
+        self,
+        token: str,
+        subject: str,
+        expires_at: Optional[float],
+    ) -> None:
+        if self.token_cache is None:
+            return
+
+        ttl = settings.token_cache_max_ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            self.token_cache.set(
+                self._token_cache_key(token),
+                (subject, expires_at),
+                ttl=ttl,
+            )
+
+    @staticmethod
+    def _token_cache_key(token: str) -> str:
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        return TOKEN_CACHE_KEY.format(token_digest=digest)
+
+
+# Global instance of security service
+security_service = SecurityServiceImpl()
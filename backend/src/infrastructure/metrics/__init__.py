@@ -0,0 +1,9 @@
+"""Runtime metrics package."""
+
+from .registry import CONTENT_TYPE, Metric, MetricsRegistry
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Metric",
+    "MetricsRegistry",
+]
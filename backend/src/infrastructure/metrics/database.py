@@ -0,0 +1,142 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.metrics.instruments import db_query_duration
+from src.infrastructure.metrics.slow_log import slow_log
+
+# Bind parameter in the paramstyles of the supported drivers
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|:\w+)"
+# Parameter lists of expanded IN clauses, e.g. "(?, ?, ?)"
+_PLACEHOLDER_LIST = re.compile(
+    rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)"
+)
+# Literal values written into the statement text
+_LITERAL = re.compile(r"'(?:[^']|'')*'|(?<![\w.])\d+(?:\.\d+)?\b")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    # Executions per statement text
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed at least `threshold` times."""
+        shapes = Counter()
+        for statement, count in self.statements.items():
+            shapes[statement_shape(statement)] += count
+        return [
+            (shape, count)
+            for shape, count in shapes.most_common()
+            if count >= threshold
+        ]
+
+
+def statement_shape(statement: str) -> str:
+    """Statement text with whitespace and IN lists normalised."""
+    return _PLACEHOLDER_LIST.sub("(...)", " ".join(statement.split()))
+
+
+def redact_statement(statement: str) -> str:
+    """Statement shape with literal strings and numbers replaced by ?."""
+    return _LITERAL.sub("?", statement_shape(statement))
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """The type names of bound parameters, leaving their values out."""
+    if isinstance(parameters, dict):
+        return {
+            name: type(value).__name__
+            for name, value in parameters.items()
+        }
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+# Mutated in place, so queries run in threadpool threads (which get a
+# copy of the context) are counted for the request that started them
+_current_queries: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_queries", default=None
+)
+
+
+def current_queries() -> Optional[QueryStats]:
+    """Statistics of the innermost track_queries() block, if any."""
+    return _current_queries.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the SQL statements executed within the block."""
+    stats = QueryStats()
+    token = _current_queries.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_queries.reset(token)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryStats]:
+    """
+    Count every statement executed through `engine` within the block,
+    from any thread; meant for tests.
+    """
+    stats = QueryStats()
+
+    def after_execute(conn, cursor, statement, parameters, context, many):
+        stats.record(statement, 0.0)
+
+    event.listen(engine, "after_cursor_execute", after_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "after_cursor_execute", after_execute)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement executed through `engine`."""
+    if event.contains(engine, "before_cursor_execute", _before_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_execute)
+    event.listen(engine, "after_cursor_execute", _after_execute)
+
+
+def _before_execute(conn, cursor, statement, parameters, context, many):
+    context._query_start = time.perf_counter()
+
+
+def _after_execute(conn, cursor, statement, parameters, context, many):
+    elapsed = time.perf_counter() - context._query_start
+    db_query_duration.observe(elapsed)
+    stats = _current_queries.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    threshold = slow_log.query_threshold
+    if threshold is not None and elapsed >= threshold:
+        slow_log.write(
+            "slow_query",
+            statement=redact_statement(statement),
+            # executemany() runs a statement once per parameter set
+            parameters=redact_parameters(
+                parameters[0] if many and parameters else parameters
+            ),
+            executions=len(parameters) if many else 1,
+            duration_ms=round(elapsed * 1000, 1),
+        )
@@ -0,0 +1,133 @@
+"""Application-scoped metrics."""
+
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from starlette.routing import BaseRoute
+
+from src.domain.value_objects.recommendation import RecommendationAlgorithm
+from src.infrastructure.cache.caches import cache_stats
+from src.infrastructure.config.settings import settings
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+if TYPE_CHECKING:
+    # Imports this module for its metrics
+    from src.infrastructure.metrics.database import QueryStats
+
+STATUS_CLASSES = ("2xx", "3xx", "4xx", "5xx")
+# Route label of requests that matched no route
+UNMATCHED_ROUTE = "unmatched"
+HTTP_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+)
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+MODEL_BUILD_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+class HttpMetrics:
+    """Per-route request metrics recorded by MetricsMiddleware."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self.requests_in_flight = registry.gauge(
+            "http_requests_in_flight",
+            "HTTP requests being served",
+        )
+        self.request_duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route template",
+            ("method", "route", "status"),
+        )
+        self.request_db_queries = registry.histogram(
+            "http_request_db_queries",
+            "SQL statements executed per HTTP request",
+            ("route",),
+            buckets=QUERY_COUNT_BUCKETS,
+        )
+        self.request_db_duration = registry.histogram(
+            "http_request_db_duration_seconds",
+            "Time spent in SQL statements per HTTP request",
+            ("route",),
+        )
+
+    def register_routes(self, routes: Iterable[BaseRoute]) -> None:
+        """
+        Create the series of every route up front, so that they are
+        created before worker processes fork and shared between them.
+        """
+        endpoints = [
+            (route.path, route.methods)
+            for route in routes
+            if getattr(route, "methods", None)
+        ]
+        endpoints.append((UNMATCHED_ROUTE, {"GET", "POST"}))
+        for path, methods in endpoints:
+            for method in methods:
+                for status in STATUS_CLASSES:
+                    self.request_duration.labels(method, path, status)
+            self.request_db_queries.labels(path)
+            self.request_db_duration.labels(path)
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        queries: Optional["QueryStats"] = None,
+    ) -> None:
+        if method not in HTTP_METHODS:
+            method = "OTHER"
+        self.request_duration.labels(
+            method, route, f"{status // 100}xx"
+        ).observe(duration)
+        if queries is not None:
+            self.request_db_queries.labels(route).observe(queries.count)
+            self.request_db_duration.labels(route).observe(queries.seconds)
+
+
+metrics_registry = MetricsRegistry(
+    collect_interval=settings.metrics_collect_interval_seconds
+)
+
+http_metrics = HttpMetrics(metrics_registry)
+
+db_query_duration = metrics_registry.histogram(
+    "db_query_duration_seconds",
+    "Duration of SQL statements",
+)
+
+model_build_duration = metrics_registry.histogram(
+    "recommendation_model_build_seconds",
+    "Time to build a recommendation model",
+    ("model",),
+    buckets=MODEL_BUILD_BUCKETS,
+)
+for algorithm in RecommendationAlgorithm:
+    model_build_duration.labels(algorithm.value)
+
+cache_hits = metrics_registry.counter(
+    "cache_hits_total", "Cache lookups that found an entry", ("cache",)
+)
+cache_misses = metrics_registry.counter(
+    "cache_misses_total", "Cache lookups that found no entry", ("cache",)
+)
+cache_evictions = metrics_registry.counter(
+    "cache_evictions_total", "Entries evicted to respect limits", ("cache",)
+)
+cache_entries = metrics_registry.gauge(
+    "cache_entries", "Entries held by the cache", ("cache",)
+)
+
+
+def collect_cache_stats() -> None:
+    for name, stats in cache_stats().items():
+        cache_hits.labels(name).set_total(stats.hits)
+        cache_misses.labels(name).set_total(stats.misses)
+        cache_evictions.labels(name).set_total(stats.evictions)
+        cache_entries.labels(name).set(stats.size)
+
+
+metrics_registry.add_collector(collect_cache_stats)
+# Creates the cache series before any fork
+collect_cache_stats()
@@ -0,0 +1,191 @@
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import CodeType, FrameType
+from typing import Dict, Optional
+
+# Innermost frames of a thread waiting for work rather than doing it:
+# idle worker threads block in queue.get, the event loop in select and
+# process pool feeder threads in their feed loop
+_IDLE_FRAMES = {
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("queues.py", "_feed"),
+}
+# How many innermost frames are checked against _IDLE_FRAMES
+_IDLE_DEPTH = 3
+
+
+@dataclass
+class Profile:
+    # Collapsed stacks ("thread;outer;...;inner") and how often each was
+    # sampled
+    stacks: Counter
+    seconds: float
+    interval: float
+    # "cpu" when sampled on a CPU-time signal, "wall" from a thread
+    mode: str
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed(self, limit: Optional[int] = None) -> str:
+        """
+        The stacks in collapsed format, one "stack count" line each, as
+        read by flamegraph.pl, speedscope and similar tools.
+        """
+        return "".join(
+            f"{stack} {count}\n"
+            for stack, count in self.stacks.most_common(limit)
+        )
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler sampling the Python stacks of every thread.
+
+    On the main thread of platforms with interval timers, stacks are
+    sampled from a SIGPROF handler, every `interval` seconds of CPU time
+    used by the process; elsewhere a background thread samples them
+    every `interval` seconds of wall-clock time. Threads idle waiting
+    for work are left out.
+
+    The timer is process-wide, so one profile runs at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stacks: Optional[Counter] = None
+        self._labels: Dict[CodeType, str] = {}
+        self._started = 0.0
+        self._interval = 0.0
+        self._mode = ""
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._previous_handler = None
+
+    @property
+    def running(self) -> bool:
+        return self._stacks is not None
+
+    def start(self, interval: float = 0.005) -> bool:
+        """Start sampling; False if a profile is already running."""
+        if not self._lock.acquire(blocking=False):
+            return False
+
+        self._stacks = Counter()
+        self._interval = interval
+        self._started = time.perf_counter()
+        if (hasattr(signal, "setitimer")
+                and threading.current_thread() is threading.main_thread()):
+            self._mode = "cpu"
+            self._previous_handler = signal.signal(
+                signal.SIGPROF, self._handle_signal
+            )
+            signal.setitimer(signal.ITIMER_PROF, interval, interval)
+        else:
+            self._mode = "wall"
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="profiler", daemon=True
+            )
+            self._thread.start()
+        return True
+
+    def stop(self) -> Profile:
+        """Stop sampling and return what was sampled since start()."""
+        if self._mode == "cpu":
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+        else:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+
+        profile = Profile(
+            stacks=self._stacks,
+            seconds=time.perf_counter() - self._started,
+            interval=self._interval,
+            mode=self._mode,
+        )
+        self._stacks = None
+        self._lock.release()
+        return profile
+
+    def _handle_signal(self, signum: int, frame: Optional[FrameType]):
+        # The handler runs on the main thread; its own frame is replaced
+        # by the frame it interrupted
+        self._sample(threading.main_thread().ident, frame)
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self._interval):
+            self._sample(threading.get_ident(), None)
+
+    def _sample(
+        self,
+        current_thread: int,
+        current_frame: Optional[FrameType]
+    ) -> None:
+        stacks = self._stacks
+        if stacks is None:
+            # A signal delivered while stopping
+            return
+
+        names = {
+            thread.ident: thread.name for thread in threading.enumerate()
+        }
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == current_thread:
+                frame = current_frame
+            if frame is None or self._is_idle(frame):
+                continue
+            thread_name = names.get(thread_id, "thread")
+            stacks[self._collapse(thread_name, frame)] += 1
+
+    def _is_idle(self, frame: FrameType) -> bool:
+        for _ in range(_IDLE_DEPTH):
+            if frame is None:
+                return False
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) \
+                    in _IDLE_FRAMES:
+                return True
+            frame = frame.f_back
+        return False
+
+    def _collapse(self, thread_name: str, frame: FrameType) -> str:
+        labels = []
+        while frame is not None:
+            labels.append(self._label(frame.f_code))
+            frame = frame.f_back
+        labels.append(thread_name)
+        return ";".join(reversed(labels))
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = (
+                f"{code.co_name} "
+                f"({_short_path(code.co_filename)}:{code.co_firstlineno})"
+            )
+            self._labels[code] = label
+        return label
+
+
+def _short_path(filename: str) -> str:
+    """`filename` relative to the longest sys.path entry containing it."""
+    best = ""
+    for entry in sys.path:
+        if (entry and filename.startswith(entry.rstrip(os.sep) + os.sep)
+                and len(entry) > len(best)):
+            best = entry
+    return os.path.relpath(filename, best) if best else filename
+
+
+# Global instance shared by the profiling endpoint and middleware
+profiler = SamplingProfiler()
@@ -0,0 +1,498 @@
+import bisect
+import math
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Latency buckets in seconds, as in the Prometheus client libraries
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Text exposition format; the response adds the charset
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Shard that accumulates the values of processes that exited
+RETIRED_SHARD = 0
+
+
+class _Series:
+    """Slots of one label combination of a metric."""
+
+    __slots__ = ("_registry", "_offset", "_local")
+
+    def __init__(self, registry: "MetricsRegistry", offset: int, local: bool):
+        self._registry = registry
+        self._offset = offset
+        self._local = local
+
+
+class CounterSeries(_Series):
+    __slots__ = ()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._registry._add(self._offset, self._local, amount)
+
+    def set_total(self, value: float) -> None:
+        """Set from a monotonic total kept elsewhere (e.g. cache stats)."""
+        self._registry._set(self._offset, self._local, value)
+
+
+class GaugeSeries(_Series):
+    __slots__ = ()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._registry._add(self._offset, self._local, amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._registry._add(self._offset, self._local, -amount)
+
+    def set(self, value: float) -> None:
+        self._registry._set(self._offset, self._local, value)
+
+
+class HistogramSeries(_Series):
+    __slots__ = ("_bounds",)
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        offset: int,
+        local: bool,
+        bounds: Tuple[float, ...],
+    ):
+        super().__init__(registry, offset, local)
+        self._bounds = bounds
+
+    def observe(self, value: float) -> None:
+        # Slots: one count per bucket (the last one is +Inf), sum, count
+        self._registry._observe(
+            self._offset,
+            self._local,
+            bisect.bisect_left(self._bounds, value),
+            len(self._bounds) + 1,
+            value,
+        )
+
+
+class Metric:
+    """A named metric and its series, one per combination of labels."""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self.bounds = tuple(sorted(buckets)) if kind == "histogram" else ()
+        self._series: Dict[Tuple[str, ...], _Series] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of slots used by each series."""
+        return len(self.bounds) + 3 if self.kind == "histogram" else 1
+
+    def labels(self, *values, **labels) -> _Series:
+        if labels:
+            values = tuple(labels[name] for name in self.labelnames)
+        # Label values are strings, so the common lookup needs no copy
+        series = self._series.get(values)
+        if series is None:
+            key = tuple(str(value) for value in values)
+            with self._lock:
+                series = self._series.get(key)
+                if series is None:
+                    if len(key) != len(self.labelnames):
+                        raise ValueError(
+                            f"{self.name} expects labels {self.labelnames}"
+                        )
+                    series = self._create_series()
+                    self._series[key] = series
+        return series
+
+    def _create_series(self) -> _Series:
+        offset, local = self.registry._allocate(
+            self.size, gauge=self.kind == "gauge"
+        )
+        if self.kind == "counter":
+            return CounterSeries(self.registry, offset, local)
+        if self.kind == "gauge":
+            return GaugeSeries(self.registry, offset, local)
+        return HistogramSeries(self.registry, offset, local, self.bounds)
+
+    # Shortcuts for metrics without labels
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges and histograms in the Prometheus text format.
+
+    Updates only add to preallocated slots under an uncontended lock, so
+    they are cheap enough for every request and query. Collectors
+    registered with `add_collector` copy values kept elsewhere (e.g.
+    cache statistics) into metrics; they run on render and at most every
+    `collect_interval` seconds through `maybe_collect`.
+
+    Calling share() before forking worker processes moves the values to
+    shared memory split into one shard per process: each process only
+    writes its own shard and rendering sums all of them, so any worker
+    reports the totals of the server. Shards of processes that exited
+    are folded into a retired shard before being reused, which keeps
+    counters monotonic. Only series created before the fork are shared;
+    series first created in a worker are reported by that worker alone.
+    """
+
+    def __init__(self, collect_interval: float = 5.0):
+        self.collect_interval = collect_interval
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._next_collect = 0.0
+        self._lock = threading.Lock()
+        # Slots of the series created before the fork; a list until
+        # share() replaces it with the shared shards
+        self._values = []
+        self._base: Optional[int] = 0
+        self._allocated = 0
+        self._gauge_offsets: List[int] = []
+        # Slots of the series created after the fork
+        self._local: List[float] = []
+        self._forked = False
+        # Shared state once share() has been called
+        self._arena = None
+        self._owners = None
+        self._shared_lock = None
+        self._shard_size = 0
+        self._fallback = False
+
+    @property
+    def shared(self) -> bool:
+        return self._arena is not None
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> Metric:
+        return self._register(name, documentation, "counter", labelnames)
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+    ) -> Metric:
+        return self._register(name, documentation, "gauge", labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Metric:
+        return self._register(
+            name, documentation, "histogram", labelnames, buckets
+        )
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        self._collectors.append(collector)
+
+    def collect(self) -> None:
+        self._next_collect = time.monotonic() + self.collect_interval
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                logger.exception("metrics_collector_failed")
+
+    def maybe_collect(self) -> None:
+        if time.monotonic() >= self._next_collect:
+            self.collect()
+
+    def share(self, processes: int = 64, slots: int = 8192) -> None:
+        """Move the values to memory inherited by forked children."""
+        if self._arena is not None:
+            return
+        if self._allocated > slots:
+            raise ValueError(f"{self._allocated} slots already in use")
+
+        context = multiprocessing.get_context("fork")
+        # One retired shard plus one per process
+        self._arena = context.RawArray("d", (processes + 1) * slots)
+        self._owners = context.RawArray("q", processes + 1)
+        self._shared_lock = context.Lock()
+        self._shard_size = slots
+
+        # This process keeps the first shard; children claim their own
+        values = self._values
+        self._owners[1] = os.getpid()
+        self._base = slots
+        self._values = self._arena
+        for offset, value in enumerate(values):
+            self._arena[self._base + offset] = value
+
+        registry = weakref.ref(self)
+        os.register_at_fork(
+            after_in_child=lambda: _after_fork_in_child(registry)
+        )
+
+    def render(self) -> str:
+        self.collect()
+        shards = self._shards()
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key, series in sorted(metric._series.items()):
+                labels = list(zip(metric.labelnames, key))
+                values = self._read(series, metric, shards)
+                if metric.kind == "histogram":
+                    # Series are created up front; show them once used
+                    if values[-1]:
+                        lines.extend(
+                            _histogram_lines(metric, labels, values)
+                        )
+                else:
+                    lines.append(
+                        f"{metric.name}{_labels(labels)} "
+                        f"{_format(values[0])}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def _register(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Metric:
+        if name in self._metrics:
+            raise ValueError(f"Metric {name} already registered")
+        metric = Metric(self, name, documentation, kind, labelnames, buckets)
+        self._metrics[name] = metric
+        if not metric.labelnames:
+            # Its only series, created now so it precedes any fork
+            metric.labels()
+        return metric
+
+    def _allocate(self, size: int, gauge: bool) -> Tuple[int, bool]:
+        with self._lock:
+            if self._forked or (
+                self.shared and self._allocated + size > self._shard_size
+            ):
+                if not self._forked:
+                    logger.warning("metrics_shard_full")
+                offset = len(self._local)
+                self._local.extend([0.0] * size)
+                return offset, True
+
+            offset = self._allocated
+            self._allocated += size
+            if not self.shared:
+                self._values.extend([0.0] * size)
+            if gauge:
+                self._gauge_offsets.append(offset)
+            return offset, False
+
+    def _add(self, offset: int, local: bool, amount: float) -> None:
+        with self._lock:
+            if local:
+                self._local[offset] += amount
+                return
+            if self._base is None:
+                self._claim()
+            self._values[self._base + offset] += amount
+
+    def _set(self, offset: int, local: bool, value: float) -> None:
+        with self._lock:
+            if local:
+                self._local[offset] = value
+                return
+            if self._base is None:
+                self._claim()
+            self._values[self._base + offset] = value
+
+    def _observe(
+        self,
+        offset: int,
+        local: bool,
+        bucket: int,
+        buckets: int,
+        value: float,
+    ) -> None:
+        with self._lock:
+            if local:
+                values, base = self._local, 0
+            else:
+                if self._base is None:
+                    self._claim()
+                values, base = self._values, self._base
+            start = base + offset
+            values[start + bucket] += 1
+            values[start + buckets] += value
+            values[start + buckets + 1] += 1
+
+    def _claim(self) -> None:
+        """Take a shard for this process; called with _lock held."""
+        pid = os.getpid()
+        with self._shared_lock:
+            for shard in range(RETIRED_SHARD + 1, len(self._owners)):
+                owner = self._owners[shard]
+                if owner != 0 and _is_alive(owner):
+                    continue
+                if owner != 0:
+                    self._retire(shard)
+                self._owners[shard] = pid
+                self._base = shard * self._shard_size
+                return
+
+        # Values stay private to this process
+        logger.warning("metrics_shards_exhausted", pid=pid)
+        self._fallback = True
+        self._values = [0.0] * self._shard_size
+        self._base = 0
+
+    def _retire(self, shard: int) -> None:
+        """Fold the shard of an exited process into the retired one."""
+        base = shard * self._shard_size
+        gauges = set(self._gauge_offsets)
+        for offset in range(self._allocated):
+            if offset not in gauges:
+                self._arena[offset] += self._arena[base + offset]
+            self._arena[base + offset] = 0.0
+
+    def _shards(self) -> List[Tuple[Sequence[float], int, bool]]:
+        """(values, base, live) of every shard to sum when rendering."""
+        if not self.shared:
+            return [(self._values, 0, True)]
+
+        shards = [(self._arena, RETIRED_SHARD, False)]
+        for shard in range(RETIRED_SHARD + 1, len(self._owners)):
+            owner = self._owners[shard]
+            if owner != 0:
+                shards.append((
+                    self._arena,
+                    shard * self._shard_size,
+                    owner == os.getpid() or _is_alive(owner),
+                ))
+        if self._fallback:
+            shards.append((self._values, 0, True))
+        return shards
+
+    def _read(
+        self,
+        series: _Series,
+        metric: Metric,
+        shards: List[Tuple[Sequence[float], int, bool]],
+    ) -> List[float]:
+        size = metric.size
+        if series._local:
+            return self._local[series._offset:series._offset + size]
+
+        totals = [0.0] * size
+        for values, base, live in shards:
+            # Gauges of exited processes no longer mean anything
+            if metric.kind == "gauge" and not live:
+                continue
+            start = base + series._offset
+            for index, value in enumerate(values[start:start + size]):
+                totals[index] += value
+        return totals
+
+
+def _after_fork_in_child(registry_ref) -> None:
+    registry = registry_ref()
+    if registry is None:
+        return
+    registry._lock = threading.Lock()
+    registry._forked = True
+    registry._base = None
+    registry._fallback = False
+    registry._values = registry._arena
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _histogram_lines(
+    metric: Metric,
+    labels: List[Tuple[str, str]],
+    values: List[float],
+) -> List[str]:
+    buckets = len(metric.bounds) + 1
+    lines = []
+    cumulative = 0.0
+    for bound, count in zip(metric.bounds + (math.inf,), values[:buckets]):
+        cumulative += count
+        le = _format(bound)
+        lines.append(
+            f"{metric.name}_bucket{_labels(labels + [('le', le)])} "
+            f"{_format(cumulative)}"
+        )
+    lines.append(
+        f"{metric.name}_sum{_labels(labels)} {_format(values[buckets])}"
+    )
+    lines.append(
+        f"{metric.name}_count{_labels(labels)} "
+        f"{_format(values[buckets + 1])}"
+    )
+    return lines
+
+
+def _labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in labels
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    )
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
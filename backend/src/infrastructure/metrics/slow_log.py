@@ -0,0 +1,133 @@
+import json
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+# Marks the end of the queue for the writer thread
+_CLOSE = object()
+
+
+class SlowLog:
+    """
+    JSON lines log of slow requests and SQL statements.
+
+    write() only queues the entry; a background thread formats and
+    writes queued entries in batches, so slow requests do not get slower
+    for being logged. Entries beyond `max_pending` are dropped (and
+    counted) rather than blocking the caller.
+    """
+
+    def __init__(self, max_pending: int = 10_000):
+        self.max_pending = max_pending
+        # Statements taking at least this long are logged; None disables
+        self.query_threshold: Optional[float] = None
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue(max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._stream: Optional[TextIO] = None
+        self._owns_stream = False
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(
+        self,
+        path: Optional[str] = None,
+        query_threshold: Optional[float] = None,
+        stream: Optional[TextIO] = None
+    ) -> None:
+        """Write to `path` (appending), `stream` or stderr."""
+        if self._thread is not None:
+            return
+        if path is not None:
+            self._stream = open(path, "a", encoding="utf-8")
+            self._owns_stream = True
+        else:
+            self._stream = stream or sys.stderr
+            self._owns_stream = False
+        self.query_threshold = query_threshold
+        self._thread = threading.Thread(
+            target=self._run, name="slow-log", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Write the queued entries and stop the writer thread."""
+        if self._thread is None:
+            return
+        self.query_threshold = None
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._thread = None
+        if self._owns_stream:
+            self._stream.close()
+        self._stream = None
+
+    def write(self, event: str, **fields: Any) -> None:
+        if self._thread is None:
+            return
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "event": event,
+            **fields,
+        }
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            entries: List[Dict[str, Any]] = [self._queue.get()]
+            # Whatever else is queued goes out in the same write
+            while len(entries) < self.max_pending:
+                try:
+                    entries.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing = any(entry is _CLOSE for entry in entries)
+            if closing:
+                entries = [entry for entry in entries if entry is not _CLOSE]
+            if entries:
+                self._stream.write("".join(
+                    json.dumps(entry, default=str) + "\n"
+                    for entry in entries
+                ))
+                self._stream.flush()
+            if closing:
+                return
+
+
+# Mutated in place, so tags set in threadpool threads (which get a copy
+# of the context) reach the middleware that started tracking
+_current_tags: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "current_request_tags", default=None
+)
+
+
+def tag_request(**tags: Any) -> None:
+    """Attach `tags` (e.g. user_id) to the request being served, if any."""
+    current = _current_tags.get()
+    if current is not None:
+        current.update(tags)
+
+
+@contextmanager
+def track_request_tags() -> Iterator[Dict[str, Any]]:
+    """Collect the tag_request() calls made within the block."""
+    tags: Dict[str, Any] = {}
+    token = _current_tags.set(tags)
+    try:
+        yield tags
+    finally:
+        _current_tags.reset(token)
+
+
+# Global instance, started with the application
+slow_log = SlowLog()
@@ -0,0 +1,71 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+
+@dataclass
+class StageTimings:
+    # Seconds per stage, in the order stages first ran; a stage run more
+    # than once accumulates
+    stages: Dict[str, float] = field(default_factory=dict)
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def as_milliseconds(self) -> Dict[str, float]:
+        return {
+            stage: round(seconds * 1000, 2)
+            for stage, seconds in self.stages.items()
+        }
+
+    def server_timing(self) -> str:
+        """The stages as a Server-Timing header value."""
+        return ", ".join(
+            f"{stage};dur={seconds * 1000:.2f}"
+            for stage, seconds in self.stages.items()
+        )
+
+
+# Mutated in place, so stages run in threadpool threads (which get a
+# copy of the context) are recorded for the request that started them
+_current_timings: ContextVar[Optional[StageTimings]] = ContextVar(
+    "current_timings", default=None
+)
+
+
+def current_timings() -> Optional[StageTimings]:
+    """Timings of the innermost time_stages() block, if any."""
+    return _current_timings.get()
+
+
+@contextmanager
+def time_stages() -> Iterator[StageTimings]:
+    """Record the duration of the span() blocks run within the block."""
+    timings = StageTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """
+    Time the block as `stage` of the current request.
+
+    Outside time_stages() (e.g. requests that were not sampled) this
+    only costs a context variable lookup.
+    """
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.record(stage, time.perf_counter() - start)
@@ -0,0 +1,11 @@
+"""Rate limiting package."""
+
+from .store import TokenBucketStore
+from .memory_store import InMemoryTokenBucketStore
+from .factory import create_token_bucket_store
+
+__all__ = [
+    "TokenBucketStore",
+    "InMemoryTokenBucketStore",
+    "create_token_bucket_store",
+]
@@ -0,0 +1,26 @@
+from typing import Optional
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.rate_limiting.memory_store import (
+    InMemoryTokenBucketStore
+)
+from src.infrastructure.rate_limiting.store import TokenBucketStore
+
+
+def create_token_bucket_store(
+    backend: Optional[str] = None,
+) -> TokenBucketStore:
+    """
+    Create a token bucket store for the configured backend.
+
+    Shared backends (e.g. Redis) plug in here by implementing
+    TokenBucketStore, so limits hold across worker processes.
+    """
+    backend = (backend or settings.rate_limit_backend).lower()
+
+    if backend == "memory":
+        return InMemoryTokenBucketStore(
+            max_keys=settings.rate_limit_max_keys
+        )
+
+    raise ValueError(f"Unsupported rate limit backend: {backend}")
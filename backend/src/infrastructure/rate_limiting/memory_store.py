@@ -0,0 +1,64 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+from src.infrastructure.rate_limiting.store import TokenBucketStore
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """
+    Thread-safe in-process token buckets.
+
+    At most `max_keys` buckets are kept; the least recently used bucket is
+    dropped first, which only ever resets a client to a full bucket.
+    """
+
+    def __init__(
+        self,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> (tokens, updated_at)
+        self._buckets: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(
+        self,
+        key: str,
+        capacity: int,
+        refill_per_second: float,
+        tokens: int = 1,
+    ) -> Tuple[bool, float]:
+        now = self._clock()
+        with self._lock:
+            available, updated_at = self._buckets.get(key, (capacity, now))
+            available = min(
+                capacity,
+                available + (now - updated_at) * refill_per_second,
+            )
+
+            allowed = available >= tokens
+            if allowed:
+                available -= tokens
+                retry_after = 0.0
+            elif refill_per_second > 0:
+                retry_after = (tokens - available) / refill_per_second
+            else:
+                retry_after = float("inf")
+
+            self._buckets[key] = (available, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+        return allowed, retry_after
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
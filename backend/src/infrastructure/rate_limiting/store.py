@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Tuple
+
+
+class TokenBucketStore(ABC):
+    """Storage for token buckets shared by the rate limiter."""
+
+    @abstractmethod
+    def consume(
+        self,
+        key: str,
+        capacity: int,
+        refill_per_second: float,
+        tokens: int = 1,
+    ) -> Tuple[bool, float]:
+        """
+        Take `tokens` from the bucket at `key`, creating it full.
+
+        Returns whether the request is allowed and, if not, how many
+        seconds until enough tokens are available.
+        """
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
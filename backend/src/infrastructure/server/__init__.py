@@ -0,0 +1,13 @@
+"""Production server package."""
+
+from .prefork import (
+    PreforkServer,
+    default_worker_count,
+    processes_per_worker,
+)
+
+__all__ = [
+    "PreforkServer",
+    "default_worker_count",
+    "processes_per_worker",
+]
@@ -0,0 +1,269 @@
+import gc
+import os
+import select
+import signal
+import socket
+import time
+from typing import Callable, Dict, List, Optional
+
+import structlog
+import uvicorn
+from starlette.types import ASGIApp
+
+logger = structlog.get_logger(__name__)
+
+
+def default_worker_count() -> int:
+    return os.cpu_count() or 1
+
+
+def processes_per_worker(workers: int, cpus: Optional[int] = None) -> int:
+    """Share of the CPUs available to each worker's helper processes."""
+    cpus = cpus or default_worker_count()
+    return max(1, cpus // max(workers, 1))
+
+
+class _NotifyingServer(uvicorn.Server):
+    """Uvicorn server that reports through a pipe once it is serving."""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int):
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets: Optional[List[socket.socket]] = None):
+        await super().startup(sockets=sockets)
+        # Closing without writing tells the parent that startup failed
+        if not self.should_exit:
+            os.write(self.ready_fd, b"1")
+        os.close(self.ready_fd)
+
+
+class PreforkServer:
+    """
+    Pre-forking process manager for the ASGI application.
+
+    The parent binds the listening socket, loads the application and
+    runs `preload` once, then forks `workers` uvicorn processes that
+    accept on the shared socket and inherit, copy-on-write, everything
+    loaded before the fork. Workers that exit are replaced.
+
+    SIGHUP runs `preload` again and replaces the workers one at a time;
+    an old worker is only stopped once its replacement is serving, and
+    then finishes its in-flight requests. SIGTERM and SIGINT stop all
+    workers gracefully.
+    """
+
+    def __init__(
+        self,
+        load_app: Callable[[], ASGIApp],
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: Optional[int] = None,
+        graceful_timeout: int = 30,
+        preload: Optional[Callable[[], None]] = None,
+        ready_timeout: float = 60.0,
+        log_level: str = "info",
+    ):
+        self.load_app = load_app
+        self.host = host
+        self.port = port
+        self.workers = workers or default_worker_count()
+        self.graceful_timeout = graceful_timeout
+        self.preload = preload
+        self.ready_timeout = ready_timeout
+        self.log_level = log_level
+        self.app: Optional[ASGIApp] = None
+        self.sock: Optional[socket.socket] = None
+        # pid -> read end of the worker's ready pipe
+        self._workers: Dict[int, int] = {}
+        # pid -> deadline of workers asked to stop
+        self._retiring: Dict[int, float] = {}
+        self._signals: List[int] = []
+        self._wakeup_r, self._wakeup_w = -1, -1
+
+    def run(self) -> None:
+        self.sock = self._bind()
+        self.app = self.load_app()
+        self._run_preload()
+        self._install_signal_handlers()
+        logger.info(
+            "server_started",
+            host=self.host,
+            port=self.port,
+            workers=self.workers,
+        )
+        try:
+            self._maintain_workers()
+            self._loop()
+        finally:
+            self._stop_workers()
+            self.sock.close()
+            logger.info("server_stopped")
+
+    def _bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def _run_preload(self) -> None:
+        if self.preload is not None:
+            start = time.perf_counter()
+            self.preload()
+            logger.info(
+                "server_preload",
+                duration_ms=round((time.perf_counter() - start) * 1000, 1),
+            )
+        # Keep the collector from touching (and so copying) the pages
+        # of objects inherited from the parent
+        gc.collect()
+        gc.freeze()
+
+    def _loop(self) -> None:
+        while True:
+            readable, _, _ = select.select([self._wakeup_r], [], [], 1.0)
+            if readable:
+                os.read(self._wakeup_r, 1024)
+
+            while self._signals:
+                signum = self._signals.pop(0)
+                if signum in (signal.SIGTERM, signal.SIGINT):
+                    return
+                if signum == signal.SIGHUP:
+                    self._reload()
+
+            self._reap_workers()
+            self._maintain_workers()
+
+    def _reload(self) -> None:
+        logger.info("server_reload")
+        try:
+            self._run_preload()
+        except Exception:
+            # Keep the current workers serving the previous models
+            logger.exception("server_reload_failed")
+            return
+
+        for old_pid in list(self._workers):
+            if old_pid not in self._workers:
+                continue
+            new_pid = self._spawn_worker()
+            if not self._wait_ready(new_pid):
+                logger.error("worker_start_failed", pid=new_pid)
+                self._retire_worker(new_pid)
+                return
+            self._retire_worker(old_pid)
+        logger.info("server_reloaded", workers=len(self._workers))
+
+    def _spawn_worker(self) -> int:
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            exit_code = 0
+            try:
+                self._run_worker(ready_w)
+            except BaseException:
+                logger.exception("worker_failed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        os.close(ready_w)
+        self._workers[pid] = ready_r
+        logger.info("worker_spawned", pid=pid)
+        return pid
+
+    def _run_worker(self, ready_fd: int) -> None:
+        # Only the parent reloads; uvicorn installs its own exit handlers
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.set_wakeup_fd(-1)
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+        for fd in self._workers.values():
+            os.close(fd)
+
+        config = uvicorn.Config(
+            self.app,
+            lifespan="on",
+            log_level=self.log_level,
+            # uvicorn's records go through the application's log pipeline
+            log_config=None,
+            timeout_graceful_shutdown=self.graceful_timeout,
+        )
+        _NotifyingServer(config, ready_fd).run(sockets=[self.sock])
+
+    def _wait_ready(self, pid: int) -> bool:
+        ready_fd = self._workers[pid]
+        readable, _, _ = select.select([ready_fd], [], [], self.ready_timeout)
+        return bool(readable) and os.read(ready_fd, 1) == b"1"
+
+    def _retire_worker(self, pid: int) -> None:
+        ready_fd = self._workers.pop(pid, None)
+        if ready_fd is not None:
+            os.close(ready_fd)
+        self._retiring[pid] = time.monotonic() + self.graceful_timeout + 5
+        self._kill(pid, signal.SIGTERM)
+
+    def _reap_workers(self) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+
+            if self._retiring.pop(pid, None) is not None:
+                logger.info("worker_stopped", pid=pid)
+                continue
+            ready_fd = self._workers.pop(pid, None)
+            if ready_fd is not None:
+                os.close(ready_fd)
+                logger.warning(
+                    "worker_exited",
+                    pid=pid,
+                    exit_code=os.waitstatus_to_exitcode(status),
+                )
+
+        # Workers that did not finish within the graceful timeout
+        now = time.monotonic()
+        for pid, deadline in list(self._retiring.items()):
+            if now > deadline:
+                self._kill(pid, signal.SIGKILL)
+
+    def _maintain_workers(self) -> None:
+        while len(self._workers) < self.workers:
+            self._spawn_worker()
+
+    def _stop_workers(self) -> None:
+        for pid in list(self._workers):
+            self._retire_worker(pid)
+        while self._retiring:
+            self._reap_workers()
+            time.sleep(0.1)
+
+    def _install_signal_handlers(self) -> None:
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        os.set_blocking(self._wakeup_w, False)
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(signum, self._handle_signal)
+
+    def _handle_signal(self, signum: int, frame) -> None:
+        self._signals.append(signum)
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except BlockingIOError:
+            pass
+
+    @staticmethod
+    def _kill(pid: int, signum: int) -> None:
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
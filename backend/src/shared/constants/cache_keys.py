@@ -0,0 +1,21 @@
+"""Cache key templates shared between use cases and repositories."""
+
+MOVIES_CACHE_PREFIX = "movies:"
+MOVIE_LIST_CACHE_KEY = MOVIES_CACHE_PREFIX + "list:{page}:{per_page}"
+POPULAR_MOVIES_CACHE_KEY = MOVIES_CACHE_PREFIX + "popular:{page}:{per_page}"
+
+# Ranked recommendation lists, invalidated per user. The version is the
+# user's likes version, so entries cached by other worker processes stop
+# matching once the user likes or unlikes a movie.
+USER_RECOMMENDATIONS_CACHE_PREFIX = "recommendations:{user_id}:"
+RECOMMENDATIONS_CACHE_KEY = (
+    USER_RECOMMENDATIONS_CACHE_PREFIX + "{algorithm}:{version}"
+)
+
+# Authenticated users, invalidated when the user is saved or deleted
+USER_CACHE_PREFIX = "users:{user_id}:"
+USER_CACHE_KEY = USER_CACHE_PREFIX + "{version}"
+
+# Verified access tokens, keyed by the SHA-256 of the token so that no
+# usable credential is stored in the cache
+TOKEN_CACHE_KEY = "tokens:{token_digest}"
@@ -20,3 +20,7 @@ class UserInactiveException(AuthException):
 
 class InvalidTokenException(AuthException):
     pass
+
+
+class PasswordHashingBusyException(AuthException):
+    pass
@@ -0,0 +1,46 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator, Optional
+
+import pytest
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.metrics.database import QueryStats, count_queries
+
+
+@pytest.fixture
+def max_queries() -> Callable[..., ContextManager[QueryStats]]:
+    """
+    Fail when a block executes more SQL statements than allowed.
+
+        def test_list_movies(self, max_queries):
+            with max_queries(2, engine=self.engine):
+                self.repository.get_all(page=1, per_page=20)
+
+    Counts statements of `engine` (the application engine by default)
+    from any thread, so it also covers requests made with TestClient.
+    """
+    @contextmanager
+    def assert_max_queries(
+        limit: int,
+        engine: Optional[Engine] = None,
+    ) -> Iterator[QueryStats]:
+        if engine is None:
+            from src.infrastructure.database.connection import (
+                engine as app_engine
+            )
+            engine = app_engine
+
+        with count_queries(engine) as queries:
+            yield queries
+
+        if queries.count > limit:
+            executed = "\n".join(
+                f"  {count} x {statement}"
+                for statement, count in queries.repeated(1)
+            )
+            pytest.fail(
+                f"Expected at most {limit} queries, {queries.count} were "
+                f"executed:\n{executed}"
+            )
+
+    return assert_max_queries
@@ -33,8 +33,8 @@ class TestRegisterUserUseCase:
             username="testuser",
             hashed_password=hashed_password
         )
-        self.user_repository_mock.get_by_email.return_value = None
-        self.user_repository_mock.get_by_username.return_value = None
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, False)
         self.security_service_mock.hash_password.return_value = hashed_password
         self.user_repository_mock.save.return_value = created_user
         result = self.use_case.execute(user_data)
@@ -42,10 +42,8 @@ class TestRegisterUserUseCase:
         assert result.email == "test@example.com"
         assert result.username == "testuser"
         assert result.hashed_password == hashed_password
-        self.user_repository_mock.get_by_email\
-            .assert_called_once_with("test@example.com")
-        self.user_repository_mock.get_by_username\
-            .assert_called_once_with("testuser")
+        self.user_repository_mock.exists_by_email_or_username\
+            .assert_called_once_with("test@example.com", "testuser")
         self.security_service_mock.hash_password\
             .assert_called_once_with("password123")
         self.user_repository_mock.save.assert_called_once()
@@ -56,19 +54,13 @@ class TestRegisterUserUseCase:
             username="testuser",
             password="password123"
         )
-        existing_user = User(
-            id=1,
-            email="existing@example.com",
-            username="existinguser",
-            hashed_password="existing_hash"
-        )
-        self.user_repository_mock.get_by_email.return_value = existing_user
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (True, False)
         with pytest.raises(EmailAlreadyExistsException) as exc_info:
             self.use_case.execute(user_data)
         assert str(exc_info.value) == "Email already exists"
-        self.user_repository_mock.get_by_email\
-            .assert_called_once_with("existing@example.com")
-        self.user_repository_mock.get_by_username.assert_not_called()
+        self.user_repository_mock.exists_by_email_or_username\
+            .assert_called_once_with("existing@example.com", "testuser")
         self.security_service_mock.hash_password.assert_not_called()
         self.user_repository_mock.save.assert_not_called()
 
@@ -78,21 +70,13 @@ class TestRegisterUserUseCase:
             username="existinguser",
             password="password123"
         )
-        existing_user = User(
-            id=1,
-            email="existing@example.com",
-            username="existinguser",
-            hashed_password="existing_hash"
-        )
-        self.user_repository_mock.get_by_email.return_value = None
-        self.user_repository_mock.get_by_username.return_value = existing_user
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, True)
         with pytest.raises(UsernameAlreadyExistsException) as exc_info:
             self.use_case.execute(user_data)
         assert str(exc_info.value) == "Username already exists"
-        self.user_repository_mock.get_by_email\
-            .assert_called_once_with("test@example.com")
-        self.user_repository_mock.get_by_username\
-            .assert_called_once_with("existinguser")
+        self.user_repository_mock.exists_by_email_or_username\
+            .assert_called_once_with("test@example.com", "existinguser")
         self.security_service_mock.hash_password.assert_not_called()
         self.user_repository_mock.save.assert_not_called()
 
@@ -103,8 +87,8 @@ class TestRegisterUserUseCase:
             password="my_secret_password"
         )
         hashed_password = "super_secure_hash_123"
-        self.user_repository_mock.get_by_email.return_value = None
-        self.user_repository_mock.get_by_username.return_value = None
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, False)
         self.security_service_mock.hash_password.return_value = hashed_password
         self.user_repository_mock.save.return_value = User(
             id=1,
@@ -124,8 +108,8 @@ class TestRegisterUserUseCase:
             password="password123"
         )
         hashed_password = "hashed_password_123"
-        self.user_repository_mock.get_by_email.return_value = None
-        self.user_repository_mock.get_by_username.return_value = None
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, False)
         self.security_service_mock.hash_password.return_value = hashed_password
 
         def capture_save_argument(user):
@@ -169,8 +153,8 @@ class TestRegisterUserUseCase:
             username=username,
             hashed_password=hashed_password
         )
-        self.user_repository_mock.get_by_email.return_value = None
-        self.user_repository_mock.get_by_username.return_value = None
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, False)
         self.security_service_mock.hash_password.return_value = hashed_password
         self.user_repository_mock.save.return_value = created_user
         result = self.use_case.execute(user_data)
@@ -186,8 +170,8 @@ class TestRegisterUserUseCase:
             username="testuser",
             password="password123"
         )
-        self.user_repository_mock.get_by_email.return_value = None
-        self.user_repository_mock.get_by_username.return_value = None
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, False)
         self.security_service_mock.hash_password\
             .return_value = "hashed_password"
         self.user_repository_mock.save\
@@ -202,11 +186,38 @@ class TestRegisterUserUseCase:
             username="testuser",
             password="password123"
         )
-        self.user_repository_mock.get_by_email.return_value = None
-        self.user_repository_mock.get_by_username.return_value = None
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, False)
         self.security_service_mock.hash_password\
             .side_effect = Exception("Hashing error")
         with pytest.raises(Exception) as exc_info:
             self.use_case.execute(user_data)
         assert str(exc_info.value) == "Hashing error"
         self.user_repository_mock.save.assert_not_called()
+
+    def test_register_user_both_taken_reports_email(self):
+        user_data = UserCreateDTO(
+            email="existing@example.com",
+            username="existinguser",
+            password="password123"
+        )
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (True, True)
+        with pytest.raises(EmailAlreadyExistsException):
+            self.use_case.execute(user_data)
+        self.security_service_mock.hash_password.assert_not_called()
+
+    def test_register_user_conflict_on_insert_propagates(self):
+        user_data = UserCreateDTO(
+            email="test@example.com",
+            username="testuser",
+            password="password123"
+        )
+        self.user_repository_mock.exists_by_email_or_username\
+            .return_value = (False, False)
+        self.security_service_mock.hash_password\
+            .return_value = "hashed_password"
+        self.user_repository_mock.save.side_effect = \
+            UsernameAlreadyExistsException("Username already exists")
+        with pytest.raises(UsernameAlreadyExistsException):
+            self.use_case.execute(user_data)
@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import Mock
+from src.application.use_cases.likes.like_movie_use_case\
+    import LikeMovieUseCase
+from src.application.dtos.like_dto import LikeCreateDTO
+from src.domain.entities.like import Like
+from src.domain.entities.movie import Movie
+from src.domain.value_objects.recommendation import RankedRecommendations
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+from src.shared.exceptions.movie_exceptions import MovieNotFoundException
+
+
+class TestLikeMovieUseCase:
+
+    def setup_method(self):
+        self.like_repository_mock = Mock()
+        self.movie_repository_mock = Mock()
+        self.recommendation_cache = InMemoryCacheService()
+        self.use_case = LikeMovieUseCase(
+            like_repository=self.like_repository_mock,
+            movie_repository=self.movie_repository_mock,
+            recommendation_cache=self.recommendation_cache
+        )
+        self.movie_repository_mock.get_by_id.return_value = Movie(
+            id=10, title="Movie"
+        )
+        ranked = RankedRecommendations(movie_ids=(1, 2), algorithm_used="x")
+        for key in [
+            "recommendations:1:collaborative",
+            "recommendations:1:content_based",
+            "recommendations:11:collaborative",
+        ]:
+            self.recommendation_cache.set(key, ranked)
+
+    def test_like_invalidates_user_recommendations(self):
+        self.like_repository_mock.get_by_user_and_movie.return_value = None
+        self.like_repository_mock.save.return_value = Like(
+            id=5, user_id=1, movie_id=10
+        )
+        result = self.use_case.execute(1, LikeCreateDTO(movie_id=10))
+        assert result.is_liked is True
+        assert self.recommendation_cache.get(
+            "recommendations:1:collaborative"
+        ) is None
+        assert self.recommendation_cache.get(
+            "recommendations:1:content_based"
+        ) is None
+        assert self.recommendation_cache.get(
+            "recommendations:11:collaborative"
+        ) is not None
+
+    def test_unlike_invalidates_user_recommendations(self):
+        self.like_repository_mock.get_by_user_and_movie.return_value = Like(
+            id=5, user_id=1, movie_id=10
+        )
+        result = self.use_case.execute(1, LikeCreateDTO(movie_id=10))
+        assert result.is_liked is False
+        self.like_repository_mock.delete.assert_called_once_with(5)
+        assert self.recommendation_cache.get(
+            "recommendations:1:collaborative"
+        ) is None
+
+    def test_missing_movie_keeps_cache(self):
+        self.movie_repository_mock.get_by_id.return_value = None
+        with pytest.raises(MovieNotFoundException):
+            self.use_case.execute(1, LikeCreateDTO(movie_id=99))
+        assert self.recommendation_cache.get(
+            "recommendations:1:collaborative"
+        ) is not None
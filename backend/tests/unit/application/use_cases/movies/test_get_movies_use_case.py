@@ -0,0 +1,73 @@
+from unittest.mock import Mock
+from src.application.use_cases.movies.get_movies_use_case\
+    import GetMoviesUseCase
+from src.domain.entities.movie import Movie
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+
+
+class TestGetMoviesUseCase:
+
+    def setup_method(self):
+        self.movie_repository_mock = Mock()
+        self.like_repository_mock = Mock()
+        self.cache = InMemoryCacheService()
+        self.use_case = GetMoviesUseCase(
+            movie_repository=self.movie_repository_mock,
+            like_repository=self.like_repository_mock,
+            cache=self.cache
+        )
+        self.movies = [
+            Movie(id=1, title="Movie 1"),
+            Movie(id=2, title="Movie 2"),
+        ]
+        self.movie_repository_mock.get_all.return_value = (self.movies, 2)
+
+    def test_listing_is_served_from_cache(self):
+        self.like_repository_mock.get_liked_movie_ids.return_value = set()
+        first = self.use_case.execute(user_id=1, page=1, per_page=20)
+        second = self.use_case.execute(user_id=2, page=1, per_page=20)
+        assert first == second
+        self.movie_repository_mock.get_all.assert_called_once_with(
+            page=1, per_page=20
+        )
+
+    def test_is_liked_overlay_is_per_user(self):
+        self.like_repository_mock.get_liked_movie_ids.side_effect = (
+            lambda user_id, movie_ids: {2} if user_id == 1 else set()
+        )
+        result_user_1 = self.use_case.execute(user_id=1)
+        result_user_2 = self.use_case.execute(user_id=2)
+        assert [m.is_liked for m in result_user_1.movies] == [False, True]
+        assert [m.is_liked for m in result_user_2.movies] == [False, False]
+        self.like_repository_mock.get_liked_movie_ids\
+            .assert_called_with(2, [1, 2])
+
+    def test_cached_page_is_not_mutated_by_overlay(self):
+        self.like_repository_mock.get_liked_movie_ids.return_value = {1, 2}
+        self.use_case.execute(user_id=1)
+        cached = self.cache.get("movies:list:1:20")
+        assert all(movie.is_liked is None for movie in cached.movies)
+
+    def test_search_bypasses_cache(self):
+        self.movie_repository_mock.search.return_value = (self.movies[:1], 1)
+        self.like_repository_mock.get_liked_movie_ids.return_value = set()
+        self.use_case.execute(user_id=1, search_query="Movie")
+        self.use_case.execute(user_id=1, search_query="Movie")
+        assert self.movie_repository_mock.search.call_count == 2
+        self.movie_repository_mock.get_all.assert_not_called()
+
+    def test_without_user_skips_like_lookup(self):
+        result = self.use_case.execute()
+        assert all(movie.is_liked is None for movie in result.movies)
+        self.like_repository_mock.get_liked_movie_ids.assert_not_called()
+
+    def test_works_without_cache(self):
+        use_case = GetMoviesUseCase(
+            movie_repository=self.movie_repository_mock,
+            like_repository=self.like_repository_mock
+        )
+        self.like_repository_mock.get_liked_movie_ids.return_value = {1}
+        use_case.execute(user_id=1)
+        result = use_case.execute(user_id=1)
+        assert result.movies[0].is_liked is True
+        assert self.movie_repository_mock.get_all.call_count == 2
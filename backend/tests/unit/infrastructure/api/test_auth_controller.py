@@ -0,0 +1,58 @@
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.controllers import auth_controller
+from src.infrastructure.api.dependencies.auth_dependencies import (
+    get_login_user_use_case,
+    get_register_user_use_case
+)
+from src.shared.exceptions.auth_exceptions import (
+    PasswordHashingBusyException
+)
+
+
+class TestAuthControllerBackpressure:
+
+    def setup_method(self):
+        self.use_case = Mock()
+        self.use_case.execute.side_effect = PasswordHashingBusyException(
+            "Password hashing capacity exhausted"
+        )
+
+        app = FastAPI()
+        app.include_router(auth_controller.router, prefix="/auth")
+        app.dependency_overrides[get_login_user_use_case] = (
+            lambda: self.use_case
+        )
+        app.dependency_overrides[get_register_user_use_case] = (
+            lambda: self.use_case
+        )
+        self.client = TestClient(app)
+
+    def _assert_busy(self, response):
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+
+    def test_login_is_rejected_while_hashing_is_saturated(self):
+        self._assert_busy(self.client.post(
+            "/auth/login",
+            data={"username": "user", "password": "secret123"},
+        ))
+
+    def test_login_json_is_rejected_while_hashing_is_saturated(self):
+        self._assert_busy(self.client.post(
+            "/auth/login-json",
+            json={"username": "user", "password": "secret123"},
+        ))
+
+    def test_register_is_rejected_while_hashing_is_saturated(self):
+        self._assert_busy(self.client.post(
+            "/auth/register",
+            json={
+                "email": "user@example.com",
+                "username": "user",
+                "password": "secret123",
+            },
+        ))
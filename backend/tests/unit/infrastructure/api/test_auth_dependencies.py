@@ -0,0 +1,104 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.domain.entities.user import User
+from src.infrastructure.api.dependencies.auth_dependencies import (
+    get_current_admin_user,
+    get_current_user,
+    get_security_service
+)
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+
+
+class TestGetCurrentUser:
+
+    def setup_method(self):
+        self.user_repository = Mock()
+        self.security_service = Mock()
+        self.security_service.verify_token.return_value = "1"
+        self.cache = InMemoryCacheService()
+        self.credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials="token"
+        )
+        self.user = User(
+            id=1,
+            email="test@example.com",
+            username="testuser",
+            hashed_password="hashed",
+        )
+
+    def _get_current_user(self, cache=None):
+        return get_current_user(
+            credentials=self.credentials,
+            user_repository=self.user_repository,
+            security_service=self.security_service,
+            cache=cache,
+        )
+
+    def test_cache_hit_skips_user_lookup(self):
+        self.user_repository.get_by_id.return_value = self.user
+
+        first = self._get_current_user(self.cache)
+        second = self._get_current_user(self.cache)
+
+        assert first.id == second.id == 1
+        self.user_repository.get_by_id.assert_called_once_with(1)
+
+    def test_returns_copy_of_cached_user(self):
+        self.user_repository.get_by_id.return_value = self.user
+
+        self._get_current_user(self.cache).deactivate()
+
+        assert self._get_current_user(self.cache).is_active is True
+
+    def test_unknown_user_is_not_cached(self):
+        self.user_repository.get_by_id.return_value = None
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                self._get_current_user(self.cache)
+            assert exc_info.value.status_code == 401
+
+        assert self.user_repository.get_by_id.call_count == 2
+
+    def test_without_cache_queries_every_time(self):
+        self.user_repository.get_by_id.return_value = self.user
+
+        self._get_current_user()
+        self._get_current_user()
+
+        assert self.user_repository.get_by_id.call_count == 2
+
+
+class TestGetSecurityService:
+
+    def test_returns_application_scoped_instance(self):
+        assert get_security_service() is get_security_service()
+
+
+class TestGetCurrentAdminUser:
+
+    def setup_method(self):
+        self.user = User(
+            id=1,
+            email="test@example.com",
+            username="testuser",
+            hashed_password="hashed",
+        )
+
+    def test_allows_admins(self):
+        self.user.is_admin = True
+
+        assert get_current_admin_user(self.user) is self.user
+
+    def test_rejects_other_users(self):
+        # Even one registered under an administrator-looking name
+        self.user.username = "admin"
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_admin_user(self.user)
+
+        assert exc_info.value.status_code == 403
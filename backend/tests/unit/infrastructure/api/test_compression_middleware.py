@@ -0,0 +1,89 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.middlewares.compression import (
+    CompressionMiddleware
+)
+
+LARGE_BODY = "x" * 2000
+
+
+def create_client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=500,
+        content_types=["application/json"],
+        enable_brotli=False,
+        **options
+    )
+
+    @app.get("/large")
+    def large():
+        return {"data": LARGE_BODY}
+
+    @app.get("/small")
+    def small():
+        return {"data": "x"}
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/stream")
+    def stream():
+        chunks = (LARGE_BODY.encode() for _ in range(3))
+        return StreamingResponse(chunks, media_type="application/json")
+
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+
+    def setup_method(self):
+        self.client = create_client()
+
+    def test_large_json_is_gzipped(self):
+        response = self.client.get(
+            "/large", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.json() == {"data": LARGE_BODY}
+        assert int(response.headers["content-length"]) < len(LARGE_BODY)
+
+    def test_small_body_is_not_compressed(self):
+        response = self.client.get(
+            "/small", headers={"Accept-Encoding": "gzip"}
+        )
+        assert "content-encoding" not in response.headers
+
+    def test_content_type_outside_allowlist_is_not_compressed(self):
+        response = self.client.get(
+            "/text", headers={"Accept-Encoding": "gzip"}
+        )
+        assert "content-encoding" not in response.headers
+        assert response.text == LARGE_BODY
+
+    def test_client_without_gzip_gets_identity(self):
+        response = self.client.get(
+            "/large", headers={"Accept-Encoding": "identity"}
+        )
+        assert "content-encoding" not in response.headers
+
+    def test_gzip_with_zero_quality_is_refused(self):
+        response = self.client.get(
+            "/large", headers={"Accept-Encoding": "gzip;q=0"}
+        )
+        assert "content-encoding" not in response.headers
+
+    def test_streaming_response_is_compressed(self):
+        with self.client.stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(raw) == LARGE_BODY.encode() * 3
@@ -0,0 +1,35 @@
+import pytest
+from unittest.mock import Mock
+from src.infrastructure.api.etags import make_weak_etag, etag_matches
+
+
+def make_request(if_none_match=None):
+    request = Mock()
+    request.headers = (
+        {"if-none-match": if_none_match} if if_none_match else {}
+    )
+    return request
+
+
+class TestETags:
+
+    def test_etag_is_weak_and_deterministic(self):
+        etag = make_weak_etag("movies", 1, 2)
+        assert etag.startswith('W/"')
+        assert etag == make_weak_etag("movies", 1, 2)
+
+    def test_etag_changes_with_versions(self):
+        assert make_weak_etag("movies", 1, 2) != make_weak_etag("movies", 1, 3)
+
+    @pytest.mark.parametrize("header", [
+        'W/"abc"',
+        '"abc"',
+        '"other", W/"abc"',
+        "*",
+    ])
+    def test_etag_matches(self, header):
+        assert etag_matches(make_request(header), 'W/"abc"')
+
+    @pytest.mark.parametrize("header", [None, 'W/"other"', '"abcd"'])
+    def test_etag_does_not_match(self, header):
+        assert not etag_matches(make_request(header), 'W/"abc"')
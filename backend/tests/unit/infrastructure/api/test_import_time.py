@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[4]
+APP_MODULE = "src.infrastructure.api.main"
+
+# Cumulative import time budget of the application module; generous
+# enough for slow CI machines, tight enough to catch the numeric stack
+# coming back (it alone added ~0.7 s)
+IMPORT_TIME_BUDGET_SECONDS = float(
+    os.getenv("IMPORT_TIME_BUDGET_SECONDS", "2.5")
+)
+
+# Imported only when a recommendation model is first built
+LAZY_MODULES = ("pandas", "sklearn", "scipy", "numpy")
+
+
+def measure_import_times(module: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds per module, in a fresh
+    interpreter, as reported by `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.slow
+class TestApplicationImportTime:
+
+    def setup_method(self):
+        self.import_times = measure_import_times(APP_MODULE)
+
+    def test_numeric_stack_is_not_imported(self):
+        imported = {name.split(".")[0] for name in self.import_times}
+
+        assert imported.isdisjoint(LAZY_MODULES)
+
+    def test_import_time_within_budget(self):
+        seconds = self.import_times[APP_MODULE] / 1_000_000
+
+        assert seconds < IMPORT_TIME_BUDGET_SECONDS, (
+            f"Importing {APP_MODULE} took {seconds:.2f} s "
+            f"(budget {IMPORT_TIME_BUDGET_SECONDS} s)"
+        )
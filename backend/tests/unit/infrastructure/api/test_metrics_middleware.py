@@ -0,0 +1,67 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.middlewares.metrics import MetricsMiddleware
+from src.infrastructure.api.middlewares.query_accounting import (
+    QueryAccountingMiddleware
+)
+from src.infrastructure.metrics.instruments import HttpMetrics
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+def create_client(metrics: HttpMetrics) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+    app.add_middleware(QueryAccountingMiddleware)
+
+    @app.get("/movies/{movie_id}")
+    def get_movie(movie_id: int):
+        if movie_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": movie_id}
+
+    metrics.register_routes(app.routes)
+    return TestClient(app)
+
+
+class TestMetricsMiddleware:
+
+    def setup_method(self):
+        self.registry = MetricsRegistry()
+        self.metrics = HttpMetrics(self.registry)
+        self.client = create_client(self.metrics)
+
+    def test_labels_requests_with_route_template(self):
+        self.client.get("/movies/1")
+        self.client.get("/movies/2")
+
+        output = self.registry.render()
+
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/movies/{movie_id}",status="2xx"} 2'
+        ) in output
+        assert 'http_request_db_queries_count{route="/movies/{movie_id}"} 2' \
+            in output
+
+    def test_labels_status_class(self):
+        self.client.get("/movies/0")
+
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/movies/{movie_id}",status="4xx"} 1'
+        ) in self.registry.render()
+
+    def test_unknown_paths_share_one_route(self):
+        self.client.get("/missing")
+        self.client.get("/other")
+
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="unmatched",status="4xx"} 2'
+        ) in self.registry.render()
+
+    def test_in_flight_returns_to_zero(self):
+        self.client.get("/movies/1")
+
+        assert "http_requests_in_flight 0" in self.registry.render()
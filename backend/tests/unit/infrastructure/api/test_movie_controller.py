@@ -0,0 +1,134 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.dtos.movie_dto import (
+    MovieListResponseDTO,
+    MovieResponseDTO
+)
+from src.domain.entities.user import User
+from src.infrastructure.api.controllers import movie_controller
+from src.infrastructure.api.dependencies.auth_dependencies import (
+    get_current_user
+)
+from src.infrastructure.api.dependencies.movie_dependencies import (
+    get_movies_use_case,
+    get_popular_movies_use_case
+)
+
+
+def make_user(user_id: int) -> User:
+    return User(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        username=f"user{user_id}",
+        hashed_password="hashed",
+    )
+
+
+def make_movie(movie_id: int) -> MovieResponseDTO:
+    return MovieResponseDTO(
+        id=movie_id,
+        title=f"Movie {movie_id}",
+        overview=None,
+        release_date=None,
+        poster_path=None,
+        backdrop_path=None,
+        vote_average=7.5,
+        vote_count=10,
+        popularity=1.0,
+        runtime=None,
+        original_language="en",
+        tmdb_id=None,
+        created_at=datetime(2024, 1, 1),
+        updated_at=None,
+    )
+
+
+def make_page(
+    *movie_ids: int, page: int = 1, per_page: int = 20, total=None
+) -> MovieListResponseDTO:
+    total = len(movie_ids) if total is None else total
+    return MovieListResponseDTO(
+        movies=[make_movie(movie_id) for movie_id in movie_ids],
+        total=total,
+        page=page,
+        total_pages=(total + per_page - 1) // per_page,
+        per_page=per_page,
+    )
+
+
+class TestMovieController:
+
+    def setup_method(self):
+        self.user = make_user(1)
+        self.movies_use_case = Mock()
+        self.movies_use_case.execute.return_value = make_page(1, 2)
+        self.popular_use_case = Mock()
+        self.popular_use_case.execute.return_value = make_page(
+            3, 4, page=2, per_page=2, total=5
+        )
+
+        app = FastAPI()
+        app.include_router(movie_controller.router, prefix="/movies")
+        app.dependency_overrides[get_current_user] = lambda: self.user
+        app.dependency_overrides[get_movies_use_case] = (
+            lambda: self.movies_use_case
+        )
+        app.dependency_overrides[get_popular_movies_use_case] = (
+            lambda: self.popular_use_case
+        )
+        self.client = TestClient(app)
+
+    def test_unchanged_movies_answer_not_modified(self):
+        first = self.client.get("/movies/")
+
+        second = self.client.get(
+            "/movies/", headers={"If-None-Match": first.headers["etag"]}
+        )
+
+        assert second.status_code == 304
+        assert self.movies_use_case.execute.call_count == 1
+
+    def test_etag_of_one_user_does_not_match_for_another(self):
+        # Neither user has liked anything, so their like versions agree
+        etag = self.client.get("/movies/").headers["etag"]
+        self.user = make_user(2)
+
+        response = self.client.get(
+            "/movies/", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_popular_movies_are_paginated(self):
+        response = self.client.get(
+            "/movies/popular", params={"page": 2, "per_page": 2}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert [movie["id"] for movie in body["movies"]] == [3, 4]
+        assert body["page"] == 2
+        assert body["per_page"] == 2
+        assert body["total"] == 5
+        assert body["total_pages"] == 3
+        self.popular_use_case.execute.assert_called_once_with(
+            page=2, per_page=2
+        )
+
+    def test_popular_movies_are_not_personalized(self):
+        # Popular pages are shared by all users, so carry no is_liked
+        body = self.client.get("/movies/popular").json()
+
+        assert all(movie["is_liked"] is None for movie in body["movies"])
+
+    def test_popular_movies_reject_invalid_pagination(self):
+        response = self.client.get("/movies/popular", params={"per_page": 101})
+
+        assert response.status_code == 422
+        self.popular_use_case.execute.assert_not_called()
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.infrastructure.api.middlewares.query_accounting import (
+    QueryAccountingMiddleware
+)
+from src.infrastructure.metrics.database import instrument_engine
+
+
+class TestQueryAccountingMiddleware:
+
+    def setup_method(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        instrument_engine(self.engine)
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def create_client(self, **options) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(QueryAccountingMiddleware, **options)
+
+        @app.get("/items/{count}")
+        def items(count: int):
+            with self.engine.connect() as connection:
+                for item in range(count):
+                    connection.execute(
+                        text("SELECT :item"), {"item": item}
+                    )
+            return {"count": count}
+
+        return TestClient(app)
+
+    def test_reports_queries_in_headers_when_enabled(self):
+        client = self.create_client(expose_headers=True)
+
+        response = client.get("/items/3")
+
+        assert response.headers["X-DB-Queries"] == "3"
+        assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+    def test_no_headers_by_default(self):
+        response = self.create_client().get("/items/3")
+
+        assert "X-DB-Queries" not in response.headers
+
+    @patch(
+        "src.infrastructure.api.middlewares.query_accounting.logger"
+    )
+    def test_warns_about_repeated_statements(self, logger):
+        client = self.create_client(n_plus_one_threshold=5)
+
+        client.get("/items/4")
+        logger.warning.assert_not_called()
+
+        client.get("/items/5")
+        logger.warning.assert_called_once()
+        assert logger.warning.call_args.kwargs["route"] == "/items/{count}"
+        assert logger.warning.call_args.kwargs["executions"] == 5
@@ -0,0 +1,185 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI, Form
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.infrastructure.api.main import create_application
+
+from src.infrastructure.api.middlewares.rate_limit import (
+    RateLimitMiddleware,
+    RateLimitRule
+)
+from src.infrastructure.config.settings import settings
+from src.infrastructure.rate_limiting.memory_store import (
+    InMemoryTokenBucketStore
+)
+
+
+class LoginBody(BaseModel):
+    username: str
+    password: str
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_client(store, **options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules=[
+            RateLimitRule(
+                name="login",
+                path_prefix="/login",
+                methods=("POST",),
+                capacity=4,
+                per_minute=60,
+                identifier_field="username",
+                identifier_capacity=2,
+                identifier_per_minute=60,
+            ),
+            RateLimitRule(
+                name="api", path_prefix="/api", capacity=2, per_minute=60
+            ),
+        ],
+        store=store,
+        **options
+    )
+
+    @app.post("/login")
+    def login(username: str = Form(...), password: str = Form(...)):
+        return {"username": username}
+
+    @app.post("/login-json")
+    def login_json(body: LoginBody):
+        return {"username": body.username}
+
+    @app.get("/api/items")
+    def items():
+        return []
+
+    @app.get("/health")
+    def health():
+        return {"status": "healthy"}
+
+    return TestClient(app)
+
+
+class TestRateLimitMiddleware:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.store = InMemoryTokenBucketStore(clock=self.clock)
+        self.client = create_client(self.store)
+
+    def test_rejects_over_limit_with_retry_after(self):
+        assert self.client.get("/api/items").status_code == 200
+        assert self.client.get("/api/items").status_code == 200
+
+        response = self.client.get("/api/items")
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "1"
+
+    def test_bucket_refills_over_time(self):
+        for _ in range(2):
+            self.client.get("/api/items")
+        assert self.client.get("/api/items").status_code == 429
+
+        self.clock.now += 1.0
+
+        assert self.client.get("/api/items").status_code == 200
+
+    def test_unmatched_routes_are_not_limited(self):
+        for _ in range(5):
+            assert self.client.get("/health").status_code == 200
+
+    def test_login_is_limited_per_identifier(self):
+        for _ in range(2):
+            response = self.client.post(
+                "/login", data={"username": "alice", "password": "x"}
+            )
+            assert response.status_code == 200
+
+        response = self.client.post(
+            "/login", data={"username": "Alice", "password": "x"}
+        )
+        assert response.status_code == 429
+
+        # Other accounts still have their own bucket
+        response = self.client.post(
+            "/login", data={"username": "bob", "password": "x"}
+        )
+        assert response.status_code == 200
+
+    def test_json_body_is_replayed_to_the_route(self):
+        response = self.client.post(
+            "/login-json", json={"username": "carol", "password": "x"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"username": "carol"}
+
+    def test_login_is_limited_per_ip(self):
+        for name in ("a", "b", "c", "d"):
+            self.client.post(
+                "/login", data={"username": name, "password": "x"}
+            )
+
+        response = self.client.post(
+            "/login", data={"username": "e", "password": "x"}
+        )
+        assert response.status_code == 429
+
+    def test_forwarded_for_is_used_only_when_trusted(self):
+        client = create_client(self.store, trust_forwarded_for=True)
+        for _ in range(2):
+            client.get(
+                "/api/items", headers={"X-Forwarded-For": "10.0.0.1"}
+            )
+
+        blocked = client.get(
+            "/api/items", headers={"X-Forwarded-For": "10.0.0.1"}
+        )
+        other = client.get(
+            "/api/items", headers={"X-Forwarded-For": "10.0.0.2"}
+        )
+
+        assert blocked.status_code == 429
+        assert other.status_code == 200
+
+
+class TestInMemoryTokenBucketStore:
+
+    def test_evicts_least_recently_used_bucket(self):
+        store = InMemoryTokenBucketStore(max_keys=2)
+
+        for key in ("a", "b", "c"):
+            store.consume(key, capacity=1, refill_per_second=1)
+
+        assert len(store) == 2
+
+
+class TestRateLimitInApplication:
+
+    def test_rejection_carries_cors_headers(self):
+        with patch.object(settings, "debug", True), \
+                patch.object(settings, "rate_limit_enabled", True), \
+                patch.object(settings, "rate_limit_backend", "memory"), \
+                patch.object(settings, "rate_limit_api_burst", 1):
+            client = TestClient(create_application())
+
+        headers = {"Origin": "http://frontend.example"}
+        client.get("/api/v1/movies/", headers=headers)
+        response = client.get("/api/v1/movies/", headers=headers)
+
+        assert response.status_code == 429
+        assert "retry-after" in response.headers
+        assert "access-control-allow-origin" in response.headers
@@ -0,0 +1,80 @@
+import json
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from src.infrastructure.api.responses import PydanticJSONResponse
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    created_at: datetime
+    note: Optional[str] = None
+
+
+class ItemList(BaseModel):
+    items: List[Item]
+    total: int
+
+
+class TestPydanticJSONResponse:
+
+    def setup_method(self):
+        self.content = ItemList(
+            items=[
+                Item(id=1, name="First", created_at=datetime(2024, 1, 2)),
+                Item(id=2, name="Ação", created_at=datetime(2024, 1, 3)),
+            ],
+            total=2,
+        )
+
+    def test_renders_model_as_json(self):
+        response = PydanticJSONResponse(self.content)
+
+        assert response.status_code == 200
+        assert response.media_type == "application/json"
+        assert response.headers["content-type"] == "application/json"
+        assert json.loads(response.body) == {
+            "items": [
+                {
+                    "id": 1,
+                    "name": "First",
+                    "created_at": "2024-01-02T00:00:00",
+                    "note": None,
+                },
+                {
+                    "id": 2,
+                    "name": "Ação",
+                    "created_at": "2024-01-03T00:00:00",
+                    "note": None,
+                },
+            ],
+            "total": 2,
+        }
+        assert response.headers["content-length"] == str(len(response.body))
+
+    def test_include_selects_fields(self):
+        response = PydanticJSONResponse(
+            self.content,
+            include={"items": {"__all__": {"id"}}, "total": True},
+        )
+
+        assert json.loads(response.body) == {
+            "items": [{"id": 1}, {"id": 2}],
+            "total": 2,
+        }
+
+    def test_status_code_and_headers_are_kept(self):
+        response = PydanticJSONResponse(
+            self.content, status_code=201, headers={"ETag": 'W/"abc"'}
+        )
+
+        assert response.status_code == 201
+        assert response.headers["etag"] == 'W/"abc"'
+
+    def test_renders_other_content_like_json_response(self):
+        response = PydanticJSONResponse({"detail": "Not found"})
+
+        assert json.loads(response.body) == {"detail": "Not found"}
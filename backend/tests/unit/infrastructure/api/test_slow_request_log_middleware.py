@@ -0,0 +1,52 @@
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.middlewares.query_accounting import (
+    QueryAccountingMiddleware
+)
+from src.infrastructure.api.middlewares.slow_request_log import (
+    SlowRequestLogMiddleware
+)
+from src.infrastructure.metrics.slow_log import tag_request
+
+
+class TestSlowRequestLogMiddleware:
+
+    def create_client(self, threshold: float) -> TestClient:
+        self.log = Mock()
+        app = FastAPI()
+        app.add_middleware(
+            SlowRequestLogMiddleware, threshold=threshold, log=self.log
+        )
+        app.add_middleware(QueryAccountingMiddleware)
+
+        # Sync endpoints run in a threadpool thread
+        @app.get("/users/{user_id}")
+        def user(user_id: int):
+            tag_request(user_id=user_id)
+            return {"id": user_id}
+
+        return TestClient(app)
+
+    def test_logs_requests_above_threshold(self):
+        client = self.create_client(threshold=0.0)
+
+        client.get("/users/7")
+
+        self.log.write.assert_called_once()
+        event = self.log.write.call_args.args[0]
+        kwargs = self.log.write.call_args.kwargs
+        assert event == "slow_request"
+        assert kwargs["route"] == "/users/{user_id}"
+        assert kwargs["status"] == 200
+        assert kwargs["user_id"] == 7
+        assert kwargs["db_queries"] == 0
+
+    def test_fast_requests_are_not_logged(self):
+        client = self.create_client(threshold=60.0)
+
+        client.get("/users/7")
+
+        self.log.write.assert_not_called()
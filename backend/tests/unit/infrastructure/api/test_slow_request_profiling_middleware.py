@@ -0,0 +1,57 @@
+import time
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.middlewares.slow_request_profiling import (
+    SlowRequestProfilingMiddleware
+)
+from src.infrastructure.metrics.profiler import SamplingProfiler
+
+
+def busy_loop(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+class TestSlowRequestProfilingMiddleware:
+
+    def setup_method(self):
+        self.profiler = SamplingProfiler()
+        app = FastAPI()
+        app.add_middleware(
+            SlowRequestProfilingMiddleware,
+            threshold=0.05,
+            interval=0.001,
+            sampling_profiler=self.profiler,
+        )
+
+        @app.get("/work/{seconds}")
+        def work(seconds: float):
+            busy_loop(seconds)
+            return {"seconds": seconds}
+
+        self.client = TestClient(app)
+
+    @patch(
+        "src.infrastructure.api.middlewares.slow_request_profiling.logger"
+    )
+    def test_logs_profile_of_slow_requests(self, logger):
+        self.client.get("/work/0.3")
+
+        logger.warning.assert_called_once()
+        kwargs = logger.warning.call_args.kwargs
+        assert kwargs["route"] == "/work/{seconds}"
+        assert kwargs["samples"] > 0
+        assert "busy_loop" in kwargs["stacks"]
+        assert not self.profiler.running
+
+    @patch(
+        "src.infrastructure.api.middlewares.slow_request_profiling.logger"
+    )
+    def test_fast_requests_are_not_profiled(self, logger):
+        self.client.get("/work/0")
+
+        logger.warning.assert_not_called()
@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.infrastructure.api.middlewares.stage_timing import (
+    StageTimingMiddleware
+)
+from src.infrastructure.metrics.spans import span
+
+
+class TestStageTimingMiddleware:
+
+    def create_client(self, **options) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(StageTimingMiddleware, **options)
+
+        # Sync endpoints run in a threadpool thread
+        @app.get("/items/{item_id}")
+        def item(item_id: int):
+            with span("fetch"):
+                pass
+            with span("hydrate"):
+                pass
+            return {"id": item_id}
+
+        @app.get("/health")
+        def health():
+            return {"status": "healthy"}
+
+        return TestClient(app)
+
+    def test_reports_stages_in_server_timing_header(self):
+        client = self.create_client(sample_rate=1.0, expose_headers=True)
+
+        response = client.get("/items/1")
+
+        stages = [
+            entry.split(";")[0]
+            for entry in response.headers["Server-Timing"].split(", ")
+        ]
+        assert stages == ["fetch", "hydrate"]
+
+    def test_no_header_by_default(self):
+        response = self.create_client(sample_rate=1.0).get("/items/1")
+
+        assert "Server-Timing" not in response.headers
+
+    @patch("src.infrastructure.api.middlewares.stage_timing.logger")
+    def test_logs_stages_of_sampled_requests(self, logger):
+        client = self.create_client(sample_rate=1.0)
+
+        client.get("/items/1")
+        client.get("/health")
+
+        logger.info.assert_called_once()
+        kwargs = logger.info.call_args.kwargs
+        assert kwargs["route"] == "/items/{item_id}"
+        assert list(kwargs["stages"]) == ["fetch", "hydrate"]
+
+    @patch("src.infrastructure.api.middlewares.stage_timing.logger")
+    def test_skips_requests_outside_sample(self, logger):
+        client = self.create_client(
+            sample_rate=0.5, expose_headers=True, sampler=lambda: 0.5
+        )
+
+        response = client.get("/items/1")
+
+        assert "Server-Timing" not in response.headers
+        logger.info.assert_not_called()
@@ -0,0 +1,91 @@
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryCacheService:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = InMemoryCacheService(
+            max_entries=3,
+            default_ttl=10,
+            clock=self.clock
+        )
+
+    def test_get_returns_stored_value(self):
+        self.cache.set("a", 1)
+        assert self.cache.get("a") == 1
+
+    def test_get_missing_key_returns_none(self):
+        assert self.cache.get("missing") is None
+
+    def test_entry_expires_after_ttl(self):
+        self.cache.set("a", 1)
+        self.clock.now = 9.9
+        assert self.cache.get("a") == 1
+        self.clock.now = 10
+        assert self.cache.get("a") is None
+        assert len(self.cache) == 0
+
+    def test_explicit_ttl_overrides_default(self):
+        self.cache.set("a", 1, ttl=1)
+        self.clock.now = 2
+        assert self.cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.set("c", 3)
+        self.cache.get("a")
+        self.cache.set("d", 4)
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        assert self.cache.get("c") == 3
+        assert self.cache.get("d") == 4
+        assert self.cache.stats().evictions == 1
+
+    def test_weight_budget_evicts_entries(self):
+        cache = InMemoryCacheService(
+            max_entries=100,
+            default_ttl=None,
+            max_weight=5,
+            weigher=len
+        )
+        cache.set("a", [1, 2, 3])
+        cache.set("b", [1, 2])
+        cache.set("c", [1])
+        assert cache.get("a") is None
+        assert cache.get("b") == [1, 2]
+        assert cache.stats().weight == 3
+
+    def test_value_heavier_than_budget_is_not_cached(self):
+        cache = InMemoryCacheService(max_weight=2, weigher=len)
+        cache.set("a", [1, 2, 3])
+        assert cache.get("a") is None
+        assert cache.stats().weight == 0
+
+    def test_delete_prefix_removes_matching_keys(self):
+        self.cache.set("movies:list:1", 1)
+        self.cache.set("movies:popular:1", 2)
+        self.cache.set("users:1", 3)
+        removed = self.cache.delete_prefix("movies:")
+        assert removed == 2
+        assert self.cache.get("users:1") == 3
+        assert self.cache.get("movies:list:1") is None
+
+    def test_stats_track_hits_and_misses(self):
+        self.cache.set("a", 1)
+        self.cache.get("a")
+        self.cache.get("b")
+        stats = self.cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_ratio == 0.5
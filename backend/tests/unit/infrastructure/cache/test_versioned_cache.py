@@ -0,0 +1,31 @@
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+from src.infrastructure.cache.versioned_cache import VersionedCacheService
+
+
+class TestVersionedCacheService:
+
+    def setup_method(self):
+        self.version = 1
+        self.inner = InMemoryCacheService(max_entries=10, default_ttl=None)
+        self.cache = VersionedCacheService(
+            self.inner, version=lambda: self.version
+        )
+
+    def test_get_returns_value_of_current_version(self):
+        self.cache.set("movies:list:1:20", "page")
+        assert self.cache.get("movies:list:1:20") == "page"
+        assert self.inner.get("v1:movies:list:1:20") == "page"
+
+    def test_version_change_hides_previous_entries(self):
+        self.cache.set("movies:list:1:20", "page")
+        self.version = 2
+        assert self.cache.get("movies:list:1:20") is None
+
+    def test_delete_prefix_applies_to_current_version(self):
+        self.cache.set("movies:list:1:20", "page")
+        assert self.cache.delete_prefix("movies:") == 1
+        assert self.cache.get("movies:list:1:20") is None
+
+    def test_exposes_stats_of_wrapped_cache(self):
+        self.cache.get("missing")
+        assert self.cache.stats().misses == 1
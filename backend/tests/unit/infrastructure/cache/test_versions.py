@@ -0,0 +1,39 @@
+import os
+
+from src.infrastructure.cache.versions import VersionStore
+
+
+class TestVersionStore:
+
+    def setup_method(self):
+        self.versions = VersionStore()
+
+    def test_bump_increments_version(self):
+        self.versions.bump_catalog()
+        self.versions.bump_catalog()
+        assert self.versions.catalog_version() == 2
+
+    def test_bump_likes_bumps_global_and_user_versions(self):
+        self.versions.bump_likes(user_id=1)
+        assert self.versions.likes_version() == 1
+        assert self.versions.user_likes_version(1) == 1
+        assert self.versions.user_likes_version(2) == 0
+
+    def test_share_keeps_existing_versions(self):
+        self.versions.bump_catalog()
+        self.versions.bump_user(1)
+        self.versions.share(slots=1024)
+        assert self.versions.shared
+        assert self.versions.catalog_version() == 1
+        assert self.versions.user_version(1) == 1
+
+    def test_shared_versions_are_visible_across_fork(self):
+        self.versions.share(slots=1024)
+        pid = os.fork()
+        if pid == 0:
+            self.versions.bump_catalog()
+            self.versions.bump_user(7)
+            os._exit(0)
+        os.waitpid(pid, 0)
+        assert self.versions.catalog_version() == 1
+        assert self.versions.user_version(7) == 1
@@ -0,0 +1,123 @@
+import io
+import json
+import logging
+import queue
+from unittest.mock import patch
+
+import structlog
+
+from src.infrastructure.config.logging import (
+    DroppingQueueHandler,
+    configure_logging,
+    log_format,
+    stop_logging
+)
+
+SETTINGS_PATH = "src.infrastructure.config.logging.settings"
+
+
+class TestConfigureLogging:
+
+    def setup_method(self):
+        self.root_handlers = logging.getLogger().handlers[:]
+        self.root_level = logging.getLogger().level
+        self.stream = io.StringIO()
+
+    def teardown_method(self):
+        stop_logging()
+        root = logging.getLogger()
+        root.handlers[:] = self.root_handlers
+        root.setLevel(self.root_level)
+        structlog.reset_defaults()
+
+    def configure(
+        self, settings, queue_enabled: bool, debug: bool = False,
+        log_format=None
+    ) -> None:
+        settings.debug = debug
+        settings.log_format = log_format
+        settings.log_level = "INFO"
+        settings.log_queue_enabled = queue_enabled
+        settings.log_queue_max_size = 100
+        configure_logging(stream=self.stream)
+
+    def entries(self):
+        return [
+            json.loads(line) for line in self.stream.getvalue().splitlines()
+        ]
+
+    @patch(SETTINGS_PATH)
+    def test_writes_json_lines_from_writer_thread(self, settings):
+        self.configure(settings, queue_enabled=True)
+
+        structlog.get_logger("app").info("hello", user_id=1)
+        logging.getLogger("uvicorn.access").info("%s %s", "GET", "/")
+        stop_logging()
+
+        hello, access = self.entries()
+        assert hello["event"] == "hello"
+        assert hello["user_id"] == 1
+        assert access["event"] == "GET /"
+        assert access["logger"] == "uvicorn.access"
+
+    @patch(SETTINGS_PATH)
+    def test_json_format_is_independent_of_debug(self, settings):
+        self.configure(
+            settings, queue_enabled=False, debug=True, log_format="json"
+        )
+
+        structlog.get_logger("app").info("hello")
+
+        assert self.entries()[0]["event"] == "hello"
+
+    @patch(SETTINGS_PATH)
+    def test_format_follows_debug_when_unset(self, settings):
+        settings.log_format = None
+
+        settings.debug = True
+        assert log_format() == "console"
+        settings.debug = False
+        assert log_format() == "json"
+
+    @patch(SETTINGS_PATH)
+    def test_exceptions_are_captured_by_logging_thread(self, settings):
+        self.configure(settings, queue_enabled=True)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            structlog.get_logger("app").exception("failed")
+        stop_logging()
+
+        [entry] = self.entries()
+        assert "ValueError: boom" in entry["exception"]
+
+    @patch(SETTINGS_PATH)
+    def test_logs_synchronously_after_stop(self, settings):
+        self.configure(settings, queue_enabled=True)
+        stop_logging()
+
+        structlog.get_logger("app").info("late")
+
+        assert [entry["event"] for entry in self.entries()] == ["late"]
+
+    @patch(SETTINGS_PATH)
+    def test_synchronous_pipeline(self, settings):
+        self.configure(settings, queue_enabled=False)
+
+        structlog.get_logger("app").info("hello")
+
+        assert self.entries()[0]["event"] == "hello"
+
+
+class TestDroppingQueueHandler:
+
+    def test_drops_records_when_queue_is_full(self):
+        handler = DroppingQueueHandler(queue.Queue(1))
+        record = logging.makeLogRecord({"msg": "hello"})
+
+        handler.handle(record)
+        handler.handle(record)
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 1
@@ -0,0 +1,234 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.migrations import (
+    BASELINE_REVISION,
+    upgrade_database
+)
+from src.infrastructure.database.models import (
+    LikeModel,
+    MovieModel,
+    UserModel
+)
+from src.infrastructure.database.repositories.like_repository_impl import (
+    LikeRepositoryImpl
+)
+from src.infrastructure.database.repositories.movie_repository_impl import (
+    MovieRepositoryImpl
+)
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")
+
+
+def alembic_config(url: str) -> Config:
+    # Without a config file, so alembic leaves the logging alone
+    config = Config()
+    config.set_main_option(
+        "script_location", os.path.join(BACKEND_DIR, "alembic")
+    )
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+def migrate(url: str) -> None:
+    command.upgrade(alembic_config(url), "head")
+
+
+class TestUpgradeDatabase:
+
+    def setup_method(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.url = f"sqlite:///{self.directory.name}/app.db"
+        self.engine = create_engine(self.url)
+
+    def teardown_method(self):
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def assert_at_head(self):
+        with self.engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            assert context.get_current_revision() == "0003"
+            assert compare_metadata(context, Base.metadata) == []
+
+    def test_creates_empty_database(self):
+        upgrade_database(self.engine)
+
+        self.assert_at_head()
+
+    def test_stamps_create_all_schema_at_head(self):
+        # As created by scripts/generate_dataset.py before it migrated
+        Base.metadata.create_all(self.engine)
+
+        upgrade_database(self.engine)
+        upgrade_database(self.engine)
+
+        self.assert_at_head()
+
+    def test_upgrades_baseline_schema(self):
+        # As created by create_all before migrations existed
+        command.upgrade(alembic_config(self.url), BASELINE_REVISION)
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql("DROP TABLE alembic_version")
+
+        upgrade_database(self.engine)
+
+        self.assert_at_head()
+
+    def test_upgrades_create_all_schema_left_at_0002(self):
+        # Stamped 0001 by an earlier init_db, failed on 0003
+        Base.metadata.create_all(self.engine)
+        command.stamp(alembic_config(self.url), "0002")
+
+        upgrade_database(self.engine)
+
+        self.assert_at_head()
+
+
+class IndexUsage:
+    """
+    Runs the hot repository queries against a migrated database and
+    explains them.
+    """
+
+    def setup_method(self):
+        migrate(self.url)
+        self.engine = create_engine(self.url)
+        self.db = sessionmaker(bind=self.engine)()
+        self._add_rows()
+        self.statements = []
+        event.listen(
+            self.engine, "before_cursor_execute", self._capture
+        )
+
+    def teardown_method(self):
+        event.remove(self.engine, "before_cursor_execute", self._capture)
+        self.db.close()
+        self.engine.dispose()
+
+    def _capture(self, conn, cursor, statement, parameters, context, many):
+        self.statements.append((statement, parameters))
+
+    def _add_rows(self):
+        now = datetime(2024, 1, 1)
+        self.db.add_all([
+            UserModel(
+                username=f"user{i}",
+                email=f"user{i}@example.com",
+                hashed_password="hash",
+            )
+            for i in range(20)
+        ])
+        self.db.add_all([
+            MovieModel(
+                title=f"Movie {i}",
+                popularity=float(i),
+                created_at=now + timedelta(minutes=i),
+            )
+            for i in range(200)
+        ])
+        self.db.flush()
+        self.db.add_all([
+            LikeModel(user_id=user, movie_id=movie)
+            for user in range(1, 21)
+            for movie in range(user, 200, 15)
+        ])
+        self.db.commit()
+
+    def plans(self, run) -> str:
+        self.statements.clear()
+        run()
+        statements = list(self.statements)
+        with self.engine.connect() as connection:
+            return "\n".join(
+                self.explain(connection, statement, parameters)
+                for statement, parameters in statements
+            )
+
+    def test_schema_matches_models(self):
+        with self.engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            assert compare_metadata(context, Base.metadata) == []
+
+    def test_likes_by_user_use_user_created_at_index(self):
+        repository = LikeRepositoryImpl(self.db)
+
+        plans = self.plans(lambda: repository.get_by_user(3))
+
+        assert "ix_likes_user_id_created_at" in plans
+
+    def test_popular_movies_join_likes_by_movie_index(self):
+        repository = MovieRepositoryImpl(self.db)
+
+        plans = self.plans(lambda: repository.get_popular())
+
+        assert "ix_likes_movie_id" in plans
+
+    def test_listing_uses_created_at_index(self):
+        repository = MovieRepositoryImpl(self.db)
+
+        plans = self.plans(lambda: repository.get_all(page=2))
+
+        assert "ix_movies_created_at_id" in plans
+
+    def test_search_orders_by_popularity_index(self):
+        repository = MovieRepositoryImpl(self.db)
+
+        plans = self.plans(lambda: repository.search("Movie"))
+
+        assert "ix_movies_popularity" in plans
+
+
+class TestSQLiteIndexUsage(IndexUsage):
+
+    def setup_method(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.url = f"sqlite:///{self.directory.name}/app.db"
+        super().setup_method()
+
+    def teardown_method(self):
+        super().teardown_method()
+        self.directory.cleanup()
+
+    def explain(self, connection, statement, parameters) -> str:
+        rows = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + statement, parameters
+        )
+        return "\n".join(row[-1] for row in rows)
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"),
+    reason="TEST_POSTGRES_URL (an empty database) not set",
+)
+class TestPostgresIndexUsage(IndexUsage):
+
+    def setup_method(self):
+        self.url = os.getenv("TEST_POSTGRES_URL")
+        super().setup_method()
+
+    def teardown_method(self):
+        super().teardown_method()
+        engine = create_engine(self.url)
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "DROP TABLE IF EXISTS likes, movies, users, alembic_version"
+            )
+        engine.dispose()
+
+    def explain(self, connection, statement, parameters) -> str:
+        # With a few hundred rows a sequential scan is always cheapest;
+        # what matters is that the planner can use the index
+        connection.exec_driver_sql("SET enable_seqscan = off")
+        rows = connection.exec_driver_sql("EXPLAIN " + statement, parameters)
+        return "\n".join(row[0] for row in rows)
@@ -0,0 +1,65 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.domain.entities.movie import Movie
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+from src.infrastructure.cache.versions import VersionStore
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models import MovieModel  # noqa: F401
+from src.infrastructure.database.repositories.movie_repository_impl import (
+    MovieRepositoryImpl
+)
+
+
+class TestMovieRepositoryImpl:
+
+    def setup_method(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.cache = InMemoryCacheService()
+        self.versions = VersionStore()
+        self.repository = MovieRepositoryImpl(
+            self.db, cache=self.cache, versions=self.versions
+        )
+
+    def teardown_method(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_writes_bump_catalog_version_and_drop_cached_pages(self):
+        self.cache.set("movies:list:1:20", "page")
+        self.cache.set("recommendations:1:popularity", "ranked")
+
+        movie = self.repository.save(Movie(id=None, title="Movie"))
+        self.repository.save_many([Movie(id=None, title="Other")])
+        self.repository.delete(movie.id)
+
+        assert self.versions.catalog_version() == 3
+        assert self.cache.get("movies:list:1:20") is None
+        assert self.cache.get("recommendations:1:popularity") == "ranked"
+
+    def test_get_by_ids_preserves_requested_order(self):
+        saved = [
+            self.repository.save(Movie(id=None, title=f"Movie {i}"))
+            for i in range(3)
+        ]
+        ids = [saved[2].id, saved[0].id, saved[1].id]
+
+        movies = self.repository.get_by_ids(ids)
+
+        assert [movie.id for movie in movies] == ids
+
+    def test_get_by_ids_uses_one_query(self, max_queries):
+        saved = [
+            self.repository.save(Movie(id=None, title=f"Movie {i}"))
+            for i in range(5)
+        ]
+
+        with max_queries(1, engine=self.engine):
+            self.repository.get_by_ids([movie.id for movie in saved])
@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.domain.entities.user import User
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models import UserModel  # noqa: F401
+from src.infrastructure.database.repositories.user_repository_impl import (
+    UserRepositoryImpl
+)
+from src.shared.exceptions.auth_exceptions import (
+    EmailAlreadyExistsException,
+    UsernameAlreadyExistsException
+)
+
+
+class TestUserRepositoryImpl:
+
+    def setup_method(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.repository = UserRepositoryImpl(self.db)
+        self.repository.save(self._user("taken@example.com", "taken"))
+
+        self.statements = []
+        event.listen(
+            self.engine, "before_cursor_execute", self._record_statement
+        )
+
+    def teardown_method(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def _record_statement(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    @staticmethod
+    def _user(email, username):
+        return User(
+            id=None, email=email, username=username, hashed_password="hash"
+        )
+
+    @pytest.mark.parametrize("email,username,expected", [
+        ("new@example.com", "new", (False, False)),
+        ("taken@example.com", "new", (True, False)),
+        ("new@example.com", "taken", (False, True)),
+        ("taken@example.com", "taken", (True, True)),
+    ])
+    def test_exists_by_email_or_username(self, email, username, expected):
+        result = self.repository.exists_by_email_or_username(email, username)
+
+        assert result == expected
+        assert len(self.statements) == 1
+
+    def test_duplicate_email_on_insert_raises_email_exception(self):
+        with pytest.raises(EmailAlreadyExistsException):
+            self.repository.save(self._user("taken@example.com", "other"))
+
+        # Session is usable after the rollback
+        assert self.repository.get_by_username("taken") is not None
+
+    def test_duplicate_username_on_insert_raises_username_exception(self):
+        with pytest.raises(UsernameAlreadyExistsException):
+            self.repository.save(self._user("other@example.com", "taken"))
+
+    def test_users_are_not_admins_until_granted(self):
+        user = self.repository.get_by_username("taken")
+        assert user.is_admin is False
+
+        user.is_admin = True
+        self.repository.save(user)
+
+        assert self.repository.get_by_username("taken").is_admin is True
@@ -0,0 +1,160 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from src.infrastructure.external.recommendation_strategies\
+    .collaborative_strategy import InteractionModel
+from src.infrastructure.external.recommendation_strategies\
+    .content_based_strategy import CatalogModel
+from src.infrastructure.external.recommendation_strategies.model_snapshots \
+    import ModelSnapshotStore, SharedModelHolder
+
+
+class TestModelSnapshotStore:
+
+    def setup_method(self):
+        self.root = tempfile.mkdtemp()
+        self.store = ModelSnapshotStore(self.root, epoch="a", keep=2)
+
+    def teardown_method(self):
+        shutil.rmtree(self.root)
+
+    def test_load_maps_published_arrays_read_only(self):
+        self.store.publish("model", "1", {"ids": np.arange(3)}, {"n": 3})
+
+        snapshot = self.store.load("model")
+
+        assert snapshot.version == "1"
+        assert snapshot.meta == {"n": 3}
+        assert snapshot.arrays["ids"].tolist() == [0, 1, 2]
+        assert not snapshot.arrays["ids"].flags.writeable
+
+    def test_load_returns_latest_snapshot(self):
+        self.store.publish("model", "1", {"ids": np.arange(3)})
+        self.store.publish("model", "2", {"ids": np.arange(5)})
+
+        assert self.store.load("model").version == "2"
+
+    def test_load_ignores_snapshots_of_other_epochs(self):
+        self.store.publish("model", "1", {"ids": np.arange(3)})
+
+        assert ModelSnapshotStore(self.root, epoch="b").load("model") is None
+
+    def test_publish_keeps_only_newest_snapshots(self):
+        for version in range(4):
+            self.store.publish("model", str(version), {"ids": np.arange(2)})
+
+        snapshots = [
+            entry for entry in os.listdir(os.path.join(self.root, "model"))
+            if not entry.startswith(".") and entry != "CURRENT"
+        ]
+        assert len(snapshots) == 2
+
+    def test_discard_unpublishes_current_snapshot(self):
+        self.store.publish("model", "1", {"ids": np.arange(3)})
+
+        self.store.discard("model")
+
+        assert self.store.load("model") is None
+
+
+class TestSharedModelHolder:
+
+    def setup_method(self):
+        self.root = tempfile.mkdtemp()
+        self.store = ModelSnapshotStore(self.root)
+        self.build = Mock(side_effect=self._build_model)
+        # Holders of two processes sharing the store
+        self.builder = SharedModelHolder(
+            self.store, "collaborative", InteractionModel
+        )
+        self.reader = SharedModelHolder(
+            self.store, "collaborative", InteractionModel
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.root)
+
+    @staticmethod
+    def _build_model() -> InteractionModel:
+        return InteractionModel(
+            like_count=3,
+            user_ids=np.array([1, 2]),
+            movie_ids=np.array([10, 20]),
+            user_movie_matrix=csr_matrix(np.array([[1.0, 1.0], [0.0, 1.0]]))
+        )
+
+    def test_other_holders_attach_without_building(self):
+        self.builder.get(1, self.build)
+        model = self.reader.get(1, self.build)
+
+        assert self.build.call_count == 1
+        assert model.liked_movie_ids(0).tolist() == [10, 20]
+        assert not model.user_movie_matrix.data.flags.writeable
+
+    def test_version_change_publishes_new_snapshot(self):
+        self.builder.get(1, self.build)
+        self.reader.get(2, self.build)
+
+        assert self.build.call_count == 2
+        assert self.store.load("collaborative").version == "2"
+
+    def test_clear_forces_rebuild(self):
+        self.builder.get(1, self.build)
+        self.builder.clear()
+
+        self.reader.get(1, self.build)
+
+        assert self.build.call_count == 2
+
+
+class TestModelSnapshotRoundTrip:
+
+    def setup_method(self):
+        self.root = tempfile.mkdtemp()
+        self.store = ModelSnapshotStore(self.root)
+
+    def teardown_method(self):
+        shutil.rmtree(self.root)
+
+    def _round_trip(self, model):
+        arrays, meta = model.to_snapshot()
+        self.store.publish("model", "1", arrays, meta)
+        snapshot = self.store.load("model")
+        return type(model).from_snapshot(snapshot.arrays, snapshot.meta)
+
+    def test_catalog_model(self):
+        tfidf_matrix = csr_matrix(np.array([[0.5, 0.0], [0.0, 1.0]]))
+        model = CatalogModel.from_columns(
+            movie_ids=[7, 3],
+            genres=['["Drama"]', None],
+            tfidf_matrix=tfidf_matrix
+        )
+
+        restored = self._round_trip(model)
+
+        assert restored.movies == model.movies
+        assert restored.index == {7: 0, 3: 1}
+        assert (restored.tfidf_matrix != tfidf_matrix).nnz == 0
+
+    def test_catalog_model_without_tfidf(self):
+        model = CatalogModel.from_columns([1], [None], tfidf_matrix=None)
+
+        assert self._round_trip(model).tfidf_matrix is None
+
+    def test_interaction_model_without_likes(self):
+        model = InteractionModel(
+            like_count=0,
+            user_ids=np.array([], dtype=np.int64),
+            movie_ids=np.array([], dtype=np.int64),
+            user_movie_matrix=None
+        )
+
+        restored = self._round_trip(model)
+
+        assert restored.user_movie_matrix is None
+        assert restored.user_row(1) is None
@@ -0,0 +1,112 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.external.password_hasher_pool import (
+    PasswordHasherPool
+)
+from src.shared.exceptions.auth_exceptions import (
+    PasswordHashingBusyException
+)
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Thread executor whose jobs wait for `gate` before running."""
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers)
+        self.gate = threading.Event()
+        self.submitted = threading.Semaphore(0)
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted.release()
+        return super().submit(self._gated, fn, *args, **kwargs)
+
+    def _gated(self, fn, *args, **kwargs):
+        self.gate.wait()
+        return fn(*args, **kwargs)
+
+
+class TestPasswordHasherPool:
+
+    def setup_method(self):
+        self.executor = GatedExecutor(1)
+        self.executor.gate.set()
+        self.pool = self._create_pool(max_workers=1, max_queue=1)
+
+    def teardown_method(self):
+        self.executor.gate.set()
+        self.pool.shutdown()
+
+    def _create_pool(self, **options) -> PasswordHasherPool:
+        return PasswordHasherPool(
+            executor_factory=lambda workers: self.executor, **options
+        )
+
+    def _hash_in_background(self, count: int) -> list:
+        """Start `count` hashes and wait until all reached the executor."""
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.pool.hash("secret123"))
+            )
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for _ in range(count):
+            assert self.executor.submitted.acquire(timeout=5)
+        self.threads = threads
+        return results
+
+    def _finish_background(self) -> None:
+        self.executor.gate.set()
+        for thread in self.threads:
+            thread.join()
+
+    def test_hash_and_verify_round_trip(self):
+        hashed = self.pool.hash("secret123")
+
+        assert hashed != "secret123"
+        assert self.pool.verify("secret123", hashed) is True
+        assert self.pool.verify("wrong", hashed) is False
+
+    def test_rejects_when_saturated(self):
+        self.executor.gate.clear()
+        # Occupy the worker and the single queue slot
+        results = self._hash_in_background(2)
+
+        with pytest.raises(PasswordHashingBusyException):
+            self.pool.hash("secret123")
+
+        self._finish_background()
+        assert len(results) == 2
+
+    def test_admission_is_capped_by_max_in_flight(self):
+        self.pool = self._create_pool(
+            max_workers=4, max_queue=32, max_in_flight=2
+        )
+        self.executor.gate.clear()
+        self._hash_in_background(2)
+
+        with pytest.raises(PasswordHashingBusyException):
+            self.pool.verify("secret123", "hash")
+
+        self._finish_background()
+
+    def test_releases_slot_after_failure(self):
+        with pytest.raises(ValueError):
+            self.pool.verify("secret123", "not-a-hash")
+
+        # Both slots are available again
+        self.executor.gate.clear()
+        results = self._hash_in_background(2)
+        self._finish_background()
+        assert len(results) == 2
+
+    def test_inline_mode_does_not_create_executor(self):
+        pool = PasswordHasherPool(max_workers=0, max_queue=0)
+
+        assert pool.verify("secret123", pool.hash("secret123")) is True
+        assert pool._executor is None
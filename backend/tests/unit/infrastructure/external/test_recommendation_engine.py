@@ -0,0 +1,158 @@
+from unittest.mock import Mock, patch
+
+from src.domain.value_objects.recommendation import RecommendationAlgorithm
+from src.infrastructure.external.recommendation_engine import (
+    RecommendationEngine
+)
+from src.infrastructure.external.recommendation_service_impl import (
+    RecommendationServiceImpl
+)
+from src.infrastructure.external.recommendation_strategies.model_holder \
+    import ModelHolder
+from src.infrastructure.external.recommendation_strategies.model_snapshots \
+    import SharedModelHolder
+
+CREATE_STRATEGY_PATH = (
+    "src.infrastructure.external.factories.recommendation_strategy_factory"
+    ".RecommendationStrategyFactory.create_strategy"
+)
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestModelHolder:
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.holder = ModelHolder(max_age=60, clock=self.clock)
+        self.build = Mock(side_effect=lambda: object())
+
+    def test_builds_once_per_version(self):
+        first = self.holder.get(1, self.build)
+        second = self.holder.get(1, self.build)
+
+        assert first is second
+        assert self.build.call_count == 1
+
+    def test_rebuilds_when_version_changes(self):
+        first = self.holder.get(1, self.build)
+        second = self.holder.get(2, self.build)
+
+        assert first is not second
+        assert self.holder.version == 2
+
+    def test_rebuilds_after_max_age(self):
+        self.holder.get(1, self.build)
+        self.clock.now += 61
+
+        self.holder.get(1, self.build)
+
+        assert self.build.call_count == 2
+
+    def test_reports_build_durations(self):
+        on_build = Mock()
+        holder = ModelHolder(clock=self.clock, on_build=on_build)
+
+        holder.get(1, self.build)
+        holder.get(1, self.build)
+
+        on_build.assert_called_once()
+        assert on_build.call_args.args[0] >= 0
+
+
+class TestRecommendationEngine:
+
+    def setup_method(self):
+        self.session = Mock()
+        self.engine = RecommendationEngine(
+            session_factory=lambda: self.session
+        )
+
+    def test_model_holder_is_shared_per_algorithm(self):
+        holder = self.engine.model_holder(
+            RecommendationAlgorithm.COLLABORATIVE
+        )
+
+        assert holder is self.engine.model_holder(
+            RecommendationAlgorithm.COLLABORATIVE
+        )
+        assert holder is not self.engine.model_holder(
+            RecommendationAlgorithm.CONTENT_BASED
+        )
+
+    def test_model_holders_use_snapshot_store_when_configured(self):
+        engine = RecommendationEngine(
+            session_factory=lambda: self.session, snapshot_store=Mock()
+        )
+
+        holder = engine.model_holder(RecommendationAlgorithm.CONTENT_BASED)
+
+        assert isinstance(holder, SharedModelHolder)
+        assert holder.name == "content_based"
+
+    def test_warm_up_runs_every_strategy_and_closes_session(self):
+        strategy = Mock()
+        with patch(CREATE_STRATEGY_PATH, return_value=strategy) as create:
+            durations = self.engine.warm_up()
+
+        assert create.call_count == len(RecommendationAlgorithm)
+        assert strategy.warm_up.call_count == len(RecommendationAlgorithm)
+        assert set(durations) == {a.value for a in RecommendationAlgorithm}
+        self.session.close.assert_called_once()
+
+    def test_background_warm_up_survives_failures(self):
+        strategy = Mock()
+        strategy.warm_up.side_effect = RuntimeError("database down")
+        with patch(CREATE_STRATEGY_PATH, return_value=strategy):
+            self.engine.start_warm_up().join(timeout=5)
+
+        self.session.close.assert_called_once()
+
+
+class TestRecommendationServiceLazyStrategies:
+
+    def setup_method(self):
+        self.service = RecommendationServiceImpl(
+            db_session=Mock(),
+            user_repository=Mock(),
+            engine=RecommendationEngine(session_factory=Mock())
+        )
+
+    def test_describing_algorithms_builds_no_strategy(self):
+        with patch(CREATE_STRATEGY_PATH) as create:
+            algorithms = self.service.get_available_algorithms()
+
+        create.assert_not_called()
+        assert set(algorithms) == {a.value for a in RecommendationAlgorithm}
+        assert algorithms["popularity"]["name"] == "Popularity-Based"
+
+    def test_strategy_is_built_once_on_first_use(self):
+        with patch(CREATE_STRATEGY_PATH, return_value=Mock()) as create:
+            first = self.service.get_strategy(
+                RecommendationAlgorithm.POPULARITY
+            )
+            second = self.service.get_strategy(
+                RecommendationAlgorithm.POPULARITY
+            )
+
+        assert first is second
+        create.assert_called_once_with(RecommendationAlgorithm.POPULARITY)
+
+    def test_registered_strategy_overrides_description(self):
+        strategy = Mock()
+        strategy.get_name.return_value = "Custom"
+        strategy.get_description.return_value = "Custom strategy"
+
+        self.service.register_strategy(
+            RecommendationAlgorithm.POPULARITY, strategy
+        )
+
+        algorithms = self.service.get_available_algorithms()
+        assert algorithms["popularity"]["name"] == "Custom"
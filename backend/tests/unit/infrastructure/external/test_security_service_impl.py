@@ -0,0 +1,118 @@
+import hashlib
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from jose import jwt
+
+from src.infrastructure.cache.memory_cache import InMemoryCacheService
+from src.infrastructure.external.security_service_impl import (
+    SecurityServiceImpl,
+    suggest_bcrypt_rounds
+)
+
+DECODE_PATH = "src.infrastructure.external.security_service_impl.jwt.decode"
+
+
+class TestVerifyTokenCache:
+
+    def setup_method(self):
+        self.token_cache = InMemoryCacheService()
+        self.security_service = SecurityServiceImpl(
+            hasher_pool=Mock(), token_cache=self.token_cache
+        )
+
+    def test_repeat_verification_skips_decode(self):
+        token = self.security_service.create_access_token("42")
+
+        with patch(DECODE_PATH, wraps=jwt.decode) as decode:
+            assert self.security_service.verify_token(token) == "42"
+            assert self.security_service.verify_token(token) == "42"
+
+        decode.assert_called_once()
+        stats = self.token_cache.stats()
+        assert stats.hits == 1
+        assert stats.hit_ratio == 0.5
+
+    def test_cache_key_does_not_contain_token(self):
+        token = self.security_service.create_access_token("42")
+
+        with patch.object(
+            self.token_cache, "set", wraps=self.token_cache.set
+        ) as cache_set:
+            self.security_service.verify_token(token)
+
+        key = cache_set.call_args.args[0]
+        assert token not in key
+        assert key == "tokens:" + hashlib.sha256(token.encode()).hexdigest()
+
+    def test_invalid_token_is_not_cached(self):
+        assert self.security_service.verify_token("not-a-token") is None
+        assert len(self.token_cache) == 0
+
+    def test_expired_token_is_not_cached(self):
+        token = self.security_service.create_access_token(
+            "42", expires_delta=timedelta(seconds=-1)
+        )
+
+        assert self.security_service.verify_token(token) is None
+        assert len(self.token_cache) == 0
+
+    def test_cached_entry_past_expiry_is_verified_again(self):
+        token = self.security_service.create_access_token("42")
+        self.security_service.verify_token(token)
+
+        with patch(
+            "src.infrastructure.external.security_service_impl.time.time",
+            return_value=4102444800,  # 2100-01-01
+        ), patch(DECODE_PATH, side_effect=jwt.ExpiredSignatureError):
+            assert self.security_service.verify_token(token) is None
+
+        assert len(self.token_cache) == 0
+
+    def test_works_without_cache(self):
+        security_service = SecurityServiceImpl(
+            hasher_pool=Mock(), token_cache=None
+        )
+        token = security_service.create_access_token("42")
+
+        assert security_service.verify_token(token) == "42"
+
+
+class TestHashSelfTest:
+
+    def setup_method(self):
+        self.hasher_pool = Mock()
+        self.hasher_pool.bcrypt_rounds = 10
+        self.hasher_pool.hash.return_value = "hashed"
+        self.hasher_pool.verify.return_value = True
+        self.security_service = SecurityServiceImpl(
+            hasher_pool=self.hasher_pool, token_cache=None
+        )
+
+    def test_reports_cost_and_rounds(self):
+        report = self.security_service.self_test(samples=2)
+
+        assert report.rounds == 10
+        assert report.cost_ms >= 0
+        assert self.hasher_pool.hash.call_count == 2
+        self.hasher_pool.verify.assert_called_once_with(
+            "self-test-password", "hashed"
+        )
+
+    def test_fails_when_hash_does_not_verify(self):
+        self.hasher_pool.verify.return_value = False
+
+        with pytest.raises(RuntimeError):
+            self.security_service.self_test(samples=1)
+
+    @pytest.mark.parametrize("rounds,cost_ms,budget_ms,expected", [
+        (12, 250.0, 250.0, 12),
+        (12, 300.0, 250.0, 11),
+        (12, 1100.0, 250.0, 9),
+        (12, 100.0, 250.0, 13),
+        (5, 100.0, 1.0, 4),
+        (30, 1.0, 1000.0, 31),
+    ])
+    def test_suggest_bcrypt_rounds(self, rounds, cost_ms, budget_ms, expected):
+        assert suggest_bcrypt_rounds(rounds, cost_ms, budget_ms) == expected
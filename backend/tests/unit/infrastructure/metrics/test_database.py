@@ -0,0 +1,62 @@
+import threading
+
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.metrics.database import (
+    count_queries,
+    instrument_engine,
+    track_queries
+)
+
+
+class TestQueryTracking:
+
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        instrument_engine(self.engine)
+
+    def teardown_method(self):
+        self.engine.dispose()
+
+    def test_counts_queries_within_block(self):
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with track_queries() as queries:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+        assert queries.count == 2
+        assert queries.seconds >= 0
+
+    def test_instrumenting_twice_counts_once(self):
+        instrument_engine(self.engine)
+
+        with self.engine.connect() as connection:
+            with track_queries() as queries:
+                connection.execute(text("SELECT 1"))
+
+        assert queries.count == 1
+
+    def test_repeated_groups_statements_by_shape(self):
+        with self.engine.connect() as connection:
+            with track_queries() as queries:
+                for size in (1, 2, 3):
+                    values = ", ".join(["?"] * size)
+                    connection.exec_driver_sql(
+                        f"SELECT 1 WHERE 1 IN ({values})", (1,) * size
+                    )
+                connection.execute(text("SELECT 2"))
+
+        assert queries.repeated(3) == [("SELECT 1 WHERE 1 IN (...)", 3)]
+
+    def test_count_queries_sees_statements_from_other_threads(self):
+        def query():
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        with count_queries(self.engine) as queries:
+            thread = threading.Thread(target=query)
+            thread.start()
+            thread.join()
+
+        assert queries.count == 1
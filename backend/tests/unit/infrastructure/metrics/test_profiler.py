@@ -0,0 +1,59 @@
+import threading
+import time
+
+from src.infrastructure.metrics.profiler import SamplingProfiler
+
+
+def busy_loop(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(100))
+
+
+class TestSamplingProfiler:
+
+    def setup_method(self):
+        self.profiler = SamplingProfiler()
+
+    def test_samples_cpu_time_on_main_thread(self):
+        assert self.profiler.start(interval=0.001)
+        busy_loop(0.2)
+        profile = self.profiler.stop()
+
+        assert profile.mode == "cpu"
+        assert profile.samples > 0
+        assert "busy_loop" in profile.collapsed()
+
+    def test_samples_wall_time_from_other_threads(self):
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(self.profiler.start(0.001))
+        )
+        thread.start()
+        thread.join()
+        busy_loop(0.2)
+        profile = self.profiler.stop()
+
+        assert results == [True]
+        assert profile.mode == "wall"
+        assert "busy_loop" in profile.collapsed()
+
+    def test_one_profile_at_a_time(self):
+        assert self.profiler.start()
+        try:
+            assert not self.profiler.start()
+        finally:
+            self.profiler.stop()
+
+        assert self.profiler.start()
+        self.profiler.stop()
+
+    def test_collapsed_lines_end_with_counts(self):
+        self.profiler.start(interval=0.001)
+        busy_loop(0.1)
+        profile = self.profiler.stop()
+
+        for line in profile.collapsed().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert stack.startswith("MainThread;")
+            assert int(count) > 0
@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from src.infrastructure.metrics.registry import MetricsRegistry
+
+
+def sample(registry: MetricsRegistry, line_prefix: str) -> float:
+    for line in registry.render().splitlines():
+        if line.startswith(line_prefix + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{line_prefix} not rendered")
+
+
+class TestMetricsRegistry:
+
+    def setup_method(self):
+        self.registry = MetricsRegistry()
+        self.requests = self.registry.counter(
+            "requests_total", "Requests", ("route",)
+        )
+        self.in_flight = self.registry.gauge("in_flight", "In flight")
+        self.latency = self.registry.histogram(
+            "latency_seconds", "Latency", buckets=(0.1, 1.0)
+        )
+
+    def test_renders_counters_and_gauges(self):
+        self.requests.labels("/movies").inc()
+        self.requests.labels(route="/movies").inc(2)
+        self.in_flight.inc()
+        self.in_flight.inc()
+        self.in_flight.dec()
+
+        output = self.registry.render()
+
+        assert "# TYPE requests_total counter" in output
+        assert 'requests_total{route="/movies"} 3' in output
+        assert "in_flight 1" in output
+
+    def test_renders_cumulative_histogram_buckets(self):
+        for value in (0.05, 0.5, 5.0):
+            self.latency.observe(value)
+
+        output = self.registry.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{le="1"} 2' in output
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in output
+        assert "latency_seconds_sum 5.55" in output
+        assert "latency_seconds_count 3" in output
+
+    def test_unused_histogram_series_are_not_rendered(self):
+        self.latency.labels()
+
+        assert "latency_seconds_count" not in self.registry.render()
+
+    def test_escapes_label_values(self):
+        self.requests.labels('say "hi"\n').inc()
+
+        assert 'route="say \\"hi\\"\\n"' in self.registry.render()
+
+    def test_rejects_wrong_labels(self):
+        with pytest.raises(ValueError):
+            self.requests.labels("a", "b")
+
+    def test_collectors_run_on_render(self):
+        self.registry.add_collector(lambda: self.in_flight.set(7))
+
+        assert sample(self.registry, "in_flight") == 7
+
+    def test_share_keeps_existing_values(self):
+        self.requests.labels("/movies").inc(5)
+
+        self.registry.share(processes=4, slots=256)
+
+        assert self.registry.shared
+        assert sample(self.registry, 'requests_total{route="/movies"}') == 5
+
+    def test_values_from_forked_workers_are_summed(self):
+        series = self.requests.labels("/movies")
+        self.registry.share(processes=4, slots=256)
+        series.inc()
+
+        for _ in range(2):
+            pid = os.fork()
+            if pid == 0:
+                series.inc(10)
+                self.latency.observe(0.5)
+                os._exit(0)
+            os.waitpid(pid, 0)
+
+        assert sample(self.registry, 'requests_total{route="/movies"}') == 21
+        assert sample(self.registry, "latency_seconds_count") == 2
+
+    def test_gauges_of_exited_workers_are_dropped(self):
+        self.registry.share(processes=4, slots=256)
+
+        pid = os.fork()
+        if pid == 0:
+            self.in_flight.inc(3)
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        assert sample(self.registry, "in_flight") == 0
+
+    def test_shards_of_exited_workers_are_reused(self):
+        series = self.requests.labels("/movies")
+        # One shard for this process and one for its children
+        self.registry.share(processes=2, slots=256)
+
+        for amount in (10, 5):
+            pid = os.fork()
+            if pid == 0:
+                series.inc(amount)
+                os._exit(0)
+            os.waitpid(pid, 0)
+
+        assert sample(self.registry, 'requests_total{route="/movies"}') == 15
@@ -0,0 +1,135 @@
+import io
+import json
+import threading
+
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.metrics.database import (
+    instrument_engine,
+    redact_parameters,
+    redact_statement
+)
+from src.infrastructure.metrics.slow_log import (
+    SlowLog,
+    slow_log,
+    tag_request,
+    track_request_tags
+)
+
+
+def read_entries(stream: io.StringIO):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class BlockingStream(io.StringIO):
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, data: str) -> int:
+        self.writing.set()
+        self.release.wait(timeout=5)
+        return super().write(data)
+
+
+class TestSlowLog:
+
+    def setup_method(self):
+        self.stream = io.StringIO()
+        self.log = SlowLog(max_pending=2)
+
+    def teardown_method(self):
+        self.log.close()
+
+    def test_writes_entries_as_json_lines(self):
+        self.log.start(stream=self.stream)
+
+        self.log.write("slow_request", route="/movies", duration_ms=1200.0)
+        self.log.close()
+
+        [entry] = read_entries(self.stream)
+        assert entry["event"] == "slow_request"
+        assert entry["route"] == "/movies"
+        assert "timestamp" in entry
+
+    def test_ignores_writes_when_not_started(self):
+        self.log.write("slow_request")
+
+        assert self.log.dropped == 0
+        assert self.stream.getvalue() == ""
+
+    def test_drops_entries_when_queue_is_full(self):
+        stream = BlockingStream()
+        self.log.start(stream=stream)
+        self.log.write("slow_request")
+        # The writer is now held on the stream, so entries pile up
+        stream.writing.wait(timeout=5)
+
+        for _ in range(3):
+            self.log.write("slow_request")
+        stream.release.set()
+
+        assert self.log.dropped == 1
+
+
+class TestRequestTags:
+
+    def test_collects_tags_within_block(self):
+        with track_request_tags() as tags:
+            tag_request(user_id=1)
+            tag_request(algorithm="collaborative")
+
+        assert tags == {"user_id": 1, "algorithm": "collaborative"}
+
+    def test_tags_outside_block_are_ignored(self):
+        tag_request(user_id=1)
+
+
+class TestSlowQueries:
+
+    def setup_method(self):
+        self.stream = io.StringIO()
+        self.engine = create_engine("sqlite://")
+        instrument_engine(self.engine)
+        slow_log.start(stream=self.stream, query_threshold=0.0)
+
+    def teardown_method(self):
+        slow_log.close()
+        self.engine.dispose()
+
+    def test_logs_redacted_statements(self):
+        with self.engine.connect() as connection:
+            connection.execute(
+                text("SELECT 'secret' WHERE 1 = :value"), {"value": 42}
+            )
+        slow_log.close()
+
+        [entry] = read_entries(self.stream)
+        assert entry["event"] == "slow_query"
+        assert entry["statement"] == "SELECT ? WHERE ? = ?"
+        assert entry["parameters"] == ["int"]
+        assert "secret" not in self.stream.getvalue()
+
+
+class TestRedaction:
+
+    def test_redacts_literals_but_not_identifiers(self):
+        statement = (
+            "SELECT movies_1.id FROM movies AS movies_1 "
+            "WHERE movies_1.title = 'It''s' AND movies_1.vote > 7.5 "
+            "AND movies_1.id IN (?, ?) LIMIT 10"
+        )
+
+        assert redact_statement(statement) == (
+            "SELECT movies_1.id FROM movies AS movies_1 "
+            "WHERE movies_1.title = ? AND movies_1.vote > ? "
+            "AND movies_1.id IN (...) LIMIT ?"
+        )
+
+    def test_keeps_only_parameter_types(self):
+        assert redact_parameters({"email": "a@b.c", "id": 1}) == {
+            "email": "str", "id": "int"
+        }
+        assert redact_parameters(("a@b.c", None)) == ["str", "NoneType"]
@@ -0,0 +1,42 @@
+from src.infrastructure.metrics.spans import (
+    current_timings,
+    span,
+    time_stages
+)
+
+
+class TestStageTimings:
+
+    def test_records_stages_in_order(self):
+        with time_stages() as timings:
+            with span("fetch"):
+                pass
+            with span("rank"):
+                pass
+
+        assert list(timings.stages) == ["fetch", "rank"]
+        assert all(seconds >= 0 for seconds in timings.stages.values())
+
+    def test_repeated_stage_accumulates(self):
+        with time_stages() as timings:
+            timings.record("hydrate", 0.001)
+            timings.record("hydrate", 0.002)
+
+        assert timings.stages == {"hydrate": 0.003}
+        assert timings.server_timing() == "hydrate;dur=3.00"
+
+    def test_span_outside_time_stages_records_nothing(self):
+        with span("fetch"):
+            pass
+
+        assert current_timings() is None
+
+    def test_records_stage_of_failed_block(self):
+        with time_stages() as timings:
+            try:
+                with span("fetch"):
+                    raise ValueError
+            except ValueError:
+                pass
+
+        assert "fetch" in timings.stages
@@ -0,0 +1,66 @@
+from unittest.mock import Mock, patch
+
+from src.infrastructure.server.prefork import (
+    PreforkServer,
+    processes_per_worker
+)
+
+
+class TestProcessesPerWorker:
+
+    def test_splits_cpus_between_workers(self):
+        assert processes_per_worker(workers=4, cpus=8) == 2
+
+    def test_gives_each_worker_at_least_one_process(self):
+        assert processes_per_worker(workers=8, cpus=4) == 1
+
+
+class TestPreforkServerReload:
+
+    def setup_method(self):
+        # Freezing the test process's objects would outlive the test
+        self.gc_patcher = patch("src.infrastructure.server.prefork.gc")
+        self.gc_patcher.start()
+        self.preload = Mock()
+        self.server = PreforkServer(
+            load_app=Mock(), workers=2, preload=self.preload
+        )
+        self.server._workers = {101: 11, 102: 12}
+        self.spawned = iter([201, 202])
+        self.server._spawn_worker = Mock(
+            side_effect=lambda: next(self.spawned)
+        )
+        self.server._wait_ready = Mock(return_value=True)
+        self.server._retire_worker = Mock()
+
+    def teardown_method(self):
+        self.gc_patcher.stop()
+
+    def test_reload_replaces_each_worker_after_its_successor_is_ready(self):
+        self.server._reload()
+
+        self.preload.assert_called_once()
+        assert [
+            call.args[0]
+            for call in self.server._wait_ready.call_args_list
+        ] == [201, 202]
+        assert [
+            call.args[0]
+            for call in self.server._retire_worker.call_args_list
+        ] == [101, 102]
+
+    def test_reload_keeps_old_worker_when_successor_fails(self):
+        self.server._wait_ready.return_value = False
+
+        self.server._reload()
+
+        self.server._retire_worker.assert_called_once_with(201)
+        self.server._spawn_worker.assert_called_once()
+
+    def test_reload_keeps_workers_when_preload_fails(self):
+        self.preload.side_effect = RuntimeError("database unavailable")
+
+        self.server._reload()
+
+        self.server._spawn_worker.assert_not_called()
+        self.server._retire_worker.assert_not_called()
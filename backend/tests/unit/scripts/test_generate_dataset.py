@@ -0,0 +1,57 @@
+import json
+from collections import Counter
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from scripts.generate_dataset import generate_dataset, write_database
+
+
+class TestGenerateDataset:
+
+    def setup_method(self):
+        self.dataset = generate_dataset(
+            users=200, movies=300, likes_per_user=15, seed=3,
+            hashed_password="hashed"
+        )
+
+    def test_same_seed_generates_same_dataset(self):
+        again = generate_dataset(
+            users=200, movies=300, likes_per_user=15, seed=3,
+            hashed_password="hashed"
+        )
+        assert again == self.dataset
+
+    def test_movies_are_unique_and_have_genres(self):
+        titles = [movie["title"] for movie in self.dataset.movies]
+        assert len(set(titles)) == len(titles)
+        assert all(
+            1 <= len(json.loads(movie["genres"])) <= 3
+            for movie in self.dataset.movies
+        )
+
+    def test_likes_are_unique_and_concentrated_on_few_movies(self):
+        likes = self.dataset.likes
+        assert len(set(likes)) == len(likes)
+
+        per_movie = sorted(
+            Counter(movie for _, movie in likes).values(), reverse=True
+        )
+        top_tenth = sum(per_movie[:len(self.dataset.movies) // 10])
+        assert top_tenth > 0.3 * len(likes)
+
+    def test_write_database_inserts_rows_with_sequential_ids(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+
+        write_database(engine, self.dataset, batch_size=100)
+
+        with engine.connect() as conn:
+            counts = [
+                conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+                for table in ("users", "movies", "likes")
+            ]
+            max_movie_id = conn.execute(
+                text("SELECT MAX(movie_id) FROM likes")
+            ).scalar()
+        assert counts == [200, 300, len(self.dataset.likes)]
+        assert max_movie_id <= 300